@@ -1,8 +1,12 @@
 import logging
 logger = logging.getLogger("accounts.crons")
 from accounts.management.compute_proposer_levels import compute_proposer_levels
+from recommendations.crons import compute_calc_recommendations_job
 
 def compute_levels_job():
     logger.info("compute_levels_job: 시작")
     res = compute_proposer_levels()
-    logger.info(f"compute_levels_job: 완료 - users={len(res)}, updated={sum(res.values())}")
\ No newline at end of file
+    logger.info(f"compute_levels_job: 완료 - users={len(res)}, updated={sum(res.values())}")
+
+    # 레벨이 바뀌었으므로 계산식 추천 순위도 다시 계산
+    compute_calc_recommendations_job()
@@ -428,9 +428,9 @@ class AccountsLocationHistoryRoot(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # 3) 좌표 → 법정동 주소 변환
+        # 3) 좌표 → 법정동 주소 변환 (근처에서 확인한 좌표들로 먼저 답하고, 애매하면 네이버 조회)
         svc = ReverseGeocodingService()
-        legal = svc.get_position_to_legal(
+        legal = svc.get_position_to_legal_nearby(
             {"latitude": v["latitude"], "longitude": v["longitude"]}
         )
         # legal 예: {"sido": ..., "sigungu": ..., "eupmyundong": ...}
@@ -17,6 +17,60 @@ DEBUG = env('DEBUG')
 
 NCLOUD_CLIENT_ID = env('NCLOUD_CLIENT_ID')
 NCLOUD_CLIENT_SECRET = env('NCLOUD_CLIENT_SECRET')
+# 네이버 지도 API 공유 세션: 연결 풀 크기 / 연결·응답 제한 시간(초) / 연결 실패·5xx 재시도 횟수와 백오프(초)
+NAVER_MAPS_POOL_SIZE = env.int('NAVER_MAPS_POOL_SIZE', default=10)
+NAVER_MAPS_CONNECT_TIMEOUT = env.float('NAVER_MAPS_CONNECT_TIMEOUT', default=1.0)
+NAVER_MAPS_READ_TIMEOUT = env.float('NAVER_MAPS_READ_TIMEOUT', default=3.0)
+NAVER_MAPS_RETRIES = env.int('NAVER_MAPS_RETRIES', default=2)
+NAVER_MAPS_RETRY_BACKOFF = env.float('NAVER_MAPS_RETRY_BACKOFF', default=0.2)
+# 네이버 (역)지오코딩 응답 캐시 기간 (결과 있음 / 결과 없음)
+GEOCODING_CACHE_TIMEOUT = env.int('GEOCODING_CACHE_TIMEOUT', default=30*24*60*60)
+GEOCODING_NEGATIVE_CACHE_TIMEOUT = env.int('GEOCODING_NEGATIVE_CACHE_TIMEOUT', default=24*60*60)
+# 지도 API 호출/캐시 적중 통계를 프로세스 메모리에 모았다가 캐시에 반영하는 주기(초)
+GEOCODING_STATS_FLUSH_SECONDS = env.int('GEOCODING_STATS_FLUSH_SECONDS', default=10)
+# 여러 주소를 한 번에 지오코딩할 때 동시에 보내는 요청 수 / 한 번의 일괄 조회 제한 시간(초)
+GEOCODING_MAX_WORKERS = env.int('GEOCODING_MAX_WORKERS', default=8)
+GEOCODING_BATCH_TIMEOUT = env.float('GEOCODING_BATCH_TIMEOUT', default=3.0)
+# 위치기록 역지오코딩: 이미 확인한 근처 좌표(KD-tree)로 답할지 여부
+#   가장 가까운 점까지 최대 거리(m) / 법정동이 모두 같아야 하는 이웃 반경(m)과 이웃 수(최대, 최소) / 재구성 주기(초)
+REVERSE_GEOCODING_INDEX_ENABLED = env.bool('REVERSE_GEOCODING_INDEX_ENABLED', default=True)
+REVERSE_GEOCODING_MAX_DISTANCE = env.float('REVERSE_GEOCODING_MAX_DISTANCE', default=50.0)
+REVERSE_GEOCODING_AGREEMENT_DISTANCE = env.float('REVERSE_GEOCODING_AGREEMENT_DISTANCE', default=200.0)
+REVERSE_GEOCODING_NEIGHBORS = env.int('REVERSE_GEOCODING_NEIGHBORS', default=5)
+REVERSE_GEOCODING_MIN_NEIGHBORS = env.int('REVERSE_GEOCODING_MIN_NEIGHBORS', default=2)
+REVERSE_GEOCODING_REBUILD_SECONDS = env.int('REVERSE_GEOCODING_REBUILD_SECONDS', default=10*60)
+# 확인한 좌표(ResolvedPoint) 보관 기간(일), 지나면 prune_resolved_points_job이 지우고 다음 조회 때 네이버로 다시 확인
+REVERSE_GEOCODING_RETENTION_DAYS = env.int('REVERSE_GEOCODING_RETENTION_DAYS', default=90)
+
+# FastText 모델 모드: 'full'(cc.ko.300) | 'reduced'(cc.ko.{FASTTEXT_REDUCED_DIM}, build_fasttext_model로 생성)
+FASTTEXT_MODEL_MODE = env('FASTTEXT_MODEL_MODE', default='full')
+FASTTEXT_REDUCED_DIM = env.int('FASTTEXT_REDUCED_DIM', default=100)
+# FastText 백엔드: 'fasttext'(워커마다 .bin 로드) | 'mmap'(export_word_vectors로 내보낸 .npy를 워커끼리 공유)
+FASTTEXT_BACKEND = env('FASTTEXT_BACKEND', default='fasttext')
+# 추천 엔진: 'fasttext'(FastText 벡터) | 'tfidf'(명사 TF-IDF 희소 행렬, build_tfidf_index로 생성, 수십 MB)
+RECOMMENDATION_ENGINE = env('RECOMMENDATION_ENGINE', default='fasttext')
+# Kiwi 일괄 토큰화 작업 스레드 수 (-1이면 CPU 코어 수만큼)
+KIWI_NUM_WORKERS = env.int('KIWI_NUM_WORKERS', default=-1)
+# True면 WSGI 애플리케이션 생성 직후 Kiwi를 미리 불러옴 (EMBEDDING_INGESTION_ENABLED면 FastText도, False면 첫 사용 시 로드)
+AI_MODELS_WARM_UP = env.bool('AI_MODELS_WARM_UP', default=False)
+# 불러오기에 실패한 AI 모델을 다시 시도하기까지 기다리는 시간(초)
+AI_MODEL_RETRY_SECONDS = env.int('AI_MODEL_RETRY_SECONDS', default=60*5)
+# True면 제안글 생성 직후 이 프로세스의 백그라운드 스레드에서 임베딩을 계산 (FastText를 불러오므로 웹 워커에서는 끔)
+# False면 backfill_embeddings_job 크론이 별도 프로세스에서 10분마다 계산하고 창업자 매칭 알림을 보냄
+EMBEDDING_INGESTION_ENABLED = env.bool('EMBEDDING_INGESTION_ENABLED', default=False)
+# 임베딩 백필 실행이 겹치지 않도록 잡는 잠금의 만료 시간(초), chunk를 저장할 때마다 연장 (프로세스가 죽으면 이 시간 뒤 풀림)
+EMBEDDING_BACKFILL_LOCK_TIMEOUT = env.int('EMBEDDING_BACKFILL_LOCK_TIMEOUT', default=30*60)
+# True면 스크랩 기반 추천에 업종별 IVF 근사 최근접 이웃 인덱스 사용 (False면 후보 전체 정확 비교)
+RECOMMENDATION_ANN_ENABLED = env.bool('RECOMMENDATION_ANN_ENABLED', default=False)
+RECOMMENDATION_ANN_N_PROBE = env.int('RECOMMENDATION_ANN_N_PROBE', default=8)
+RECOMMENDATION_ANN_REBUILD_SECONDS = env.int('RECOMMENDATION_ANN_REBUILD_SECONDS', default=60*60)
+# 벡터 추천 후보(업종별 제안글 임베딩 행렬)를 프로세스에서 다시 불러오는 주기(초) (backfill_embeddings_job 주기와 맞춤)
+RECOMMENDATION_CANDIDATE_REBUILD_SECONDS = env.int('RECOMMENDATION_CANDIDATE_REBUILD_SECONDS', default=60*10)
+# 새 제안글과 취향 벡터가 비슷한 창업자에게 알림 (업종이 맞는 창업자 중 유사도 MIN_SCORE 이상 상위 TOP_N명)
+RECOMMENDATION_MATCH_ENABLED = env.bool('RECOMMENDATION_MATCH_ENABLED', default=True)
+RECOMMENDATION_MATCH_TOP_N = env.int('RECOMMENDATION_MATCH_TOP_N', default=50)
+RECOMMENDATION_MATCH_MIN_SCORE = env.float('RECOMMENDATION_MATCH_MIN_SCORE', default=0.6)
+RECOMMENDATION_MATCH_REBUILD_SECONDS = env.int('RECOMMENDATION_MATCH_REBUILD_SECONDS', default=60*60)
 
 
 # Application definition
@@ -177,6 +231,13 @@ SIMPLE_JWT = {
 CRONJOBS = [
     ('0 0 * * *',  'fundings.crons.settle_fundings_job'),  # 매일 자정(00:00)
     ('0 0 * * 1',  'accounts.crons.compute_levels_job'),    # 매주 월요일 자정(00:00)
+    ('*/10 * * * *', 'recommendations.crons.backfill_embeddings_job'),  # 10분마다
+    ('30 0 * * 0,2-6', 'recommendations.crons.compute_calc_recommendations_job'),  # 매일 00:30 (월요일은 compute_levels_job 직후 실행)
+    ('0 1 * * *',  'recommendations.crons.build_tfidf_index_job'),  # 매일 01:00 (RECOMMENDATION_ENGINE='tfidf'일 때만)
+    ('30 1 * * *', 'recommendations.crons.compute_proposal_neighbors_job'),  # 매일 01:30
+    ('0 2 * * *',  'recommendations.crons.compute_proposal_cooccurrence_job'),  # 매일 02:00
+    ('30 2 * * *', 'recommendations.crons.rebuild_founder_tastes_job'),  # 매일 02:30
+    ('0 3 * * *',  'maps.crons.prune_resolved_points_job'),  # 매일 03:00
 ]
 
 CRONJOBS_TIMEZONE = 'Asia/Seoul'
@@ -275,4 +336,6 @@ LOGGING["loggers"].update({
     "accounts.tasks":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
     "fundings.crons":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
     "fundings.tasks":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
+    "recommendations.crons":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
+    "maps.crons":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
 })
@@ -1,7 +1,17 @@
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
 
 application = get_wsgi_application()
+
+# 웹 서버 프로세스에서만 AI 모델을 미리 불러옵니다. (gunicorn --preload 시 워커가 fork 전에 공유)
+# 웹 요청에서 쓰는 모델만 불러오고, FastText는 이 프로세스에서 임베딩을 계산할 때만 함께 불러옵니다.
+if settings.AI_MODELS_WARM_UP:
+    from recommendations.loaders import ENGINE_MODELS, ai_models, get_recommendation_engine
+    names = ENGINE_MODELS[get_recommendation_engine()]
+    if settings.EMBEDDING_INGESTION_ENABLED:
+        names = (*names, 'fasttext')
+    ai_models.warm_up(*names)
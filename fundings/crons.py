@@ -2,11 +2,14 @@ from __future__ import annotations
 import logging
 logger = logging.getLogger("fundings.crons")
 from fundings.management.settle_fundings import settle_fundings
+from recommendations.loaders import get_recommendation_engine
+from recommendations.management.compute_funding_success_centroids import compute_funding_success_centroids
 
 def settle_fundings_job() -> None:
     """
     - 마감된(IN_PROGRESS) 펀딩을 SUCCEEDED/FAILED로 정산하고
       성공 시 구매 리워드를 발급합니다.
+    - 정산 후 업종별 펀딩 성공 중심 벡터를 다시 계산합니다. (FastText 엔진일 때만)
     """
     logger.info("settle_fundings_job: 시작")
     result = settle_fundings(verbose=False)
@@ -14,4 +17,13 @@ def settle_fundings_job() -> None:
         "settle_fundings_job: 완료 - "
         f"updated={result.updated}, succeeded={result.succeeded}, "
         f"failed={result.failed}, skipped={result.skipped}"
-    )
\ No newline at end of file
+    )
+
+    # TF-IDF 엔진은 FastText 임베딩이 없으므로 중심 벡터를 계산하지 않음
+    if get_recommendation_engine() != "fasttext":
+        return
+    try:
+        industries = compute_funding_success_centroids()
+        logger.info(f"settle_fundings_job: 펀딩 성공 중심 계산 완료 - industries={industries}")
+    except Exception:
+        logger.exception("settle_fundings_job: 펀딩 성공 중심 계산 실패")
@@ -176,7 +176,7 @@ class FundingMapView(APIView):
 
             return Response(list(groups.values()), status=200)
 
-        # 중심좌표(지오코딩)
+        # 중심좌표(지역 사전, 없으면 지오코딩)
         try:
             geocoder = GeocodingService(request)  # 시그니처가 request를 받는 경우
         except TypeError:
@@ -212,33 +212,35 @@ class FundingMapView(APIView):
         
 
         result = []
+        regions = []
         for idx, row in enumerate(grouped, start=1):
             addr_text = row["address"]
 
             if zoom == ZoomChoices.M10000:
-                full_addr = addr_text
+                region = (addr_text,)
                 is_addr = _match(viewer_addr, sido=addr_text)
             elif zoom == ZoomChoices.M2000:
-                full_addr = f"{sido} {addr_text}"
+                region = (sido, addr_text)
                 is_addr = _match(viewer_addr, sido=sido, sigungu=addr_text)
             else:
-                full_addr = f"{sido} {sigungu} {addr_text}"
+                region = (sido, sigungu, addr_text)
                 is_addr = _match(viewer_addr, sido=sido, sigungu=sigungu, eup=addr_text)
 
-            # position 반환
-            try:
-                pos = geocoder.get_address_to_position(query_address=full_addr)
-            except Exception:
-                pos = {}
+            regions.append(region)
 
             result.append({
                 "id": idx,
                 "address": addr_text,
-                "position": {"latitude": pos.get("latitude"), "longitude": pos.get("longitude")},
+                "position": {"latitude": None, "longitude": None},
                 "number": row["number"],
                 "is_address": is_addr,
 
             })
+
+        # position 반환 (중복 제거 후 동시에 조회, 제한 시간 안에 못 찾은 지역은 None 좌표)
+        for item, pos in zip(result, geocoder.get_regions_position(regions)):
+            if pos:
+                item["position"] = {"latitude": pos.get("latitude"), "longitude": pos.get("longitude")}
         return Response(result, status=status.HTTP_200_OK)
 
     
@@ -1,3 +1,5 @@
 from django.contrib import admin
+from .models import Region, ResolvedPoint
 
-# Register your models here.
+admin.site.register(Region)
+admin.site.register(ResolvedPoint)
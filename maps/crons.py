@@ -0,0 +1,12 @@
+from __future__ import annotations
+import logging
+logger = logging.getLogger("maps.crons")
+from maps.management.prune_resolved_points import prune_resolved_points
+
+def prune_resolved_points_job() -> None:
+    """
+    - 보관 기간(REVERSE_GEOCODING_RETENTION_DAYS)이 지난 역지오코딩 확인 좌표를 지웁니다.
+    """
+    logger.info("prune_resolved_points_job: 시작")
+    deleted = prune_resolved_points()
+    logger.info(f"prune_resolved_points_job: 완료 - deleted={deleted}")
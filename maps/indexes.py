@@ -0,0 +1,153 @@
+import logging
+import threading
+import time
+import numpy as np
+from django.conf import settings
+from scipy.spatial import cKDTree
+from .types import PositionType, AddressType
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS = 6_371_000  # m
+
+def project(latitudes, longitudes) -> np.ndarray:
+    '''
+    위도/경도를 미터 단위 평면 좌표로 근사합니다. (점마다 자기 위도로 경도 간격을 보정하는 등거리 원통 투영)
+    수백 m 안의 이웃 거리 비교에는 충분히 정확합니다.
+    '''
+    latitudes = np.radians(np.asarray(latitudes, dtype=np.float64))
+    longitudes = np.radians(np.asarray(longitudes, dtype=np.float64))
+    return np.column_stack([EARTH_RADIUS * longitudes * np.cos(latitudes), EARTH_RADIUS * latitudes])
+
+class ResolvedPointIndex:
+    '''
+    네이버 역지오코딩으로 확인한 좌표들의 KD-tree (프로세스마다 하나)
+      - 좌표에서 가장 가까운 점이 `REVERSE_GEOCODING_MAX_DISTANCE`m 안에 있고,
+        `REVERSE_GEOCODING_AGREEMENT_DISTANCE`m 안의 가까운 점 최대 `REVERSE_GEOCODING_NEIGHBORS`개
+        (최소 `REVERSE_GEOCODING_MIN_NEIGHBORS`개)의 법정동이 모두 같으면 그 법정동으로 답합니다.
+      - 그렇지 않은(경계 근처이거나 처음 보는) 좌표만 네이버로 조회하고 `record`로 추가하므로,
+        법정동 경계 근처일수록 점이 촘촘해집니다.
+      - `REVERSE_GEOCODING_REBUILD_SECONDS`가 지나면 다음 조회에서 `ResolvedPoint` 테이블로 다시 만들고,
+        그 사이 이 프로세스에서 추가한 점은 별도 목록에서 함께 비교합니다.
+      - 재구성은 잠금 밖에서 한 스레드만 하고, 그동안 다른 요청은 이전 인덱스로 답합니다.
+        다 만들면 재구성 중에 추가된 점을 반영한 뒤 한 번에 바꿉니다.
+    한계: 이웃 점들이 모두 경계 한쪽에만 있으면 경계 건너편 좌표도 그 법정동으로 답할 수 있습니다.
+      (가장 가까운 점이 `REVERSE_GEOCODING_MAX_DISTANCE`m 안에 있어야 하므로 경계에서 그 거리 안의 좌표에 한함)
+      이 결과는 위치기록(`LocationHistory`)을 거쳐 제안자 레벨 계산에 쓰이므로, 경계 근처 오분류가 문제가 되면
+      `REVERSE_GEOCODING_MAX_DISTANCE`를 줄이거나 `REVERSE_GEOCODING_INDEX_ENABLED=False`로 끕니다.
+    '''
+    def __init__(self):
+        self._tree: cKDTree|None = None
+        self._addresses: list[tuple] = list()
+        self._positions: set[tuple[float, float]] = set()
+        self._pending_points: list[np.ndarray] = list()
+        self._pending_addresses: list[tuple] = list()
+        self._recorded_while_building: list[tuple[float, float, tuple]]|None = None
+        self._built_at = None
+        self._build_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._built_at is not None and time.monotonic() - self._built_at <= settings.REVERSE_GEOCODING_REBUILD_SECONDS
+
+    def _rebuild(self):
+        '''
+        `ResolvedPoint` 테이블로 KD-tree를 다시 만들어 바꿉니다.
+        처음 만들 때가 아니면 다른 스레드가 재구성 중일 때 기다리지 않고 돌아갑니다.
+        '''
+        from .models import ResolvedPoint
+
+        if not self._build_lock.acquire(blocking=self._built_at is None):
+            return
+        try:
+            with self._lock:
+                if self._is_fresh():
+                    return
+                self._recorded_while_building = list()
+            started = time.perf_counter()
+            built_at = time.monotonic()
+            try:
+                rows = list(ResolvedPoint.objects.values_list('latitude', 'longitude', 'sido', 'sigungu', 'eupmyundong'))
+                tree = cKDTree(project([row[0] for row in rows], [row[1] for row in rows])) if rows else None
+                addresses = [tuple(name or None for name in row[2:]) for row in rows]
+            finally:
+                with self._lock:
+                    recorded, self._recorded_while_building = self._recorded_while_building, None
+            # 재구성 중에 추가된 점 중 테이블에서 읽지 못한 것만 별도 목록에 남김
+            positions = {(row[0], row[1]) for row in rows}
+            recorded = [(latitude, longitude, names) for latitude, longitude, names in recorded if (latitude, longitude) not in positions]
+            with self._lock:
+                self._tree, self._addresses = tree, addresses
+                self._positions = positions | {(latitude, longitude) for latitude, longitude, _ in recorded}
+                self._pending_points = [project([latitude], [longitude])[0] for latitude, longitude, _ in recorded]
+                self._pending_addresses = [names for _, _, names in recorded]
+                self._built_at = built_at
+            logger.info('resolved point index built: points=%s (%.2fs)', len(rows), time.perf_counter() - started)
+        finally:
+            self._build_lock.release()
+
+    def _neighbors(self, point:np.ndarray, k:int, radius:float) -> list[tuple[float, tuple]]:
+        neighbors = list()
+        if self._tree is not None:
+            distances, indices = self._tree.query(point, k=min(k, self._tree.n), distance_upper_bound=radius)
+            for distance, i in zip(np.atleast_1d(distances), np.atleast_1d(indices)):
+                if np.isfinite(distance):
+                    neighbors.append((float(distance), self._addresses[i]))
+        if self._pending_points:
+            distances = np.linalg.norm(np.asarray(self._pending_points) - point, axis=1)
+            for i in np.flatnonzero(distances <= radius):
+                neighbors.append((float(distances[i]), self._pending_addresses[i]))
+        neighbors.sort(key=lambda neighbor: neighbor[0])
+        return neighbors[:k]
+
+    def lookup(self, position:PositionType) -> AddressType.LegalType|None:
+        '''
+        Returns:
+            address (AddressType.LegalType|None): 이웃 점들이 합의한 법정동 주소 (애매하면 None)
+        '''
+        point = project([float(position['latitude'])], [float(position['longitude'])])[0]
+        if not self._is_fresh():
+            self._rebuild()
+        with self._lock:
+            neighbors = self._neighbors(point, settings.REVERSE_GEOCODING_NEIGHBORS, settings.REVERSE_GEOCODING_AGREEMENT_DISTANCE)
+        if len(neighbors) < settings.REVERSE_GEOCODING_MIN_NEIGHBORS:
+            return None
+        if neighbors[0][0] > settings.REVERSE_GEOCODING_MAX_DISTANCE:
+            return None
+        if len({address for _, address in neighbors}) != 1:
+            return None
+        sido, sigungu, eupmyundong = neighbors[0][1]
+        return {
+            'sido': sido,
+            'sigungu': sigungu,
+            'eupmyundong': eupmyundong,
+        }
+
+    def record(self, position:PositionType, address:AddressType.LegalType):
+        '''
+        네이버로 확인한 좌표를 `ResolvedPoint`에 저장하고 이 프로세스의 인덱스에 바로 추가합니다.
+        (소수점 4자리(약 10m)로 반올림한 좌표가 이미 있으면 저장하지 않으므로, 한 칸에는 점이 하나만 쌓임)
+        '''
+        from .models import ResolvedPoint
+
+        latitude, longitude = round(float(position['latitude']), 4), round(float(position['longitude']), 4)
+        names = (address.get('sido'), address.get('sigungu'), address.get('eupmyundong'))
+        ResolvedPoint.objects.bulk_create(
+            [ResolvedPoint(latitude=latitude, longitude=longitude, sido=names[0] or '', sigungu=names[1] or '', eupmyundong=names[2] or '')],
+            ignore_conflicts=True,
+        )
+        with self._lock:
+            # 이미 인덱스에 있는 칸은 이웃 수가 부풀지 않도록 다시 넣지 않음
+            if (latitude, longitude) in self._positions:
+                return
+            self._positions.add((latitude, longitude))
+            if self._recorded_while_building is not None:
+                self._recorded_while_building.append((latitude, longitude, names))
+            self._pending_points.append(project([latitude], [longitude])[0])
+            self._pending_addresses.append(names)
+
+    def clear(self):
+        with self._lock:
+            self._built_at = None
+
+resolved_point_index = ResolvedPointIndex()
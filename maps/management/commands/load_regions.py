@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from maps.management.load_regions import load_regions
+
+class Command(BaseCommand):
+    help = '지역(시도/시군구/읍면동) 대표 좌표 CSV를 Region 테이블에 불러옵니다. 지도 클러스터 중심좌표에 사용합니다. (기본 파일은 마이그레이션으로 자동으로 불러오므로 갱신할 때만 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', help='CSV 파일 경로 (기본값: maps/data/regions.csv)')
+
+    def handle(self, *args, **options):
+        total = load_regions(path=options['path'])
+        self.stdout.write(f'saved: {total}')
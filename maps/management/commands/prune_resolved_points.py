@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from maps.management.prune_resolved_points import prune_resolved_points
+
+class Command(BaseCommand):
+    help = '보관 기간이 지난 역지오코딩 확인 좌표(ResolvedPoint)를 지웁니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help='보관 기간(일) (기본값: REVERSE_GEOCODING_RETENTION_DAYS)')
+
+    def handle(self, *args, **options):
+        total = prune_resolved_points(days=options['days'])
+        self.stdout.write(f'deleted: {total}')
@@ -0,0 +1,54 @@
+from __future__ import annotations
+import csv
+import logging
+import os
+from django.conf import settings
+from django.db import transaction
+from maps.models import Region
+from maps.services import region_gazetteer
+
+logger = logging.getLogger(__name__)
+
+def get_regions_path() -> str:
+    """
+    저장소에 포함된 지역 대표 좌표 파일 경로를 반환합니다.
+    전국 시도/시군구/읍면동 법정동 코드(리 단위 제외)와 대표 좌표를 담고 있으며, `0003_load_regions` 마이그레이션으로 자동으로 불러옵니다.
+      - 법정동 코드: 행정표준코드관리시스템 법정동 코드 (강원/전북 특별자치도, 군위군 대구 편입 코드 반영)
+      - 좌표: korean-geocoding(MIT) 패키지의 지역 좌표, 없는 지역은 하위 지역 평균이나 상위 시군구 좌표로 채움
+    """
+    return os.path.join(settings.BASE_DIR, "maps", "data", "regions.csv")
+
+def load_regions(path: str | None = None, batch_size: int = 1000) -> int:
+    """
+    지역 대표 좌표 CSV를 Region 테이블에 불러옵니다. (기존 행은 모두 교체)
+    CSV 헤더는 `code,sido,sigungu,eupmyundong,latitude,longitude`이고,
+    시도 단위 행은 sigungu/eupmyundong을, 시군구 단위 행은 eupmyundong을 비워 둡니다.
+
+    Args:
+        path: CSV 파일 경로 (기본값: `maps/data/regions.csv`)
+        batch_size: 한 번에 저장할 행 수
+
+    Returns:
+        저장한 지역 수
+    """
+    path = path or get_regions_path()
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        regions = [
+            Region(
+                code=row["code"].strip(),
+                sido=row["sido"].strip(),
+                sigungu=(row.get("sigungu") or "").strip(),
+                eupmyundong=(row.get("eupmyundong") or "").strip(),
+                latitude=float(row["latitude"]),
+                longitude=float(row["longitude"]),
+            )
+            for row in csv.DictReader(f)
+        ]
+
+    with transaction.atomic():
+        Region.objects.all().delete()
+        Region.objects.bulk_create(regions, batch_size=batch_size)
+    region_gazetteer.clear()
+
+    logger.info("[load_regions] path=%s, saved=%s", path, len(regions))
+    return len(regions)
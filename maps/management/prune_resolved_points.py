@@ -0,0 +1,27 @@
+from __future__ import annotations
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from maps.indexes import resolved_point_index
+from maps.models import ResolvedPoint
+
+logger = logging.getLogger("maps.crons")
+
+def prune_resolved_points(days: int | None = None) -> int:
+    """
+    `days`일보다 오래된 확인 좌표(`ResolvedPoint`)를 지웁니다.
+      - 법정동 경계 변경이 오래된 점에 남지 않고, 테이블과 KD-tree가 계속 커지지 않도록 합니다.
+      - 지운 자리는 다음 위치기록 때 네이버로 다시 확인해 채웁니다.
+
+    Args:
+        days: 보관 기간 (기본값: REVERSE_GEOCODING_RETENTION_DAYS)
+
+    Returns:
+        지운 좌표 수
+    """
+    days = days if days is not None else settings.REVERSE_GEOCODING_RETENTION_DAYS
+    deleted, _ = ResolvedPoint.objects.filter(created_at__lt=timezone.now() - timedelta(days=days)).delete()
+    resolved_point_index.clear()
+    logger.info("[prune_resolved_points] days=%s, deleted=%s", days, deleted)
+    return deleted
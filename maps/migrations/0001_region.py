@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-17 01:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Region',
+            fields=[
+                ('code', models.CharField(help_text='법정동 코드 10자리', max_length=10, primary_key=True, serialize=False)),
+                ('sido', models.CharField(max_length=20)),
+                ('sigungu', models.CharField(blank=True, default='', help_text='시도 단위 지역이면 빈 값', max_length=20)),
+                ('eupmyundong', models.CharField(blank=True, default='', help_text='시도/시군구 단위 지역이면 빈 값', max_length=20)),
+                ('latitude', models.FloatField(help_text='지역 대표 좌표의 위도')),
+                ('longitude', models.FloatField(help_text='지역 대표 좌표의 경도')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('sido', 'sigungu', 'eupmyundong'), name='unique_region_address')],
+            },
+        ),
+    ]
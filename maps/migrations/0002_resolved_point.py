@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-17 01:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maps', '0001_region'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResolvedPoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('latitude', models.FloatField(help_text='네이버 역지오코딩으로 확인한 좌표의 위도 (소수점 5자리)')),
+                ('longitude', models.FloatField(help_text='네이버 역지오코딩으로 확인한 좌표의 경도 (소수점 5자리)')),
+                ('sido', models.CharField(blank=True, default='', max_length=20)),
+                ('sigungu', models.CharField(blank=True, default='', max_length=20)),
+                ('eupmyundong', models.CharField(blank=True, default='', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('latitude', 'longitude'), name='unique_resolved_point_position')],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+import csv
+import os
+from django.conf import settings
+from django.db import migrations
+
+
+def load_regions(apps, schema_editor):
+    '''
+    저장소에 포함된 `maps/data/regions.csv`를 Region 테이블에 불러옵니다. (기존 행은 모두 교체)
+    '''
+    Region = apps.get_model('maps', 'Region')
+    Region.objects.all().delete()
+    path = os.path.join(settings.BASE_DIR, 'maps', 'data', 'regions.csv')
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        Region.objects.bulk_create(
+            [
+                Region(
+                    code=row['code'],
+                    sido=row['sido'],
+                    sigungu=row['sigungu'],
+                    eupmyundong=row['eupmyundong'],
+                    latitude=float(row['latitude']),
+                    longitude=float(row['longitude']),
+                )
+                for row in csv.DictReader(f)
+            ],
+            batch_size=1000,
+        )
+
+
+def unload_regions(apps, schema_editor):
+    apps.get_model('maps', 'Region').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maps', '0002_resolved_point'),
+    ]
+
+    operations = [
+        migrations.RunPython(load_regions, unload_regions),
+    ]
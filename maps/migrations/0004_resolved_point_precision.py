@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-17 01:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maps', '0003_load_regions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resolvedpoint',
+            name='latitude',
+            field=models.FloatField(help_text='네이버 역지오코딩으로 확인한 좌표의 위도 (소수점 4자리)'),
+        ),
+        migrations.AlterField(
+            model_name='resolvedpoint',
+            name='longitude',
+            field=models.FloatField(help_text='네이버 역지오코딩으로 확인한 좌표의 경도 (소수점 4자리)'),
+        ),
+    ]
@@ -1,3 +1,77 @@
 from django.db import models
 
-# Create your models here.
+class Region(models.Model):
+    code = models.CharField(
+        max_length=10,
+        primary_key=True,
+        help_text='법정동 코드 10자리',
+    )
+    sido = models.CharField(
+        max_length=20,
+    )
+    sigungu = models.CharField(
+        max_length=20,
+        blank=True,
+        default='',
+        help_text='시도 단위 지역이면 빈 값',
+    )
+    eupmyundong = models.CharField(
+        max_length=20,
+        blank=True,
+        default='',
+        help_text='시도/시군구 단위 지역이면 빈 값',
+    )
+    latitude = models.FloatField(
+        help_text='지역 대표 좌표의 위도',
+    )
+    longitude = models.FloatField(
+        help_text='지역 대표 좌표의 경도',
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['sido', 'sigungu', 'eupmyundong'],
+                name='unique_region_address',
+            ),
+        ]
+
+    def __str__(self):
+        return ' '.join(filter(None, [self.sido, self.sigungu, self.eupmyundong]))
+
+class ResolvedPoint(models.Model):
+    latitude = models.FloatField(
+        help_text='네이버 역지오코딩으로 확인한 좌표의 위도 (소수점 4자리)',
+    )
+    longitude = models.FloatField(
+        help_text='네이버 역지오코딩으로 확인한 좌표의 경도 (소수점 4자리)',
+    )
+    sido = models.CharField(
+        max_length=20,
+        blank=True,
+        default='',
+    )
+    sigungu = models.CharField(
+        max_length=20,
+        blank=True,
+        default='',
+    )
+    eupmyundong = models.CharField(
+        max_length=20,
+        blank=True,
+        default='',
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['latitude', 'longitude'],
+                name='unique_resolved_point_position',
+            ),
+        ]
+
+    def __str__(self):
+        return f"({self.latitude}, {self.longitude}) {' '.join(filter(None, [self.sido, self.sigungu, self.eupmyundong]))}"
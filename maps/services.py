@@ -1,9 +1,326 @@
-from typing import Literal
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Iterable, Literal, Sequence
 import requests
 from django.conf import settings
-from rest_framework.exceptions import NotFound
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from requests.adapters import HTTPAdapter
+from rest_framework.exceptions import NotFound, APIException
+from urllib3.util.retry import Retry
+from utils.constants import CacheKey
 from .types import PositionType, AddressType, NaverGeocodingAPIType, NaverReverseGeocodingAPIType
 
+logger = logging.getLogger(__name__)
+
+def _incr_counter(key:str, delta:int=1):
+    '''
+    만료 없는 캐시 카운터를 `delta`만큼 올립니다. (없으면 만듦)
+    '''
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+def _incr_counters(counts:dict[str, int]):
+    '''
+    여러 캐시 카운터를 한 번에 올립니다. (Redis 캐시면 파이프라인 한 번, 아니면 키마다 `_incr_counter`)
+    '''
+    try:
+        connection = get_redis_connection('default')
+    except NotImplementedError:
+        for key, delta in counts.items():
+            _incr_counter(key, delta)
+        return
+    pipeline = connection.pipeline(transaction=False)
+    for key, delta in counts.items():
+        pipeline.incrby(cache.make_key(key), delta)
+    pipeline.execute()
+
+class CounterBuffer:
+    '''
+    캐시 카운터 증가분을 프로세스 메모리에 모았다가 `GEOCODING_STATS_FLUSH_SECONDS`마다 한 번에 캐시에 반영합니다.
+      - 주기가 지난 뒤 처음 기록하는 요청만 캐시를 한 번 호출하고, 나머지 요청은 캐시를 호출하지 않습니다.
+      - 반영에 실패하면 그 구간의 증가분은 버리고 경고만 남깁니다. (캐시 장애가 지도 API 호출을 막지 않도록)
+      - 다른 프로세스의 증가분은 최대 한 주기 늦게 보이고, 프로세스가 끝나면 아직 반영하지 않은 증가분은 사라집니다.
+    '''
+    def __init__(self):
+        self._counts: defaultdict[str, int] = defaultdict(int)
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _swap(self) -> dict[str, int]:
+        counts, self._counts = self._counts, defaultdict(int)
+        self._flushed_at = time.monotonic()
+        return counts
+
+    def add(self, key:str, delta:int=1):
+        with self._lock:
+            self._counts[key] += delta
+            if time.monotonic() - self._flushed_at < settings.GEOCODING_STATS_FLUSH_SECONDS:
+                return
+            counts = self._swap()
+        self._write(counts)
+
+    def flush(self):
+        '''
+        모아 둔 증가분을 바로 반영합니다. (통계를 조회하기 전에 호출)
+        '''
+        with self._lock:
+            counts = self._swap()
+        self._write(counts)
+
+    def _write(self, counts:dict[str, int]):
+        if not counts:
+            return
+        try:
+            _incr_counters(counts)
+        except Exception:
+            logger.warning('지도 API 통계 카운터 반영 실패 (%s개 키)', len(counts), exc_info=True)
+
+stats_counters = CounterBuffer()
+
+class NaverMapsClient:
+    '''
+    네이버 지도 API 호출용 공유 HTTP 세션 (프로세스당 하나)
+      - 연결 풀(`NAVER_MAPS_POOL_SIZE`)과 keep-alive로 TLS 연결을 재사용합니다.
+      - 연결/응답 제한 시간(`NAVER_MAPS_CONNECT_TIMEOUT`, `NAVER_MAPS_READ_TIMEOUT`)을 넘기면 `APIException`이 발생합니다.
+      - 연결 실패와 5xx 응답은 `NAVER_MAPS_RETRIES`번까지 지수 백오프로 다시 시도합니다.
+        (응답 지연은 다시 시도하지 않아, 한 번의 호출이 워커를 붙잡는 시간은 제한 시간을 크게 넘지 않습니다.)
+      - 엔드포인트별 호출 수, 오류 수, 누적 지연(ms), 지연 구간별 횟수를 캐시 카운터로 셉니다. (`stats_counters`로 모아서 반영)
+    '''
+    BASE_URL = 'https://maps.apigw.ntruss.com'
+    ENDPOINTS = {
+        'geocode': '/map-geocode/v2/geocode',
+        'reverse': '/map-reversegeocode/v2/gc',
+    }
+    LATENCY_BUCKETS = (100, 300, 1000, 3000)  # ms
+    STATS = ('count', 'error', 'latency_ms')
+
+    def __init__(self):
+        self._session: requests.Session|None = None
+        self._pid: int|None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        # fork된 워커가 부모 프로세스의 연결을 함께 쓰지 않도록 프로세스마다 새로 만듦
+        if self._session is None or self._pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._pid != os.getpid():
+                    self._session = self._build_session()
+                    self._pid = os.getpid()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=settings.NAVER_MAPS_RETRIES,
+            connect=settings.NAVER_MAPS_RETRIES,
+            read=0,
+            status=settings.NAVER_MAPS_RETRIES,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({'GET'}),
+            backoff_factor=settings.NAVER_MAPS_RETRY_BACKOFF,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.NAVER_MAPS_POOL_SIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.headers.update({
+            'x-ncp-apigw-api-key-id': settings.NCLOUD_CLIENT_ID,
+            'x-ncp-apigw-api-key': settings.NCLOUD_CLIENT_SECRET,
+            'Accept': 'application/json',
+        })
+        return session
+
+    def _stat_key(self, endpoint:str, stat:str) -> str:
+        return CacheKey.NAVER_MAPS_STATS.format(endpoint=endpoint, stat=stat)
+
+    def _record(self, endpoint:str, started:float, error:bool):
+        latency_ms = int((time.perf_counter() - started) * 1000)
+        bucket = next((f'le_{bound}' for bound in self.LATENCY_BUCKETS if latency_ms <= bound), f'gt_{self.LATENCY_BUCKETS[-1]}')
+        stats_counters.add(self._stat_key(endpoint, 'count'))
+        stats_counters.add(self._stat_key(endpoint, 'latency_ms'), latency_ms)
+        stats_counters.add(self._stat_key(endpoint, bucket))
+        if error:
+            stats_counters.add(self._stat_key(endpoint, 'error'))
+        logger.debug('네이버 지도 API %s: %sms (error=%s)', endpoint, latency_ms, error)
+
+    def get(self, endpoint:str, params:dict) -> requests.Response:
+        '''
+        Args:
+            endpoint (str): `ENDPOINTS`의 키 (`'geocode'`, `'reverse'`)
+            params (dict): 쿼리 파라미터
+        Returns:
+            response (requests.Response): 다시 시도한 뒤의 마지막 응답 (5xx일 수 있음)
+        '''
+        started = time.perf_counter()
+        try:
+            response = self.session.get(
+                url=self.BASE_URL + self.ENDPOINTS[endpoint],
+                params=params,
+                timeout=(settings.NAVER_MAPS_CONNECT_TIMEOUT, settings.NAVER_MAPS_READ_TIMEOUT),
+            )
+        except requests.RequestException as e:
+            self._record(endpoint, started, error=True)
+            logger.warning('네이버 지도 API %s 호출 실패: %s', endpoint, e)
+            raise APIException('지도 서버가 응답하지 않아요. 잠시 후 다시 시도하세요.') from e
+        self._record(endpoint, started, error=response.status_code != 200)
+        return response
+
+    def stats(self) -> dict:
+        '''
+        Returns:
+            stats (dict): {endpoint: {'count', 'error', 'latency_ms', 'avg_latency_ms', 'latency_buckets': {구간: 횟수}}}
+        '''
+        buckets = [f'le_{bound}' for bound in self.LATENCY_BUCKETS] + [f'gt_{self.LATENCY_BUCKETS[-1]}']
+        stats_counters.flush()
+        values = cache.get_many([
+            self._stat_key(endpoint, stat)
+            for endpoint in self.ENDPOINTS
+            for stat in (*self.STATS, *buckets)
+        ])
+        stats = dict()
+        for endpoint in self.ENDPOINTS:
+            endpoint_stats = {stat: int(values.get(self._stat_key(endpoint, stat)) or 0) for stat in self.STATS}
+            endpoint_stats['avg_latency_ms'] = endpoint_stats['latency_ms'] / endpoint_stats['count'] if endpoint_stats['count'] else None
+            endpoint_stats['latency_buckets'] = {bucket: int(values.get(self._stat_key(endpoint, bucket)) or 0) for bucket in buckets}
+            stats[endpoint] = endpoint_stats
+        return stats
+
+naver_maps_client = NaverMapsClient()
+
+class GeocodingCache:
+    '''
+    네이버 (역)지오코딩 응답 캐시 (Redis, 모든 워커가 공유)
+      - 키는 정규화한 요청 파라미터의 해시입니다. (주소는 유니코드 NFC + 공백 정리, 좌표는 소수점 6자리)
+      - 결과가 있는 응답은 `GEOCODING_CACHE_TIMEOUT`, 결과가 없는 응답은 `GEOCODING_NEGATIVE_CACHE_TIMEOUT` 동안 캐싱합니다.
+      - 오류 응답(HTTP 200이 아님)은 캐싱하지 않습니다.
+      - 캐시 장애 시에는 캐시 없이 네이버 API를 바로 호출합니다.
+      - 적중(hit)/결과 없음 적중(negative_hit)/실패(miss) 횟수를 캐시 카운터로 셉니다. (`stats_counters`로 모아서 반영)
+    '''
+    STATS = ('hit', 'negative_hit', 'miss')
+
+    @staticmethod
+    def normalize_text(text:str|None) -> str|None:
+        if text is None:
+            return None
+        return ' '.join(unicodedata.normalize('NFC', str(text)).split())
+
+    @staticmethod
+    def normalize_coords(coords:str) -> str:
+        try:
+            return ','.join(f'{float(value):.6f}' for value in coords.split(','))
+        except ValueError:
+            return coords.strip()
+
+    def _key(self, kind:str, params:dict) -> str:
+        digest = hashlib.sha1(json.dumps(params, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+        return CacheKey.GEOCODING.format(kind=kind, digest=digest)
+
+    def _count(self, kind:str, stat:str):
+        stats_counters.add(CacheKey.GEOCODING_STATS.format(kind=kind, stat=stat))
+
+    def get(self, kind:str, params:dict) -> dict|None:
+        '''
+        Returns:
+            response (dict|None): 캐싱된 응답 (없거나 캐시를 읽지 못하면 None)
+        '''
+        try:
+            entry = cache.get(self._key(kind, params))
+        except Exception:
+            logger.warning('지오코딩 캐시 조회 실패', exc_info=True)
+            entry = None
+        if entry is None:
+            self._count(kind, 'miss')
+            return None
+        self._count(kind, 'negative_hit' if entry['empty'] else 'hit')
+        return entry['response']
+
+    def set(self, kind:str, params:dict, response:dict, empty:bool):
+        try:
+            cache.set(
+                self._key(kind, params),
+                {'response': response, 'empty': empty},
+                timeout=settings.GEOCODING_NEGATIVE_CACHE_TIMEOUT if empty else settings.GEOCODING_CACHE_TIMEOUT,
+            )
+        except Exception:
+            logger.warning('지오코딩 캐시 저장 실패', exc_info=True)
+
+    def stats(self) -> dict:
+        '''
+        Returns:
+            stats (dict): {kind: {'hit', 'negative_hit', 'miss', 'hit_rate'}}
+        '''
+        keys = {
+            CacheKey.GEOCODING_STATS.format(kind=kind, stat=stat): (kind, stat)
+            for kind in ('geocode', 'reverse')
+            for stat in self.STATS
+        }
+        stats_counters.flush()
+        values = cache.get_many(list(keys))
+        stats = {kind: {stat: 0 for stat in self.STATS} for kind in ('geocode', 'reverse')}
+        for key, (kind, stat) in keys.items():
+            stats[kind][stat] = int(values.get(key) or 0)
+        for kind_stats in stats.values():
+            requests_count = sum(kind_stats.values())
+            kind_stats['hit_rate'] = (kind_stats['hit'] + kind_stats['negative_hit']) / requests_count if requests_count else None
+        return stats
+
+geocoding_cache = GeocodingCache()
+
+class RegionGazetteer:
+    '''
+    시도/시군구/읍면동 이름 → 대표 좌표 사전 (프로세스 메모리)
+      - `Region` 테이블을 처음 조회할 때 한 번만 불러오고, 이후에는 DB나 네이버 API 없이 사전에서 찾습니다.
+      - `load_regions` 명령으로 테이블을 다시 채우면 그 프로세스의 사전은 비워지고, 다른 프로세스는 재시작 후 반영됩니다.
+    '''
+    def __init__(self):
+        self._positions: dict[tuple[str, str, str], PositionType]|None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(sido:str, sigungu:str|None=None, eupmyundong:str|None=None) -> tuple[str, str, str]:
+        return tuple(GeocodingCache.normalize_text(name) or '' for name in (sido, sigungu, eupmyundong))
+
+    def _load(self) -> dict[tuple[str, str, str], PositionType]:
+        from .models import Region
+
+        with self._lock:
+            if self._positions is None:
+                self._positions = {
+                    self._key(sido, sigungu, eupmyundong): {'latitude': latitude, 'longitude': longitude}
+                    for sido, sigungu, eupmyundong, latitude, longitude in Region.objects.values_list(
+                        'sido', 'sigungu', 'eupmyundong', 'latitude', 'longitude',
+                    )
+                }
+        return self._positions
+
+    def get(self, sido:str, sigungu:str|None=None, eupmyundong:str|None=None) -> PositionType|None:
+        '''
+        Returns:
+            position (PositionType|None): 지역 대표 좌표 (사전에 없으면 None)
+        '''
+        positions = self._positions if self._positions is not None else self._load()
+        return positions.get(self._key(sido, sigungu, eupmyundong))
+
+    def clear(self):
+        with self._lock:
+            self._positions = None
+
+region_gazetteer = RegionGazetteer()
+
+# 일괄 지오코딩용 공유 스레드 풀 (프로세스 전체의 동시 요청 수를 `GEOCODING_MAX_WORKERS`로 제한)
+geocoding_executor = ThreadPoolExecutor(max_workers=settings.GEOCODING_MAX_WORKERS, thread_name_prefix='geocoding')
+
 class GeocodingService:
     def get_geocoding(
             self,
@@ -31,23 +348,23 @@ class GeocodingService:
         Returns:
             response (NaverGeocodingAPIType.ResponseType)
         '''
-        response = requests.get(
-            url='https://maps.apigw.ntruss.com/map-geocode/v2/geocode',
-            params={
-                'query': query,
-                'coordinate': coordinate,
-                'filter': filter,
-                'language': language,
-                'page': page,
-                'count': count,
-            },
-            headers={
-                'x-ncp-apigw-api-key-id': settings.NCLOUD_CLIENT_ID,
-                'x-ncp-apigw-api-key': settings.NCLOUD_CLIENT_SECRET,
-                'Accept': 'application/json'
-            }
-        )
-        return response.json()
+        params = {
+            'query': geocoding_cache.normalize_text(query),
+            'coordinate': coordinate,
+            'filter': filter,
+            'language': language,
+            'page': page,
+            'count': count,
+        }
+        cached = geocoding_cache.get('geocode', params)
+        if cached is not None:
+            return cached
+
+        response = naver_maps_client.get('geocode', params)
+        data = response.json()
+        if response.status_code == 200:
+            geocoding_cache.set('geocode', params, data, empty=not data.get('addresses'))
+        return data
 
     def get_address_to_position(self, query_address:str) -> PositionType:
         '''
@@ -72,6 +389,84 @@ class GeocodingService:
             'longitude': float(first_address['x'])
         }
 
+    def get_region_position(self, sido:str, sigungu:str|None=None, eupmyundong:str|None=None) -> PositionType:
+        '''
+        지역 이름을 대표 좌표로 변환합니다. (지도 클러스터 중심좌표)
+        지역 사전(`Region`)에서 먼저 찾고, 없으면 주소를 지오코딩합니다.
+        Args:
+            sido (str): 시도
+            sigungu (str|None): 시군구
+            eupmyundong (str|None): 읍면동
+        Returns:
+            position (PositionType): 좌표
+        '''
+        position = region_gazetteer.get(sido, sigungu, eupmyundong)
+        if position is not None:
+            return dict(position)
+        return self.get_address_to_position(' '.join(filter(None, [sido, sigungu, eupmyundong])))
+
+    def _find_address_to_position(self, query_address:str) -> PositionType|None:
+        try:
+            return self.get_address_to_position(query_address)
+        except NotFound:
+            return None
+        except Exception:
+            logger.warning('지오코딩 실패: %s', query_address, exc_info=True)
+            return None
+
+    def get_addresses_to_position(self, query_addresses:Iterable[str], timeout:float|None=None) -> dict[str, PositionType|None]:
+        '''
+        여러 주소를 한 번에 좌표로 변환합니다.
+          - 같은 주소(정규화 기준)는 한 번만 조회하고, 공유 스레드 풀에서 동시에 조회합니다.
+          - 제한 시간 안에 끝나지 않았거나 찾지 못한 주소는 None입니다. (나머지 결과는 그대로 반환)
+          - 제한 시간이 지나도 이미 보낸 요청은 끝까지 실행되어 응답이 캐시에 남습니다.
+        Args:
+            query_addresses (Iterable[str]): 주소 목록
+            timeout (float|None): 제한 시간(초) (기본값: `settings.GEOCODING_BATCH_TIMEOUT`)
+        Returns:
+            positions (dict[str, PositionType|None]): {주소: 좌표}
+        '''
+        timeout = settings.GEOCODING_BATCH_TIMEOUT if timeout is None else timeout
+        queries = {address: geocoding_cache.normalize_text(address) for address in query_addresses}
+        futures = {
+            query: geocoding_executor.submit(self._find_address_to_position, query)
+            for query in set(queries.values())
+        }
+        done, not_done = wait(futures.values(), timeout=timeout)
+        if not_done:
+            # 아직 시작하지 않은 조회는 취소
+            for future in not_done:
+                future.cancel()
+            logger.warning('지오코딩 제한 시간 초과: %s/%s건 미완료', len(not_done), len(futures))
+        positions = {
+            query: future.result() if future in done else None
+            for query, future in futures.items()
+        }
+        return {address: positions[query] for address, query in queries.items()}
+
+    def get_regions_position(self, regions:Sequence[tuple[str, ...]], timeout:float|None=None) -> list[PositionType|None]:
+        '''
+        여러 지역의 대표 좌표를 한 번에 구합니다. (지도 클러스터 중심좌표)
+        지역 사전에 없는 지역만 `get_addresses_to_position`으로 동시에 지오코딩합니다.
+        Args:
+            regions (Sequence[tuple[str, ...]]): `(시도,)`, `(시도, 시군구)` 또는 `(시도, 시군구, 읍면동)` 목록
+            timeout (float|None): 지오코딩 제한 시간(초)
+        Returns:
+            positions (list[PositionType|None]): `regions`와 같은 순서의 좌표 (찾지 못하면 None)
+        '''
+        positions = list()
+        missing = dict()
+        for i, region in enumerate(regions):
+            position = region_gazetteer.get(*region)
+            positions.append(dict(position) if position is not None else None)
+            if position is None:
+                missing[i] = ' '.join(filter(None, region))
+        if missing:
+            found = self.get_addresses_to_position(missing.values(), timeout)
+            for i, address in missing.items():
+                positions[i] = found[address]
+        return positions
+
     def get_address_to_legal(self, query_address:str) -> list[dict]:
         '''
         일부 주소로 법정동 주소와 좌표를 검색합니다.
@@ -204,21 +599,23 @@ class ReverseGeocodingService:
         Returns:
             response (NaverReverseGeocodingAPIType.ResponseType)
         '''
-        response = requests.get(
-            url='https://maps.apigw.ntruss.com/map-reversegeocode/v2/gc',
-            params={
-                'coords': coords,
-                'sourcecrs': sourcecrs,
-                'targetcrs': targetcrs,
-                'orders': ','.join(orders),
-                'output': 'json'
-            },
-            headers={
-                'x-ncp-apigw-api-key-id': settings.NCLOUD_CLIENT_ID,
-                'x-ncp-apigw-api-key': settings.NCLOUD_CLIENT_SECRET,
-            }
-        )
-        return response.json()
+        params = {
+            'coords': coords,
+            'sourcecrs': sourcecrs,
+            'targetcrs': targetcrs,
+            'orders': ','.join(orders),
+            'output': 'json'
+        }
+        cache_params = {**params, 'coords': geocoding_cache.normalize_coords(coords)}
+        cached = geocoding_cache.get('reverse', cache_params)
+        if cached is not None:
+            return cached
+
+        response = naver_maps_client.get('reverse', params)
+        data = response.json()
+        if response.status_code == 200:
+            geocoding_cache.set('reverse', cache_params, data, empty=not data.get('results'))
+        return data
 
     def get_position_to_legal(self, query_position:PositionType) -> AddressType.LegalType:
         '''
@@ -247,6 +644,28 @@ class ReverseGeocodingService:
             'eupmyundong': eupmyundong,
         }
 
+    def get_position_to_legal_nearby(self, query_position:PositionType) -> AddressType.LegalType:
+        '''
+        좌표(위도,경도)를 법정동 주소로 변환합니다. (같은 곳에서 반복해서 보내는 위치기록용)
+        이미 확인한 근처 좌표들의 법정동이 일치하면 네이버를 호출하지 않고 답하고,
+        애매한 좌표만 `get_position_to_legal`로 조회해 인덱스에 추가합니다.
+        (경계 근처에서 이웃과 다른 법정동인 좌표를 잘못 답할 수 있는 한계는 `ResolvedPointIndex` 참고)
+        Args:
+            query_position (PositionType): 좌표
+        Returns:
+            address (AddressType.LegalType): 법정동 주소
+        '''
+        from .indexes import resolved_point_index
+
+        if not settings.REVERSE_GEOCODING_INDEX_ENABLED:
+            return self.get_position_to_legal(query_position)
+        address = resolved_point_index.lookup(query_position)
+        if address is not None:
+            return address
+        address = self.get_position_to_legal(query_position)
+        resolved_point_index.record(query_position, address)
+        return address
+
     def get_position_to_full(self, query_position:PositionType, filter_address:str|None=None) -> AddressType.FullType:
         '''
         좌표(위도,경도)를 전체 주소로 변환합니다.
@@ -9,4 +9,6 @@ urlpatterns = [
     path('geocoding/full', GeocodingFull.as_view()),
     path('reverse-geocoding/legal', ReverseGeocodingLegal.as_view()),
     path('reverse-geocoding/full', ReverseGeocodingFull.as_view()),
+    path('geocoding/cache', GeocodingCacheStats.as_view()),
+    path('geocoding/upstream', NaverMapsUpstreamStats.as_view()),
 ]
\ No newline at end of file
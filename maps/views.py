@@ -2,9 +2,10 @@ from django.http import HttpRequest
 from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.views import APIView
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from utils.decorators.view import require_query_params
-from .services import GeocodingService, ReverseGeocodingService
+from .services import GeocodingService, ReverseGeocodingService, geocoding_cache, naver_maps_client
 
 class GeocodingPosition(APIView):
     @method_decorator(require_query_params('query'))
@@ -85,3 +86,21 @@ class ReverseGeocodingFull(APIView):
             full,
             status=status.HTTP_200_OK,
         )
+
+class GeocodingCacheStats(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request:HttpRequest, format=None):
+        return Response(
+            geocoding_cache.stats(),
+            status=status.HTTP_200_OK,
+        )
+
+class NaverMapsUpstreamStats(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request:HttpRequest, format=None):
+        return Response(
+            naver_maps_client.stats(),
+            status=status.HTTP_200_OK,
+        )
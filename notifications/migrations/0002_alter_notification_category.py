@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='foundernotification',
+            name='category',
+            field=models.CharField(choices=[('FUNDING', '펀딩'), ('REWARD', '리워드'), ('PROPOSAL', '제안')], max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='proposernotification',
+            name='category',
+            field=models.CharField(choices=[('FUNDING', '펀딩'), ('REWARD', '리워드'), ('PROPOSAL', '제안')], max_length=8),
+        ),
+    ]
@@ -9,7 +9,7 @@ class Notification(models.Model):
         auto_now_add=True,
     )
     category = models.CharField(
-        max_length=7,
+        max_length=8,
         choices=NotificationCategoryChoices.choices,
     )
     path_variable = models.CharField(
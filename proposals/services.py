@@ -3,7 +3,9 @@ from django.http import HttpRequest
 from rest_framework.exceptions import PermissionDenied
 from utils.choices import ProfileChoices, IndustryChoices
 from utils.decorators.service import require_profile
+from django.db import transaction
 from django.db.models import Count
+from recommendations.tasks import background_tasks
 from .models import Proposal, ProposerLikeProposal, ProposerScrapProposal, FounderScrapProposal
 from .serializers import ProposalListSerializer
 
@@ -104,15 +106,19 @@ class FounderScrapProposalService:
         if proposal.user.user == self.request.user:
             raise PermissionDenied('자신의 제안을 스크랩할 수 없어요.')
 
+        founder = self.request.user.founder
         obj, created = FounderScrapProposal.objects.get_or_create(
-            user=self.request.user.founder,
+            user=founder,
             proposal=proposal,
         )
-        if created:
-            return True
-        else:
+        if not created:
             obj.delete()
-            return False
+
+        # 커밋 후 백그라운드에서 창업자 취향 벡터 갱신 및 추천 재계산
+        transaction.on_commit(lambda: background_tasks.enqueue_taste_update(
+            founder.id, proposal.id, 1 if created else -1,
+        ))
+        return created
 
     @require_profile(ProfileChoices.founder)
     def get(self, sido:str|None=None, sigungu:str|None=None, eupmyundong:str|None=None):
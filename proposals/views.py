@@ -162,7 +162,7 @@ class ProposalsZoom(APIView):
         else:  # ZoomChoices.M500
             grouped = svc.cluster_counts_eupmyundong(sido, sigungu, industry)
 
-        # 중심좌표(지오코딩) + is_address 가공은 뷰에서
+        # 중심좌표(지역 사전, 없으면 지오코딩) + is_address 가공은 뷰에서
         try:
             geocoder = GeocodingService(request)
         except TypeError:
@@ -184,32 +184,34 @@ class ProposalsZoom(APIView):
             return False
 
         result = []
+        regions = []
         for idx, row in enumerate(grouped, start=1):
             addr_text = row["address"]
 
             if zoom == ZoomChoices.M10000:
-                full_addr = addr_text
+                region = (addr_text,)
                 is_address = _match(viewer_addr, sido=addr_text)
             elif zoom == ZoomChoices.M2000:
-                full_addr = f"{sido} {addr_text}"
+                region = (sido, addr_text)
                 is_address = _match(viewer_addr, sido=sido, sigungu=addr_text)
             else:  # M500
-                full_addr = f"{sido} {sigungu} {addr_text}"
+                region = (sido, sigungu, addr_text)
                 is_address = _match(viewer_addr, sido=sido, sigungu=sigungu, eup=addr_text)
-            # position 반환
-            try:
-                pos = geocoder.get_address_to_position(query_address=full_addr)
-            except Exception:
-                pos = {"latitude": None, "longitude": None}
+            regions.append(region)
 
             result.append({
                 "id": idx,
                 "address": addr_text,
-                "position": pos,
+                "position": {"latitude": None, "longitude": None},
                 "number": row["number"],
                 "is_address": is_address,
             })
 
+        # position 반환 (중복 제거 후 동시에 조회, 제한 시간 안에 못 찾은 지역은 None 좌표)
+        for item, pos in zip(result, geocoder.get_regions_position(regions)):
+            if pos:
+                item["position"] = pos
+
         ### 응답 송신 ###
         return Response(result, status=status.HTTP_200_OK)
 
@@ -1,3 +1,9 @@
 from django.contrib import admin
+from .models import ProposalEmbedding, FounderTasteVector, FundingSuccessCentroid, FounderCalcRecommendation, ProposalNeighbor, ProposalCooccurrence
 
-# Register your models here.
+admin.site.register(ProposalEmbedding)
+admin.site.register(FounderTasteVector)
+admin.site.register(FundingSuccessCentroid)
+admin.site.register(FounderCalcRecommendation)
+admin.site.register(ProposalNeighbor)
+admin.site.register(ProposalCooccurrence)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+logger = logging.getLogger("recommendations.crons")
+from proposals.models import Proposal
+from recommendations.loaders import get_recommendation_engine
+from recommendations.management.backfill_proposal_embeddings import backfill_proposal_embeddings
+from recommendations.management.build_tfidf_index import build_tfidf_index
+from recommendations.management.compute_calc_recommendations import compute_calc_recommendations
+from recommendations.management.compute_proposal_neighbors import compute_proposal_neighbors
+from recommendations.management.compute_proposal_cooccurrence import compute_proposal_cooccurrence
+from recommendations.management.rebuild_founder_tastes import rebuild_founder_tastes
+from recommendations.tasks import notify_matching_founders
+
+# 이보다 오래된 제안글은 임베딩을 늦게 계산해도 창업자 매칭 알림을 보내지 않음 (모델 교체 뒤 전체 재계산 등)
+MATCH_MAX_AGE = timedelta(hours=1)
+
+def backfill_embeddings_job() -> None:
+    """
+    - 임베딩이 없는 제안글(새 제안글, 생성 직후 처리에 실패했거나 유실된 것)의 벡터를 계산해 저장합니다.
+    - 웹 워커에서 임베딩을 계산하지 않으면(`EMBEDDING_INGESTION_ENABLED=False`) 새 제안글의 창업자 매칭 알림도 여기서 보냅니다.
+    - TF-IDF 엔진을 쓰면 FastText 임베딩이 필요 없으므로 건너뜁니다.
+    """
+    if get_recommendation_engine() != "fasttext":
+        return
+    logger.info("backfill_embeddings_job: 시작")
+    created_after = timezone.now() - MATCH_MAX_AGE
+    saved_ids = backfill_proposal_embeddings()
+    new_proposal_ids = list()
+    if saved_ids and settings.RECOMMENDATION_MATCH_ENABLED and not settings.EMBEDDING_INGESTION_ENABLED:
+        # 이번 실행이 실제로 저장한 제안글 중 새 제안글만 (실행 중에 만들어진 제안글 포함)
+        new_proposal_ids = list(Proposal.objects.filter(
+            id__in=saved_ids, created_at__gte=created_after,
+        ).order_by("id").values_list("id", flat=True))
+    notified = 0
+    for proposal_id in new_proposal_ids:
+        try:
+            notified += notify_matching_founders(proposal_id)
+        except Exception:
+            logger.exception(f"backfill_embeddings_job: 창업자 매칭 알림 실패 - proposal={proposal_id}")
+    logger.info(f"backfill_embeddings_job: 완료 - saved={len(saved_ids)}, notified={notified}")
+
+def compute_calc_recommendations_job() -> None:
+    """
+    - 모든 창업자의 계산식 추천 순위를 다시 계산해 저장합니다.
+    """
+    logger.info("compute_calc_recommendations_job: 시작")
+    saved = compute_calc_recommendations()
+    logger.info(f"compute_calc_recommendations_job: 완료 - founders={saved}")
+
+def build_tfidf_index_job() -> None:
+    """
+    - TF-IDF 엔진을 쓰면 전체 제안글로 TF-IDF 인덱스를 다시 만들어 idf와 새 제안글을 반영합니다.
+    """
+    if get_recommendation_engine() != "tfidf":
+        return
+    logger.info("build_tfidf_index_job: 시작")
+    indexed = build_tfidf_index()
+    logger.info(f"build_tfidf_index_job: 완료 - proposals={indexed}")
+
+def compute_proposal_neighbors_job() -> None:
+    """
+    - 제안글마다 같은 업종의 비슷한 제안 상위 N개를 다시 계산해 저장합니다. (FastText 임베딩 기준)
+    """
+    if get_recommendation_engine() != "fasttext":
+        return
+    logger.info("compute_proposal_neighbors_job: 시작")
+    saved = compute_proposal_neighbors()
+    logger.info(f"compute_proposal_neighbors_job: 완료 - proposals={saved}")
+
+def compute_proposal_cooccurrence_job() -> None:
+    """
+    - 좋아요/스크랩으로 제안 동시 상호작용 수를 처음부터 다시 계산해 그날의 증분 갱신 오차를 바로잡습니다.
+    """
+    logger.info("compute_proposal_cooccurrence_job: 시작")
+    saved = compute_proposal_cooccurrence()
+    logger.info(f"compute_proposal_cooccurrence_job: 완료 - pairs={saved}")
+
+def rebuild_founder_tastes_job() -> None:
+    """
+    - 창업자 취향 벡터를 스크랩한 제안 전체로 다시 만들어 그날의 증분 갱신 오차와 누락을 바로잡습니다. (FastText 임베딩 기준)
+    """
+    if get_recommendation_engine() != "fasttext":
+        return
+    logger.info("rebuild_founder_tastes_job: 시작")
+    rebuilt = rebuild_founder_tastes()
+    logger.info(f"rebuild_founder_tastes_job: 완료 - founders={rebuilt}")
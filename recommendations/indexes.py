@@ -0,0 +1,276 @@
+import logging
+import os
+import threading
+import time
+import numpy as np
+from django.conf import settings
+from .loaders import get_tfidf_index_path
+from .similarity import CandidateMatrix, IVFIndex, normalize_rows, normalize_vector
+
+logger = logging.getLogger(__name__)
+
+class IndustryIndexCache:
+    '''
+    업종별 제안글 임베딩 인덱스를 프로세스에 두고 주기적으로 다시 만드는 공통 기능 (프로세스마다 하나)
+      - 업종 인덱스는 처음 질의할 때 저장소에서 불러와 만들고, `rebuild_seconds`가 지나면 다음 질의에서 다시 만듭니다.
+      - 같은 프로세스에서 계산된 새 제안글은 `add`로 바로 추가됩니다.
+        (다른 프로세스에서 만든 제안글은 다음 재구성 때 반영)
+      - 재구성은 잠금 밖에서 업종마다 한 스레드만 하고, 그동안 다른 요청은 이전 인덱스로 검색합니다.
+        다 만들면 재구성 중에 추가된 제안글을 반영한 뒤 한 번에 바꿉니다.
+    하위 클래스는 `_build(industry)`와 `rebuild_seconds`를 정의하고, 인덱스는 `add`/`search`를 지원해야 합니다.
+    '''
+    def __init__(self):
+        self._indexes: dict[str, tuple[object, float]] = dict()
+        self._build_locks: dict[str, threading.Lock] = dict()
+        self._added_while_building: dict[str, list[tuple[int, np.ndarray]]] = dict()
+        self._lock = threading.Lock()
+
+    @property
+    def rebuild_seconds(self) -> int:
+        raise NotImplementedError
+
+    def _build(self, industry:str):
+        raise NotImplementedError
+
+    def _is_fresh(self, industry:str) -> bool:
+        index, built_at = self._indexes.get(industry, (None, 0.0))
+        return index is not None and time.monotonic() - built_at <= self.rebuild_seconds
+
+    def get(self, industry:str):
+        with self._lock:
+            index, _ = self._indexes.get(industry, (None, 0.0))
+            if self._is_fresh(industry):
+                return index
+            build_lock = self._build_locks.setdefault(industry, threading.Lock())
+        # 이전 인덱스가 있으면 다른 스레드가 재구성하는 동안 기다리지 않고 이전 인덱스 사용
+        if not build_lock.acquire(blocking=index is None):
+            return index
+        try:
+            with self._lock:
+                if self._is_fresh(industry):
+                    return self._indexes[industry][0]
+                self._added_while_building[industry] = list()
+            built_at = time.monotonic()
+            try:
+                index = self._build(industry)
+            finally:
+                with self._lock:
+                    added = self._added_while_building.pop(industry)
+            with self._lock:
+                for proposal_id, vector in added:
+                    index.add(proposal_id, vector)
+                self._indexes[industry] = (index, built_at)
+            return index
+        finally:
+            build_lock.release()
+
+    def add(self, industry:str, proposal_id:int, vector:np.ndarray):
+        '''
+        이미 만들어진(또는 만들고 있는) 업종 인덱스에 새 제안글을 추가합니다. (아직 없으면 다음 질의 때 저장소에서 불러옴)
+        '''
+        with self._lock:
+            if industry in self._added_while_building:
+                self._added_while_building[industry].append((proposal_id, vector))
+            if industry in self._indexes:
+                self._indexes[industry][0].add(proposal_id, vector)
+
+    def top_k(self, industries:list[str], source_vector:np.ndarray, top_k:int=3, exclude:set[int]|None=None) -> list[tuple[int, float]]:
+        '''
+        업종별 인덱스에서 각각 상위 k개를 구해 유사도 순으로 합친 상위 k개 `(id, score)`를 반환합니다.
+        '''
+        results = [
+            result
+            for industry in industries
+            for result in self.get(industry).search(source_vector, top_k, exclude)
+        ]
+        results.sort(key=lambda result: -result[1])
+        return results[:top_k]
+
+    def search(self, industries:list[str], source_vector:np.ndarray, top_k:int=3, exclude:set[int]|None=None) -> list[int]:
+        '''
+        `top_k`의 제안 id만 반환합니다.
+        '''
+        return [proposal_id for proposal_id, score in self.top_k(industries, source_vector, top_k, exclude)]
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+
+class ProposalANNIndex(IndustryIndexCache):
+    '''
+    업종별 제안글 임베딩 IVF 근사 최근접 이웃 인덱스 (`RECOMMENDATION_ANN_REBUILD_SECONDS`마다 재구성)
+    '''
+    @property
+    def rebuild_seconds(self) -> int:
+        return settings.RECOMMENDATION_ANN_REBUILD_SECONDS
+
+    def _build(self, industry:str) -> IVFIndex:
+        from proposals.models import Proposal
+        from .services import ProposalEmbeddingStore
+
+        started = time.perf_counter()
+        embeddings = ProposalEmbeddingStore().load_matrix(Proposal.objects.filter(industry=industry))
+        index = IVFIndex.build(embeddings.ids, embeddings.matrix, n_probe=settings.RECOMMENDATION_ANN_N_PROBE)
+        logger.info(
+            'proposal ANN index built: industry=%s, size=%s, lists=%s (%.2fs)',
+            industry, len(index), len(index.lists), time.perf_counter() - started,
+        )
+        return index
+
+proposal_ann_index = ProposalANNIndex()
+
+class ProposalCandidateIndex(IndustryIndexCache):
+    '''
+    업종별 제안글 임베딩 전체를 정규화한 후보 행렬 (`RECOMMENDATION_CANDIDATE_REBUILD_SECONDS`마다 재구성)
+    요청마다 후보를 저장소/캐시에서 다시 읽지 않고 한 번의 행렬-벡터 곱으로 정확한 상위 k개를 구합니다.
+    (메모리: 제안글 수 × 차원 × 4바이트, 예: 10만 건 × 100차원 ≈ 40MB)
+    '''
+    @property
+    def rebuild_seconds(self) -> int:
+        return settings.RECOMMENDATION_CANDIDATE_REBUILD_SECONDS
+
+    def _build(self, industry:str) -> CandidateMatrix:
+        from proposals.models import Proposal
+        from .services import ProposalEmbeddingStore
+
+        started = time.perf_counter()
+        embeddings = ProposalEmbeddingStore().load_matrix(Proposal.objects.filter(industry=industry))
+        index = CandidateMatrix.build(embeddings.ids, embeddings.matrix)
+        logger.info(
+            'proposal candidate index built: industry=%s, size=%s, %.1fMB (%.2fs)',
+            industry, len(index), index.nbytes / 1024**2, time.perf_counter() - started,
+        )
+        return index
+
+proposal_candidate_index = ProposalCandidateIndex()
+
+class ProposalTfidfIndex:
+    '''
+    `build_tfidf_index`로 저장한 TF-IDF 인덱스 파일 (프로세스마다 하나)
+      - 처음 질의할 때 파일을 불러오고, 파일이 다시 만들어지면(수정 시각 변경) 다음 질의에서 새로 불러옵니다.
+      - 같은 프로세스에서 만든 새 제안글은 `add`로 바로 추가됩니다.
+    '''
+    def __init__(self):
+        self._index = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        from .tfidf import TfidfIndex
+
+        path = get_tfidf_index_path()
+        if not os.path.exists(path):
+            raise FileNotFoundError(f'{path} 파일이 없어요. `python manage.py build_tfidf_index`로 생성하세요.')
+        with self._lock:
+            mtime = os.path.getmtime(path)
+            if self._index is None or mtime != self._mtime:
+                started = time.perf_counter()
+                self._index, self._mtime = TfidfIndex.load(path), mtime
+                logger.info(
+                    'proposal TF-IDF index loaded: size=%s, %.1fMB (%.2fs)',
+                    len(self._index), self._index.nbytes / 1024**2, time.perf_counter() - started,
+                )
+            return self._index
+
+    def add(self, proposal_ids:list[int], industries:list[str], rows):
+        '''
+        이미 불러온 인덱스에 새 제안글 행을 추가합니다. (아직 없으면 다음 질의 때 파일에서 불러옴)
+        '''
+        with self._lock:
+            if self._index is not None:
+                self._index.add(proposal_ids, industries, rows)
+
+    def clear(self):
+        with self._lock:
+            self._index, self._mtime = None, None
+
+proposal_tfidf_index = ProposalTfidfIndex()
+
+class FounderInterestIndex:
+    '''
+    창업자 관심 벡터 행렬 (프로세스마다 하나)
+      - 현재 모델의 취향 벡터(스크랩한 제안 벡터의 합)를 정규화해 (창업자 수, dim) float32 행렬로 쌓고,
+        관심 업종별 행 번호를 함께 둡니다.
+      - 새 제안 벡터와 한 번의 행렬-벡터 곱으로 같은 업종에 관심 있는 모든 창업자의 유사도를 계산합니다.
+      - `RECOMMENDATION_MATCH_REBUILD_SECONDS`가 지나면 다음 질의에서 다시 만듭니다.
+        (같은 프로세스에서 갱신된 취향 벡터는 `update`로 바로 반영)
+    '''
+    def __init__(self):
+        self._founder_ids: np.ndarray = np.empty(0, dtype=object)
+        self._matrix: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        self._rows_by_industry: dict[str, np.ndarray] = dict()
+        self._row_of: dict[str, int] = dict()
+        self._built_at = None
+        self._lock = threading.Lock()
+
+    def _build(self):
+        from .models import FounderTasteVector
+        from .services import FounderTasteStore
+
+        started = time.perf_counter()
+        rows = list(FounderTasteVector.objects.filter(
+            model_name=FounderTasteStore().model_name,
+            count__gt=0,
+            dimension__gt=0,
+        ).values_list('founder_id', 'dimension', 'vector_sum', 'founder__industry'))
+        dim = rows[0][1] if rows else 0
+        rows = [row for row in rows if row[1] == dim]
+        self._founder_ids = np.asarray([founder_id for founder_id, _, _, _ in rows], dtype=object)
+        self._matrix = normalize_rows(
+            np.frombuffer(b''.join(bytes(vector) for _, _, vector, _ in rows), dtype=np.float32).reshape(len(rows), dim).copy()
+        )
+        rows_by_industry: dict[str, list[int]] = dict()
+        for row, (_, _, _, industries) in enumerate(rows):
+            for industry in industries or []:
+                rows_by_industry.setdefault(industry, list()).append(row)
+        self._rows_by_industry = {industry: np.asarray(rows, dtype=np.intp) for industry, rows in rows_by_industry.items()}
+        self._row_of = {founder_id: row for row, founder_id in enumerate(self._founder_ids)}
+        self._built_at = time.monotonic()
+        logger.info(
+            'founder interest index built: founders=%s, dim=%s, %.1fMB (%.2fs)',
+            len(rows), dim, self._matrix.nbytes / 1024**2, time.perf_counter() - started,
+        )
+
+    def match(self, industry:str, vector:np.ndarray, top_n:int, min_score:float, exclude:set|None=None) -> list[tuple[str, float]]:
+        '''
+        관심 업종에 `industry`가 있는 창업자 중 제안 벡터와 코사인 유사도가 `min_score` 이상인 상위 `top_n`명을 반환합니다.
+        Returns:
+            matches (list[tuple[str, float]]): 유사도 내림차순 `(founder_id, score)`
+        '''
+        from .similarity import top_k_indices
+
+        with self._lock:
+            if self._built_at is None or time.monotonic() - self._built_at > settings.RECOMMENDATION_MATCH_REBUILD_SECONDS:
+                self._build()
+            rows = self._rows_by_industry.get(industry)
+            if rows is None or not rows.size or self._matrix.shape[1] != np.asarray(vector).shape[0]:
+                return list()
+            scores = self._matrix[rows] @ normalize_vector(vector)
+            founder_ids = self._founder_ids[rows]
+        matches = list()
+        for i in top_k_indices(scores, top_n + len(exclude or ())):
+            if scores[i] < min_score or len(matches) >= top_n:
+                break
+            if exclude and founder_ids[i] in exclude:
+                continue
+            matches.append((founder_ids[i], float(scores[i])))
+        return matches
+
+    def update(self, founder_id:str, vector_sum:np.ndarray):
+        '''
+        이미 만들어진 행렬에 있는 창업자의 취향 벡터를 바꿉니다. (새 창업자는 다음 재구성 때 추가)
+        '''
+        with self._lock:
+            row = self._row_of.get(founder_id)
+            if row is None:
+                return
+            if vector_sum.shape[0] == self._matrix.shape[1]:
+                self._matrix[row] = normalize_vector(vector_sum)
+            elif not vector_sum.size: # 스크랩이 모두 취소되면 매칭되지 않도록 0 벡터
+                self._matrix[row] = 0
+
+    def clear(self):
+        with self._lock:
+            self._built_at = None
+
+founder_interest_index = FounderInterestIndex()
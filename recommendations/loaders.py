@@ -0,0 +1,302 @@
+import os
+import logging
+import threading
+import time
+from typing import Any, Callable, Literal
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger(__name__)
+
+FASTTEXT_LANG = 'ko'
+FASTTEXT_FULL_DIM = 300
+
+FastTextModelMode = Literal['full', 'reduced']
+FastTextBackend = Literal['fasttext', 'mmap']
+RecommendationEngine = Literal['fasttext', 'tfidf']
+
+# 추천 엔진별로 웹 요청에서 쓰는 모델 (`warm_up` 기본값)
+# FastText는 웹 요청에서 쓰지 않고 임베딩 계산(백필 크론, `EMBEDDING_INGESTION_ENABLED`)에서만 불러옴
+ENGINE_MODELS = {
+    'fasttext': ('kiwi',),
+    'tfidf': ('kiwi',),
+}
+
+def download_fasttext_model(lang='ko'):
+    """
+    FastText 사전훈련 모델을 다운로드합니다.
+    """
+    import fasttext.util
+
+    try:
+        # 모델 저장 경로 설정
+        model_dir = os.path.join(settings.BASE_DIR, 'recommendations')
+        os.makedirs(model_dir, exist_ok=True)
+
+        # 현재 작업 디렉토리를 모델 디렉토리로 변경
+        original_dir = os.getcwd()
+        os.chdir(model_dir)
+
+        # 모델 다운로드 (약 7GB for Korean)
+        print(f"{lang} 모델 다운로드 중...")
+        fasttext.util.download_model(lang, if_exists='ignore')
+
+        # 원래 디렉토리로 복원
+        os.chdir(original_dir)
+
+        # 모델 파일 경로 반환
+        model_path = os.path.join(model_dir, f'cc.{lang}.300.bin')
+        return model_path
+
+    except Exception as e:
+        print(f"모델 다운로드 실패: {e}")
+        os.chdir(original_dir)  # 오류 시에도 디렉토리 복원
+        return None
+
+def get_fasttext_model_name(mode:FastTextModelMode|None=None, dim:int|None=None) -> str:
+    '''
+    모델 모드에 해당하는 모델 이름을 반환합니다.
+    Args:
+        mode (FastTextModelMode|None): 모델 모드 (기본값: `settings.FASTTEXT_MODEL_MODE`)
+            - `'full'`: 사전훈련 모델 원본 (`cc.ko.300`)
+            - `'reduced'`: 차원 축소 모델 (`cc.ko.{dim}`)
+        dim (int|None): 축소 차원 (기본값: `settings.FASTTEXT_REDUCED_DIM`)
+    Returns:
+        name (str): 모델 이름 (예: `cc.ko.100`)
+    '''
+    mode = mode or settings.FASTTEXT_MODEL_MODE
+    if mode == 'full':
+        return f'cc.{FASTTEXT_LANG}.{FASTTEXT_FULL_DIM}'
+    if mode == 'reduced':
+        dim = dim or settings.FASTTEXT_REDUCED_DIM
+        if not 0 < dim < FASTTEXT_FULL_DIM:
+            raise ImproperlyConfigured(f'FASTTEXT_REDUCED_DIM은 1 ~ {FASTTEXT_FULL_DIM - 1} 사이여야 해요.')
+        return f'cc.{FASTTEXT_LANG}.{dim}'
+    raise ImproperlyConfigured(f"FASTTEXT_MODEL_MODE는 'full' 또는 'reduced'여야 해요. (현재: {mode})")
+
+def get_fasttext_model_path(name:str) -> str:
+    '''
+    모델 이름에 해당하는 `.bin` 파일 경로를 반환합니다.
+    '''
+    return os.path.join(settings.BASE_DIR, 'recommendations', f'{name}.bin')
+
+def get_word_vectors_dir(name:str) -> str:
+    '''
+    모델 이름에 해당하는 mmap 단어 벡터 디렉토리 경로를 반환합니다.
+    '''
+    return os.path.join(settings.BASE_DIR, 'recommendations', f'{name}.vectors')
+
+def get_tfidf_index_path() -> str:
+    '''
+    TF-IDF 추천 엔진 인덱스 파일 경로를 반환합니다.
+    '''
+    return os.path.join(settings.BASE_DIR, 'recommendations', 'tfidf_index.npz')
+
+def get_recommendation_engine() -> RecommendationEngine:
+    '''
+    설정된 추천 엔진을 반환합니다. (`settings.RECOMMENDATION_ENGINE`)
+      - `'fasttext'`: FastText 단어 벡터 평균 (기본값)
+      - `'tfidf'`: 명사 토큰 TF-IDF 희소 행렬 (FastText를 올릴 수 없는 작은 서버용)
+    '''
+    engine = settings.RECOMMENDATION_ENGINE
+    if engine not in ENGINE_MODELS:
+        raise ImproperlyConfigured(f"RECOMMENDATION_ENGINE은 'fasttext' 또는 'tfidf'여야 해요. (현재: {engine})")
+    return engine
+
+def load_fasttext_model(mode:FastTextModelMode|None=None, dim:int|None=None, backend:FastTextBackend|None=None):
+    '''
+    설정된 모드의 FastText 모델을 불러옵니다.
+    원본 모델은 파일이 없으면 다운로드하고, 축소 모델은 미리 생성되어 있어야 합니다.
+    Args:
+        backend (FastTextBackend|None): 기본값: `settings.FASTTEXT_BACKEND`
+            - `'fasttext'`: 프로세스마다 `.bin` 모델을 메모리에 불러옴
+            - `'mmap'`: `export_word_vectors`로 내보낸 `.npy`를 mmap으로 열어 워커끼리 페이지 캐시를 공유
+    '''
+    backend = backend or settings.FASTTEXT_BACKEND
+    if backend == 'mmap':
+        from .word_vectors import MmapWordVectors
+
+        vectors_dir = get_word_vectors_dir(get_fasttext_model_name(mode, dim))
+        if not os.path.exists(vectors_dir):
+            raise FileNotFoundError(f'{vectors_dir} 디렉토리가 없어요. `python manage.py export_word_vectors`로 생성하세요.')
+        return MmapWordVectors(vectors_dir)
+    if backend != 'fasttext':
+        raise ImproperlyConfigured(f"FASTTEXT_BACKEND는 'fasttext' 또는 'mmap'이어야 해요. (현재: {backend})")
+
+    import fasttext
+
+    mode = mode or settings.FASTTEXT_MODEL_MODE
+    model_path = get_fasttext_model_path(get_fasttext_model_name(mode, dim))
+    if not os.path.exists(model_path):
+        if mode != 'full':
+            raise FileNotFoundError(f'{model_path} 파일이 없어요. `python manage.py build_fasttext_model`로 생성하세요.')
+        model_path = download_fasttext_model(FASTTEXT_LANG)
+    return fasttext.load_model(model_path)
+
+def build_reduced_fasttext_model(dim:int|None=None) -> str:
+    '''
+    원본 모델의 차원을 PCA로 축소(`fasttext.util.reduce_model`)해 `cc.ko.{dim}.bin`으로 저장합니다.
+    Returns:
+        model_path (str): 저장한 파일 경로
+    '''
+    import fasttext.util
+
+    dim = dim or settings.FASTTEXT_REDUCED_DIM
+    model_path = get_fasttext_model_path(get_fasttext_model_name('reduced', dim))
+    model = load_fasttext_model('full', backend='fasttext')
+    fasttext.util.reduce_model(model, dim)
+    model.save_model(model_path)
+    return model_path
+
+def export_fasttext_word_vectors(mode:FastTextModelMode|None=None, dim:int|None=None) -> str:
+    '''
+    설정된 모드의 `.bin` 모델을 mmap 백엔드용 `{name}.vectors/` 디렉토리로 내보냅니다.
+    Returns:
+        vectors_dir (str): 내보낸 디렉토리 경로
+    '''
+    from .word_vectors import export_word_vectors
+
+    vectors_dir = get_word_vectors_dir(get_fasttext_model_name(mode, dim))
+    export_word_vectors(load_fasttext_model(mode, dim, backend='fasttext'), vectors_dir)
+    return vectors_dir
+
+def load_kiwi():
+    '''
+    Kiwi 형태소 분석기를 불러옵니다.
+    여러 텍스트를 한 번에 토큰화할 때 `KIWI_NUM_WORKERS`개의 작업 스레드를 사용합니다.
+    '''
+    from kiwipiepy import Kiwi
+    return Kiwi(num_workers=settings.KIWI_NUM_WORKERS)
+
+class ModelRegistry:
+    '''
+    AI 모델을 import 시점이 아니라 처음 사용할 때(또는 `warm_up` 호출 시) 한 번만 불러오는 레지스트리
+      - 추천과 무관한 프로세스(manage.py 명령, 테스트 등)는 모델을 불러오지 않습니다.
+      - 불러오기에 실패한 모델은 None을 반환하고, `AI_MODEL_RETRY_SECONDS`가 지나거나 `warm_up`을 호출하면 다시 시도합니다.
+    '''
+    UNLOADED = 'unloaded'
+    LOADING = 'loading'
+    LOADED = 'loaded'
+    FAILED = 'failed'
+
+    def __init__(self, loaders:dict[str, Callable[[], Any]]):
+        self._loaders = loaders
+        self._models: dict[str, Any] = dict()
+        self._status = {
+            name: {'state': self.UNLOADED, 'duration': None, 'error': None}
+            for name in loaders
+        }
+        self._failed_at: dict[str, float] = dict()
+        self._lock = threading.Lock()
+        self._warm_up_thread: threading.Thread|None = None
+
+    def _is_settled(self, name:str) -> bool:
+        '''
+        불러왔거나, 실패한 지 `AI_MODEL_RETRY_SECONDS`가 지나지 않았으면 True
+        '''
+        state = self._status[name]['state']
+        if state == self.FAILED:
+            return time.monotonic() - self._failed_at[name] < settings.AI_MODEL_RETRY_SECONDS
+        return state == self.LOADED
+
+    def get(self, name:str):
+        '''
+        모델을 반환합니다. 아직 불러오지 않았다면 불러옵니다. 실패했다면 None을 반환합니다.
+        '''
+        if self._is_settled(name):
+            return self._models.get(name)
+        with self._lock:
+            if self._is_settled(name):
+                return self._models.get(name)
+            self._status[name]['state'] = self.LOADING
+            started = time.perf_counter()
+            try:
+                self._models[name] = self._loaders[name]()
+                self._status[name]['state'] = self.LOADED
+            except Exception as e:
+                self._status[name].update(state=self.FAILED, error=str(e))
+                self._failed_at[name] = time.monotonic()
+                logger.exception('AI 모델 로드 실패: %s', name)
+            self._status[name]['duration'] = time.perf_counter() - started
+            logger.info('AI 모델 로드: %s %s (%.1fs)', name, self._status[name]['state'], self._status[name]['duration'])
+        return self._models.get(name)
+
+    @property
+    def kiwi(self):
+        return self.get('kiwi')
+
+    @property
+    def fasttext(self):
+        return self.get('fasttext')
+
+    def set(self, name:str, model):
+        '''
+        불러오지 않고 주어진 모델을 사용하도록 등록합니다. (벤치마크 등에서 대체 모델 주입)
+        '''
+        with self._lock:
+            self._models[name] = model
+            self._status[name].update(state=self.LOADED, duration=0.0, error=None)
+
+    def is_loaded(self, name:str) -> bool:
+        return self._status[name]['state'] == self.LOADED
+
+    def _warm_up_names(self, names:tuple[str, ...]) -> tuple[str, ...]:
+        '''
+        미리 불러올 모델 이름을 확인합니다. (이름이 없으면 설정된 추천 엔진이 웹 요청에서 쓰는 모델)
+        FastText(수 GB)는 이름을 직접 지정하고, 이 프로세스에서 임베딩을 계산할 때(`EMBEDDING_INGESTION_ENABLED`)만 불러옵니다.
+        Raises:
+            ValueError: 없는 모델이거나, 임베딩을 계산하지 않는 프로세스에서 FastText를 요청한 경우
+        '''
+        names = names or ENGINE_MODELS[get_recommendation_engine()]
+        unknown = [name for name in names if name not in self._loaders]
+        if unknown:
+            raise ValueError(f'없는 모델이에요: {", ".join(unknown)}')
+        if 'fasttext' in names and not settings.EMBEDDING_INGESTION_ENABLED:
+            raise ValueError('EMBEDDING_INGESTION_ENABLED가 꺼진 프로세스는 FastText를 쓰지 않아 불러오지 않아요.')
+        return names
+
+    def warm_up(self, *names:str) -> dict:
+        '''
+        모델을 미리 불러옵니다. (불러올 모델은 `_warm_up_names` 참고)
+        Returns:
+            status (dict): `status()`와 같음
+        '''
+        names = self._warm_up_names(names)
+        with self._lock:
+            # 명시적으로 호출하면 실패한 모델도 바로 다시 시도
+            for name in names:
+                if self._status[name]['state'] == self.FAILED:
+                    self._status[name]['state'] = self.UNLOADED
+        for name in names:
+            self.get(name)
+        return self.status()
+
+    def warm_up_async(self, *names:str) -> dict:
+        '''
+        `warm_up`을 백그라운드 스레드에서 실행합니다. (HTTP 요청이 모델 로드를 기다리지 않도록)
+        이미 실행 중이면 새로 시작하지 않습니다.
+        Returns:
+            status (dict): 호출 시점의 `status()`
+        Raises:
+            ValueError: `_warm_up_names` 참고 (스레드를 시작하기 전에 확인)
+        '''
+        names = self._warm_up_names(names)
+        with self._lock:
+            if self._warm_up_thread is None or not self._warm_up_thread.is_alive():
+                self._warm_up_thread = threading.Thread(
+                    target=self.warm_up, args=names, name='ai-models-warm-up', daemon=True,
+                )
+                self._warm_up_thread.start()
+        return self.status()
+
+    def status(self) -> dict:
+        '''
+        Returns:
+            status (dict): {name: {'state', 'duration'(초), 'error'}}
+        '''
+        return {name: dict(status) for name, status in self._status.items()}
+
+ai_models = ModelRegistry({
+    'kiwi': load_kiwi,
+    'fasttext': load_fasttext_model,
+})
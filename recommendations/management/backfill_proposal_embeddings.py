@@ -0,0 +1,157 @@
+from __future__ import annotations
+import logging
+import multiprocessing
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from proposals.models import Proposal
+from recommendations.loaders import ai_models, load_kiwi
+from recommendations.services import AI, ProposalEmbeddingStore
+from utils.constants import CacheKey
+
+logger = logging.getLogger("recommendations.crons")
+
+# 워커 프로세스마다 한 번만 만드는 AI 인스턴스
+_worker_ai: Optional[AI] = None
+
+def _init_worker(fork: bool = False) -> None:
+    """
+    워커 프로세스 초기화: 모델을 프로세스당 한 번만 불러옵니다.
+    fork된 워커는 부모가 미리 불러온 FastText 모델을 그대로 물려받아 메모리 페이지를 copy-on-write로 공유하고,
+    부모의 Kiwi 작업 스레드는 물려받지 못해 멈추므로 Kiwi만 새로 만듭니다.
+    """
+    global _worker_ai
+    fasttext_model = ai_models.fasttext
+    if not fasttext_model:
+        raise RuntimeError("AI 모델을 불러오지 못했어요.")
+    _worker_ai = AI(fasttext_model, kiwi=load_kiwi() if fork else None)
+
+def _vectorize_chunk(chunk: dict[int, str]) -> dict[int, Optional[np.ndarray]]:
+    return dict(zip(chunk, _worker_ai.vectorize_many(list(chunk.values()))))
+
+def _checkpoint_key(store: ProposalEmbeddingStore) -> str:
+    # 체크포인트는 `force` 실행에만 사용 (일반 실행은 저장되지 않은 제안글만 고르므로 그 자체로 이어서 계산됨)
+    return CacheKey.EMBEDDING_BACKFILL_CHECKPOINT.format(model_name=store.model_name, mode="force")
+
+def _lock_key(store: ProposalEmbeddingStore) -> str:
+    return CacheKey.EMBEDDING_BACKFILL_LOCK.format(model_name=store.model_name)
+
+def _iter_chunks(qs, chunk_size: int):
+    chunk: dict[int, str] = {}
+    for proposal_id, title, content in qs.iterator(chunk_size=chunk_size):
+        chunk[proposal_id] = " ".join([title, content])
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = {}
+    if chunk:
+        yield chunk
+
+def backfill_proposal_embeddings(
+    chunk_size: int = 500,
+    force: bool = False,
+    workers: int = 1,
+    resume: bool = True,
+) -> list[int]:
+    """
+    제안글 임베딩을 계산해 ProposalEmbedding 저장소에 채웁니다.
+      - 제안글을 id 순으로 chunk씩 스트리밍하고, chunk마다 한 번의 upsert로 저장합니다.
+      - `workers` > 1이면 `ProcessPoolExecutor`로 chunk를 나눠 계산합니다. (워커마다 모델을 한 번만 불러옴)
+      - `force` 실행은 chunk를 저장할 때마다 마지막 id를 체크포인트로 남겨, 중단되면 다음 `force` 실행이 그 뒤부터 이어서 계산합니다.
+        일반 실행(크론)은 저장되지 않은 제안글만 고르므로 체크포인트 없이 이어서 계산되고, `force` 체크포인트를 건드리지 않습니다.
+      - 계산할 제안글이 없으면 모델을 불러오지 않고 바로 끝냅니다.
+      - 같은 모델의 실행은 캐시 잠금으로 하나만 하고, 이미 실행 중이면 아무것도 하지 않습니다.
+        (잠금은 `EMBEDDING_BACKFILL_LOCK_TIMEOUT`마다 만료되며 chunk를 저장할 때마다 연장)
+
+    Args:
+        chunk_size: 한 번에 계산/저장할 제안글 수
+        force: True면 이미 저장된 제안글도 다시 계산
+        workers: 벡터를 계산할 프로세스 수 (1이면 현재 프로세스에서 계산)
+        resume: False면 `force` 체크포인트를 무시하고 처음부터 계산
+
+    Returns:
+        저장한 제안글 id 목록 (id 순, 이미 실행 중이거나 계산할 제안글이 없으면 빈 목록)
+    """
+    store = ProposalEmbeddingStore()
+    checkpoint_key = _checkpoint_key(store) if force else None
+    last_id = cache.get(checkpoint_key) if checkpoint_key and resume else None
+
+    qs = Proposal.objects.all()
+    if not force:
+        qs = store.missing(qs)
+    if last_id is not None:
+        qs = qs.filter(id__gt=last_id)
+        logger.info("[backfill_proposal_embeddings] 체크포인트 id=%s 이후부터 이어서 계산", last_id)
+    pending = qs.count()
+    if pending == 0:
+        # 체크포인트 뒤로 남은 제안글이 없으면 끝난 실행이므로 체크포인트도 지움
+        if checkpoint_key:
+            cache.delete(checkpoint_key)
+        return []
+    qs = qs.order_by("id").values_list("id", "title", "content")
+
+    lock_key, lock_token = _lock_key(store), uuid.uuid4().hex
+    if not cache.add(lock_key, lock_token, timeout=settings.EMBEDDING_BACKFILL_LOCK_TIMEOUT):
+        logger.info("[backfill_proposal_embeddings] 이미 실행 중이라 건너뜀 - model=%s", store.model_name)
+        return []
+    try:
+        return _backfill(store, qs, pending, chunk_size, workers, checkpoint_key, lock_key)
+    finally:
+        if cache.get(lock_key) == lock_token:
+            cache.delete(lock_key)
+
+def _backfill(store: ProposalEmbeddingStore, qs, pending: int, chunk_size: int, workers: int, checkpoint_key: Optional[str], lock_key: str) -> list[int]:
+    saved_ids: list[int] = []
+    started = time.perf_counter()
+
+    def save(vectors: dict[int, Optional[np.ndarray]]) -> None:
+        store.put_many(vectors)
+        saved_ids.extend(vectors)
+        # 저장은 id 순으로 이루어지므로 마지막 id까지는 모두 처리된 상태
+        if checkpoint_key:
+            cache.set(checkpoint_key, max(vectors), timeout=None)
+        cache.touch(lock_key, settings.EMBEDDING_BACKFILL_LOCK_TIMEOUT)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "[backfill_proposal_embeddings] %s/%s (%.1f texts/sec)",
+            len(saved_ids), pending, len(saved_ids) / elapsed if elapsed else float("inf"),
+        )
+
+    if workers <= 1:
+        _init_worker()
+        for chunk in _iter_chunks(qs, chunk_size):
+            save(_vectorize_chunk(chunk))
+    else:
+        # 워커마다 모델을 따로 불러오지 않도록 부모에서 먼저 불러와 fork로 공유
+        if not ai_models.fasttext:
+            raise RuntimeError("AI 모델을 불러오지 못했어요.")
+        # fork로 만든 워커가 부모의 DB 연결을 물려받지 않도록 먼저 닫음 (워커는 DB를 쓰지 않음)
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(True,),
+        ) as executor:
+            # 메모리가 코퍼스 크기에 비례하지 않도록 진행 중인 chunk 수를 제한하고, 제출한 순서대로 저장
+            in_flight = deque()
+            for chunk in _iter_chunks(qs, chunk_size):
+                in_flight.append(executor.submit(_vectorize_chunk, chunk))
+                if len(in_flight) >= workers * 2:
+                    save(in_flight.popleft().result())
+            while in_flight:
+                save(in_flight.popleft().result())
+
+    if checkpoint_key:
+        cache.delete(checkpoint_key)
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "[backfill_proposal_embeddings] model=%s, saved=%s, workers=%s, %.1fs (%.1f texts/sec)",
+        store.model_name, len(saved_ids), workers, elapsed, len(saved_ids) / elapsed if elapsed else float("inf"),
+    )
+    return saved_ids
@@ -0,0 +1,56 @@
+from __future__ import annotations
+import logging
+import os
+import time
+from proposals.models import Proposal
+from recommendations.loaders import ai_models, get_tfidf_index_path
+from recommendations.services import AI
+from recommendations.tfidf import TfidfIndex, TFIDF_N_FEATURES
+
+logger = logging.getLogger("recommendations.crons")
+
+def build_tfidf_index(chunk_size: int = 2000, n_features: int = TFIDF_N_FEATURES) -> int:
+    """
+    모든 제안글의 명사 토큰으로 TF-IDF 인덱스를 만들어 `tfidf_index.npz`로 저장합니다.
+    (`RECOMMENDATION_ENGINE='tfidf'`용, FastText 없이 Kiwi만 사용)
+    웹 프로세스는 파일이 바뀐 것을 보고 다음 추천 요청에서 새로 불러옵니다.
+
+    Args:
+        chunk_size: 한 번에 토큰화할 제안글 수
+        n_features: 해시 공간 크기
+
+    Returns:
+        인덱스에 넣은 제안글 수
+    """
+    if ai_models.kiwi is None:
+        raise RuntimeError("AI 모델을 불러오지 못했어요.")
+    ai = AI(model=None)
+
+    started = time.perf_counter()
+    ids: list[int] = []
+    industries: list[str] = []
+    token_lists: list[list[str]] = []
+    chunk: list[str] = []
+    for proposal_id, industry, title, content in Proposal.objects.order_by("id").values_list(
+        "id", "industry", "title", "content",
+    ).iterator(chunk_size=chunk_size):
+        ids.append(proposal_id)
+        industries.append(industry)
+        chunk.append(" ".join([title, content]))
+        if len(chunk) >= chunk_size:
+            token_lists += ai.tokenize_many(chunk)
+            chunk = []
+    token_lists += ai.tokenize_many(chunk)
+
+    index = TfidfIndex.build(ids, industries, token_lists, n_features=n_features)
+    # 웹 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    path = get_tfidf_index_path()
+    tmp_path = f"{path}.tmp.npz"
+    index.save(tmp_path)
+    os.replace(tmp_path, path)
+
+    logger.info(
+        "[build_tfidf_index] proposals=%s, %.1fMB, %.1fs",
+        len(index), index.nbytes / 1024**2, time.perf_counter() - started,
+    )
+    return len(index)
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from recommendations.management.backfill_proposal_embeddings import backfill_proposal_embeddings
+
+class Command(BaseCommand):
+    help = (
+        '제안글 임베딩을 계산해 ProposalEmbedding 저장소에 채웁니다. '
+        '(모델 변경·저장소 초기화 뒤 전체 재계산용, `--force` 실행이 중단되면 다음 `--force` 실행이 마지막 id부터 이어서 계산)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help='한 번에 계산/저장할 제안글 수')
+        parser.add_argument('--force', action='store_true', help='이미 저장된 제안글도 다시 계산')
+        parser.add_argument('--workers', type=int, default=1, help='벡터를 계산할 프로세스 수 (부모가 불러온 모델을 fork로 공유)')
+        parser.add_argument('--restart', action='store_true', help='`--force` 체크포인트를 무시하고 처음부터 계산')
+
+    def handle(self, *args, **options):
+        saved_ids = backfill_proposal_embeddings(
+            chunk_size=options['chunk_size'],
+            force=options['force'],
+            workers=options['workers'],
+            resume=not options['restart'],
+        )
+        self.stdout.write(f'saved: {len(saved_ids)}')
@@ -0,0 +1,61 @@
+import time
+import numpy as np
+from django.core.management.base import BaseCommand
+from recommendations.similarity import IVFIndex, SimilarityMatrix, normalize_rows, top_k_indices
+
+class Command(BaseCommand):
+    help = '업종별 IVF 근사 최근접 이웃 인덱스와 정확 비교의 질의 시간 및 recall@k를 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000], help='후보 개수')
+        parser.add_argument('--dim', type=int, default=300, help='벡터 차원')
+        parser.add_argument('--clusters', type=int, default=50, help='합성 데이터의 주제(군집) 개수')
+        parser.add_argument('--n-lists', type=int, default=None, help='IVF 리스트 개수 (기본값: √n)')
+        parser.add_argument('--n-probe', nargs='+', type=int, default=[1, 4, 8])
+        parser.add_argument('--queries', type=int, default=200)
+        parser.add_argument('--exclude-ratio', type=float, default=0.05, help='질의마다 제외(스크랩/펀딩)할 후보 비율')
+        parser.add_argument('--top-k', type=int, default=3)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options['seed'])
+        dim, top_k = options['dim'], options['top_k']
+
+        for size in options['sizes']:
+            # 주제 중심 + 잡음으로 만든 합성 임베딩, 질의는 임의 제안 10개의 평균(스크랩 대표 벡터)
+            centers = rng.standard_normal((options['clusters'], dim), dtype=np.float32)
+            labels = rng.integers(0, options['clusters'], size)
+            matrix = centers[labels] + rng.standard_normal((size, dim), dtype=np.float32)
+            ids = np.arange(size, dtype=np.int64)
+            queries = [matrix[rng.choice(size, 10, replace=False)].mean(axis=0) for _ in range(options['queries'])]
+            excludes = [set(rng.choice(size, int(size * options['exclude_ratio']), replace=False).tolist()) for _ in queries]
+
+            exact = SimilarityMatrix(ids.tolist(), normalize_rows(matrix.copy()))
+            exact_ids, exact_ms = list(), list()
+            for query, exclude in zip(queries, excludes):
+                started = time.perf_counter()
+                scores = exact.scores(query)
+                scores[list(exclude)] = -np.inf
+                exact_ids.append(set(top_k_indices(scores, top_k).tolist()))
+                exact_ms.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            index = IVFIndex.build(ids, matrix, n_lists=options['n_lists'])
+            build_sec = time.perf_counter() - started
+            self.stdout.write(
+                f'n={size:,} lists={len(index.lists)} build={build_sec:.2f}s '
+                f'exact p50={np.percentile(exact_ms, 50):.2f}ms p95={np.percentile(exact_ms, 95):.2f}ms'
+            )
+
+            for n_probe in options['n_probe']:
+                index.n_probe = n_probe
+                ann_ms, recalls = list(), list()
+                for query, exclude, expected in zip(queries, excludes, exact_ids):
+                    started = time.perf_counter()
+                    found = index.search(query, top_k, exclude)
+                    ann_ms.append((time.perf_counter() - started) * 1000)
+                    recalls.append(len(expected & {id for id, score in found}) / top_k)
+                self.stdout.write(
+                    f'  n_probe={n_probe:<3} ann p50={np.percentile(ann_ms, 50):.2f}ms '
+                    f'p95={np.percentile(ann_ms, 95):.2f}ms recall@{top_k}={np.mean(recalls):.3f}'
+                )
@@ -0,0 +1,241 @@
+import random
+import resource
+import time
+import numpy as np
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext, override_settings
+from accounts.models import User, Proposer, Founder, ProposerLevel
+from proposals.models import Proposal, ProposerLikeProposal, FounderScrapProposal
+from utils.choices import IndustryChoices, FounderTargetChoices
+from recommendations.loaders import ai_models
+from recommendations.word_vectors import HashingWordVectors
+
+INDUSTRY_WORDS = {
+    IndustryChoices.CAFE_DESSERT: '카페 디저트 커피 베이커리 빵집 케이크 마카롱 라떼 원두 브런치',
+    IndustryChoices.FOOD_DINING: '식당 맛집 한식 분식 국밥 파스타 돈가스 김밥 떡볶이 백반',
+    IndustryChoices.HEALTH_FITNESS: '헬스장 요가 필라테스 운동 스트레칭 체육관 트레이너 수영장 러닝 근력',
+    IndustryChoices.PET: '반려동물 애견 고양이 산책 미용 간식 동물병원 펫샵 놀이터 훈련',
+    IndustryChoices.CULTURE_BOOKS: '서점 책방 도서관 독서 문구 전시 공연 갤러리 모임 강연',
+    IndustryChoices.EDUCATION_ACADEMY: '학원 교육 수학 영어 코딩 과외 독서실 공부방 미술 음악',
+}
+COMMON_WORDS = '동네 주민 골목 거리 가게 공간 주말 저녁 아침 가족 아이 학생 직장인 주차 조용 분위기'.split()
+DONGS = [
+    {'sido': '서울특별시', 'sigungu': '마포구', 'eupmyundong': eupmyundong}
+    for eupmyundong in ('서교동', '합정동', '망원동', '연남동', '성산동', '상수동')
+]
+
+class Counter:
+    '''
+    캐시 백엔드 메서드 호출(왕복) 횟수를 셉니다.
+    '''
+    METHODS = ('get', 'set', 'add', 'delete', 'get_many', 'set_many', 'delete_many', 'has_key', 'incr', 'touch')
+
+    def __init__(self, backend):
+        self.count = 0
+        for name in self.METHODS:
+            setattr(backend, name, self._wrap(getattr(backend, name)))
+
+    def _wrap(self, method):
+        def wrapper(*args, **kwargs):
+            self.count += 1
+            return method(*args, **kwargs)
+        return wrapper
+
+class Command(BaseCommand):
+    help = (
+        '합성 제안글 코퍼스(1k/10k/100k)를 임시 테스트 DB에 만들고 스크랩/계산식 추천을 끝까지 실행해 '
+        'p50/p95 지연, 쿼리 수, 캐시 왕복 수, 최대 RSS를 보고합니다. (FastText 대신 해시 대체 모델 사용)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[1_000, 10_000, 100_000], help='제안글 개수 (누적 생성)')
+        parser.add_argument('--requests', type=int, default=20, help='시나리오별 요청 횟수')
+        parser.add_argument('--founders', type=int, default=20)
+        parser.add_argument('--dim', type=int, default=64, help='대체 모델 벡터 차원')
+        parser.add_argument('--ann', action='store_true', help='스크랩 추천에 ANN 인덱스 시나리오 추가')
+        parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 지우지 않음')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        ai_models.set('fasttext', HashingWordVectors(options['dim']))
+
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'], serialize=False)
+        try:
+            with override_settings(
+                CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+                EMBEDDING_INGESTION_ENABLED=False,
+            ):
+                self.cache_counter = Counter(caches['default'])
+                self._run(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+
+    def _run(self, options):
+        from recommendations.indexes import proposal_ann_index, proposal_candidate_index
+        from recommendations.management.backfill_proposal_embeddings import backfill_proposal_embeddings
+        from recommendations.management.compute_calc_recommendations import compute_calc_recommendations
+
+        proposers = self._create_proposers(max(options['sizes']) // 50 + 10)
+        founders = self._create_founders(options['founders'])
+        created = 0
+        for size in sorted(options['sizes']):
+            started = time.perf_counter()
+            self._create_proposals(proposers, size - created)
+            created = size
+            self._create_scraps(founders)
+            corpus_sec = time.perf_counter() - started
+
+            started = time.perf_counter()
+            backfill_proposal_embeddings(chunk_size=2000)
+            compute_calc_recommendations()
+            self._rebuild_tastes(founders)
+            proposal_ann_index.clear()
+            proposal_candidate_index.clear()
+            prepare_sec = time.perf_counter() - started
+            self.stdout.write(f'\n== n={size:,} (corpus {corpus_sec:.1f}s, embeddings/precompute {prepare_sec:.1f}s)')
+
+            scenarios = [
+                ('scrap cold', lambda founder: self._scrap(founder), True),
+                ('scrap warm', lambda founder: self._scrap(founder), False),
+                ('calc live', lambda founder: self._calc(founder, live=True), False),
+                ('calc precomputed', lambda founder: self._calc(founder, live=False), False),
+            ]
+            if options['ann']:
+                scenarios.insert(1, ('scrap cold (ANN)', lambda founder: self._scrap(founder, ann=True), True))
+            for name, run, clear_cache in scenarios:
+                self._report(name, run, founders, options['requests'], clear_cache)
+            peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            self.stdout.write(f'peak RSS {peak_rss_mb:,.0f}MB')
+
+    def _report(self, name, run, founders, requests, clear_cache):
+        latencies, queries, round_trips = list(), list(), list()
+        for i in range(requests):
+            founder = founders[i % len(founders)]
+            if clear_cache:
+                caches['default'].clear()
+            self.cache_counter.count = 0
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                run(founder)
+                latencies.append((time.perf_counter() - started) * 1000)
+            queries.append(len(captured))
+            round_trips.append(self.cache_counter.count)
+        self.stdout.write(
+            f'{name:<18} p50={np.percentile(latencies, 50):8.1f}ms p95={np.percentile(latencies, 95):8.1f}ms '
+            f'queries={np.mean(queries):5.1f} cache_round_trips={np.mean(round_trips):5.1f}'
+        )
+
+    def _request(self, founder, params=None):
+        request = RequestFactory().get('/', params or {})
+        request.user = founder.user
+        return request
+
+    def _rebuild_tastes(self, founders):
+        from recommendations.services import RecommendationScrapService
+
+        for founder in founders:
+            service = RecommendationScrapService(self._request(founder))
+            service.taste_store.rebuild(founder, service.lookup)
+
+    def _scrap(self, founder, ann=False):
+        from recommendations.services import RecommendationScrapService
+
+        with override_settings(RECOMMENDATION_ANN_ENABLED=ann):
+            return RecommendationScrapService(self._request(founder)).recommend_founder_scrap_proposal()
+
+    def _calc(self, founder, live):
+        from recommendations.services import RecommendationCalcService
+
+        return RecommendationCalcService(self._request(founder, founder.address[0] if live else None)).recommend_calc()
+
+    # -------------------------------
+    # 합성 코퍼스
+    # -------------------------------
+    @staticmethod
+    def _bulk_create_with_nanoid(model, objs):
+        # NANOID 기본키는 INSERT 직전에 만들어져 bulk_create가 돌려받지 못하므로 미리 채움
+        for obj in objs:
+            obj.pk = model._meta.pk.generate_nanoid()
+        return model.objects.bulk_create(objs)
+
+    def _create_users(self, prefix, count):
+        start = User.objects.filter(email__startswith=prefix).count()
+        return self._bulk_create_with_nanoid(User, [
+            User(email=f'{prefix}{i}@benchmark.local', name='벤치', birth='000101', sex='MAN')
+            for i in range(start, start + count)
+        ])
+
+    def _create_proposers(self, count):
+        industries = list(INDUSTRY_WORDS)
+        proposers = self._bulk_create_with_nanoid(Proposer, [
+            Proposer(user=user, industry=[self.rng.choice(industries)])
+            for user in self._create_users('proposer', count)
+        ])
+        ProposerLevel.objects.bulk_create([
+            ProposerLevel(user=proposer, address=address, level=self.rng.randint(1, 3))
+            for proposer in proposers
+            for address in self.rng.sample(DONGS, 2)
+        ])
+        return proposers
+
+    def _create_founders(self, count):
+        industries = list(INDUSTRY_WORDS)
+        return self._bulk_create_with_nanoid(Founder, [
+            Founder(
+                user=user,
+                industry=self.rng.sample(industries, 2),
+                address=self.rng.sample(DONGS, 2),
+                target=self.rng.choice([[FounderTargetChoices.LOCAL], [FounderTargetChoices.STRANGER], list(FounderTargetChoices.values)]),
+                business_hours={'start': f'{self.rng.randint(7, 11):02d}:00', 'end': f'{self.rng.randint(17, 22):02d}:00'},
+            )
+            for user in self._create_users('founder', count)
+        ])
+
+    def _text(self, industry, words):
+        vocabulary = INDUSTRY_WORDS[industry].split()
+        return ' '.join(
+            self.rng.choice(vocabulary) if self.rng.random() < 0.6 else self.rng.choice(COMMON_WORDS)
+            for _ in range(words)
+        )
+
+    def _create_proposals(self, proposers, count, batch_size=5000):
+        for start in range(0, count, batch_size):
+            proposals = list()
+            for _ in range(min(batch_size, count - start)):
+                proposer = self.rng.choice(proposers)
+                industry = proposer.industry[0]
+                proposals.append(Proposal(
+                    user=proposer,
+                    title=self._text(industry, 3),
+                    content=self._text(industry, 30),
+                    industry=industry,
+                    business_hours={'start': f'{self.rng.randint(6, 12):02d}:00', 'end': f'{self.rng.randint(15, 23):02d}:00'},
+                    address=self.rng.choice(DONGS),
+                    position={'latitude': 37.55 + self.rng.random() / 50, 'longitude': 126.91 + self.rng.random() / 50},
+                    radius=250,
+                ))
+            proposals = Proposal.objects.bulk_create(proposals)
+            ProposerLikeProposal.objects.bulk_create(
+                [
+                    ProposerLikeProposal(user=liker, proposal=proposal)
+                    for proposal in proposals
+                    for liker in self.rng.sample(proposers, self.rng.randint(0, 6))
+                ],
+                ignore_conflicts=True,
+            )
+
+    def _create_scraps(self, founders, per_founder=12):
+        ids = list(Proposal.objects.values_list('id', flat=True))
+        FounderScrapProposal.objects.bulk_create(
+            [
+                FounderScrapProposal(user=founder, proposal_id=proposal_id)
+                for founder in founders
+                for proposal_id in self.rng.sample(ids, per_founder)
+            ],
+            ignore_conflicts=True,
+        )
@@ -0,0 +1,74 @@
+import heapq
+import time
+import numpy as np
+from django.core.management.base import BaseCommand
+from sklearn.metrics.pairwise import cosine_similarity
+from recommendations.similarity import SimilarityMatrix
+
+class Item:
+    def __init__(self, id:int):
+        self.id = id
+
+    def __lt__(self, other):
+        return self.id < other.id
+
+def legacy_find_top_similar(source_vector, items_and_vectors:list[tuple], top_k:int=3):
+    '''
+    기존 구현: 후보마다 1x300 cosine_similarity 호출 + heapq
+    '''
+    min_heap = list()
+    for item, vector in items_and_vectors:
+        similarity = cosine_similarity(
+            source_vector.reshape(1, -1),
+            vector.reshape(1, -1),
+        )[0][0]
+        if len(min_heap) < top_k:
+            heapq.heappush(min_heap, (similarity, item))
+        elif similarity > min_heap[0][0]:
+            heapq.heapreplace(min_heap, (similarity, item))
+    return [item.id for score, item in sorted(min_heap, reverse=True)]
+
+def batch_find_top_similar(source_vector, items_and_vectors:list[tuple], top_k:int=3):
+    engine = SimilarityMatrix.from_items_and_vectors(items_and_vectors)
+    return [item.id for item, score in engine.top_k(source_vector, top_k)]
+
+class Command(BaseCommand):
+    help = '코사인 유사도 상위 k개 계산의 기존(후보별 sklearn 호출) 구현과 배치 엔진의 속도를 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000], help='후보 개수')
+        parser.add_argument('--dim', type=int, default=300, help='벡터 차원')
+        parser.add_argument('--top-k', type=int, default=3)
+        parser.add_argument('--repeat', type=int, default=3, help='배치 엔진 반복 측정 횟수')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options['seed'])
+        dim, top_k = options['dim'], options['top_k']
+
+        for size in options['sizes']:
+            vectors = rng.standard_normal((size, dim), dtype=np.float32)
+            items_and_vectors = [(Item(i), vectors[i]) for i in range(size)]
+            source_vector = rng.standard_normal(dim, dtype=np.float32)
+
+            started = time.perf_counter()
+            legacy_ids = legacy_find_top_similar(source_vector, items_and_vectors, top_k)
+            legacy_sec = time.perf_counter() - started
+
+            batch_sec = float('inf')
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                batch_ids = batch_find_top_similar(source_vector, items_and_vectors, top_k)
+                batch_sec = min(batch_sec, time.perf_counter() - started)
+
+            # 행렬을 미리 쌓아 둔 경우(저장소에서 한 번에 불러온 경우)의 점수 계산 시간
+            engine = SimilarityMatrix.from_items_and_vectors(items_and_vectors)
+            started = time.perf_counter()
+            engine.top_k(source_vector, top_k)
+            score_sec = time.perf_counter() - started
+
+            self.stdout.write(
+                f'n={size:>7,} legacy={legacy_sec*1000:9.1f}ms '
+                f'batch={batch_sec*1000:7.1f}ms (score only {score_sec*1000:6.2f}ms) '
+                f'speedup=x{legacy_sec / batch_sec:,.0f} same_ids={legacy_ids == batch_ids}'
+            )
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from recommendations.loaders import build_reduced_fasttext_model
+
+class Command(BaseCommand):
+    help = '원본 FastText 모델(cc.ko.300)의 차원을 축소한 cc.ko.{dim}.bin 모델을 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dim', type=int, default=None, help='축소 차원 (기본값: FASTTEXT_REDUCED_DIM)')
+
+    def handle(self, *args, **options):
+        dim = options['dim'] or settings.FASTTEXT_REDUCED_DIM
+        self.stdout.write(f'cc.ko.300 → {dim}차원 축소 중...')
+        model_path = build_reduced_fasttext_model(dim)
+        self.stdout.write(f'saved: {model_path}')
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from recommendations.management.build_tfidf_index import build_tfidf_index
+from recommendations.tfidf import TFIDF_N_FEATURES
+
+class Command(BaseCommand):
+    help = '모든 제안글의 명사 토큰으로 TF-IDF 추천 인덱스(recommendations/tfidf_index.npz)를 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000, help='한 번에 토큰화할 제안글 수')
+        parser.add_argument('--n-features', type=int, default=TFIDF_N_FEATURES, help='해시 공간 크기')
+
+    def handle(self, *args, **options):
+        total = build_tfidf_index(chunk_size=options['chunk_size'], n_features=options['n_features'])
+        self.stdout.write(f'indexed: {total}')
@@ -0,0 +1,154 @@
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from proposals.models import Proposal
+from recommendations.services import AI
+from recommendations.loaders import ai_models, get_fasttext_model_name, get_fasttext_model_path, get_word_vectors_dir, load_fasttext_model
+from recommendations.similarity import EmbeddingMatrix
+
+def _rss_mb() -> float:
+    '''
+    현재 프로세스의 RSS(MB). /proc이 없는 환경에서는 0을 반환합니다.
+    '''
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _artifact_mb(name:str, backend:str) -> float:
+    '''
+    백엔드가 실제로 불러오는 파일의 크기(MB) (`fasttext`: `.bin`, `mmap`: `{name}.vectors/` 전체)
+    '''
+    if backend == 'mmap':
+        directory = get_word_vectors_dir(name)
+        paths = [os.path.join(directory, file) for file in os.listdir(directory)]
+    else:
+        paths = [get_fasttext_model_path(name)]
+    return sum(os.path.getsize(path) for path in paths) / 1024 / 1024
+
+class Command(BaseCommand):
+    help = (
+        '원본 모델과 축소 모델의 파일 크기, 메모리, 로드 시간, 제안글 유사도 상위 k개 겹침을 비교합니다. '
+        '(모델마다 새 프로세스에서 측정)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dim', type=int, default=None, help='축소 차원 (기본값: FASTTEXT_REDUCED_DIM)')
+        parser.add_argument('--sample', type=int, default=500, help='비교에 사용할 최신 제안글 수')
+        parser.add_argument('--top-k', type=int, default=3)
+        # 내부용: 한 모델만 현재 프로세스에서 측정해 `--output`에 저장
+        parser.add_argument('--measure', choices=['full', 'reduced'], help='(내부용) 측정할 모델 모드')
+        parser.add_argument('--output', help='(내부용) 측정 결과 .npz 경로')
+
+    def _texts(self, sample:int) -> list[tuple]:
+        return list(Proposal.objects.order_by('-id').values_list('id', 'title', 'content')[:sample])
+
+    def _measure(self, mode:str, dim:int, texts:list[tuple]) -> tuple[dict, dict]:
+        '''
+        현재 프로세스에서 모델을 불러와 측정합니다. (새 프로세스에서만 호출)
+        '''
+        backend = settings.FASTTEXT_BACKEND
+        # 형태소 분석기는 먼저 불러와 모델 메모리에 섞이지 않도록 함
+        ai_models.kiwi
+        rss_before, peak_before = _rss_mb(), _peak_rss_mb()
+        started = time.perf_counter()
+        model = load_fasttext_model(mode, dim)
+        load_sec = time.perf_counter() - started
+        rss_loaded = _rss_mb() - rss_before
+
+        ai = AI(model)
+        started = time.perf_counter()
+        vectors = dict()
+        for proposal_id, title, content in texts:
+            vector = ai.vectorize(' '.join([title, content]))
+            if vector is not None:
+                vectors[proposal_id] = vector
+        vectorize_sec = time.perf_counter() - started
+
+        name = get_fasttext_model_name(mode, dim)
+        return {
+            'name': name,
+            'backend': backend,
+            'file_mb': _artifact_mb(name, backend),
+            'rss_mb': rss_loaded,
+            'peak_rss_mb': _peak_rss_mb() - peak_before,
+            'load_sec': load_sec,
+            'vectorize_ms': vectorize_sec * 1000 / max(len(texts), 1),
+        }, vectors
+
+    def _measure_in_subprocess(self, mode:str, dim:int, sample:int) -> tuple[dict, dict]:
+        '''
+        앞서 불러온 모델의 메모리가 섞이지 않도록 모델마다 새 프로세스에서 측정합니다.
+        '''
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'result.npz')
+            completed = subprocess.run(
+                [
+                    sys.executable, os.path.join(settings.BASE_DIR, 'manage.py'), 'compare_fasttext_models',
+                    '--measure', mode, '--dim', str(dim), '--sample', str(sample), '--output', output,
+                ],
+                stdout=subprocess.DEVNULL,
+            )
+            if completed.returncode != 0:
+                raise CommandError(f'{mode} 모델 측정에 실패했어요. (exit {completed.returncode})')
+            with np.load(output) as f:
+                result = json.loads(str(f['result']))
+                vectors = dict(zip(f['ids'].tolist(), f['vectors']))
+        return result, vectors
+
+    def handle(self, *args, **options):
+        dim = options['dim'] or settings.FASTTEXT_REDUCED_DIM
+        top_k = options['top_k']
+
+        if options['measure']:
+            result, vectors = self._measure(options['measure'], dim, self._texts(options['sample']))
+            np.savez(
+                options['output'],
+                result=json.dumps(result),
+                ids=np.asarray(list(vectors), dtype=np.int64),
+                vectors=np.vstack(list(vectors.values())) if vectors else np.empty((0, 0), dtype=np.float32),
+            )
+            return
+
+        full, full_vectors = self._measure_in_subprocess('full', dim, options['sample'])
+        reduced, reduced_vectors = self._measure_in_subprocess('reduced', dim, options['sample'])
+
+        for result in (full, reduced):
+            self.stdout.write(
+                f"{result['name']:>10} ({result['backend']}): file={result['file_mb']:,.0f}MB "
+                f"rss=+{result['rss_mb']:,.0f}MB peak=+{result['peak_rss_mb']:,.0f}MB "
+                f"load={result['load_sec']:.1f}s vectorize={result['vectorize_ms']:.2f}ms/text"
+            )
+
+        ids = sorted(full_vectors.keys() & reduced_vectors.keys())
+        if len(ids) <= top_k:
+            self.stdout.write('비교할 제안글이 부족해요.')
+            return
+        full_neighbors = self._neighbors(full_vectors, ids, top_k)
+        reduced_neighbors = self._neighbors(reduced_vectors, ids, top_k)
+        overlap = np.mean([
+            len(full_neighbors[id] & reduced_neighbors[id]) / top_k
+            for id in ids
+        ])
+        self.stdout.write(f'top-{top_k} overlap (n={len(ids)}): {overlap:.3f}')
+
+    def _neighbors(self, vectors:dict, ids:list[int], top_k:int) -> dict[int, set]:
+        engine = EmbeddingMatrix.from_vectors({id: vectors[id] for id in ids}).to_similarity_matrix()
+        return {
+            id: set([key for key, _ in engine.top_k(vectors[id], top_k + 1) if key != id][:top_k])
+            for id in ids
+        }
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from recommendations.management.compute_proposal_cooccurrence import compute_proposal_cooccurrence
+
+class Command(BaseCommand):
+    help = '좋아요/스크랩 사용자×제안 행렬로 제안 동시 상호작용(XᵀX)을 다시 계산해 ProposalCooccurrence에 저장합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help='한 번에 저장할 행 수')
+
+    def handle(self, *args, **options):
+        total = compute_proposal_cooccurrence(batch_size=options['batch_size'])
+        self.stdout.write(f'saved: {total}')
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from recommendations.management.compute_proposal_neighbors import compute_proposal_neighbors
+
+class Command(BaseCommand):
+    help = '제안글마다 같은 업종에서 비슷한 제안 상위 N개를 계산해 ProposalNeighbor에 저장합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-n', type=int, default=10, help='제안글마다 저장할 이웃 수')
+        parser.add_argument('--batch-size', type=int, default=1024, help='한 번의 행렬 곱으로 계산할 제안글 수')
+
+    def handle(self, *args, **options):
+        total = compute_proposal_neighbors(top_n=options['top_n'], batch_size=options['batch_size'])
+        self.stdout.write(f'saved: {total}')
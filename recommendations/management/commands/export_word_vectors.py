@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from recommendations.loaders import export_fasttext_word_vectors
+
+class Command(BaseCommand):
+    help = 'FastText 모델의 단어 벡터를 워커끼리 mmap으로 공유할 수 있는 .npy 파일로 내보냅니다. (FASTTEXT_BACKEND=mmap)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--mode', choices=['full', 'reduced'], default=None, help='모델 모드 (기본값: FASTTEXT_MODEL_MODE)')
+        parser.add_argument('--dim', type=int, default=None, help='축소 차원 (기본값: FASTTEXT_REDUCED_DIM)')
+
+    def handle(self, *args, **options):
+        mode = options['mode'] or settings.FASTTEXT_MODEL_MODE
+        self.stdout.write(f'{mode} 모델 단어 벡터 내보내는 중...')
+        vectors_dir = export_fasttext_word_vectors(mode, options['dim'])
+        self.stdout.write(f'saved: {vectors_dir}')
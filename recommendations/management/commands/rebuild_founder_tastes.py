@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from recommendations.management.rebuild_founder_tastes import rebuild_founder_tastes
+
+class Command(BaseCommand):
+    help = '창업자 취향 벡터를 스크랩한 제안 전체의 저장된 임베딩으로 다시 만듭니다. (증분 갱신 오차 보정, 모델 변경 뒤 재계산용)'
+
+    def handle(self, *args, **options):
+        total = rebuild_founder_tastes()
+        self.stdout.write(f'rebuilt: {total}')
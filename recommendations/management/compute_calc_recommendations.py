@@ -0,0 +1,37 @@
+from __future__ import annotations
+import logging
+from django.http import HttpRequest
+from rest_framework.exceptions import PermissionDenied
+from accounts.models import Founder
+from recommendations.models import FounderCalcRecommendation
+from recommendations.services import RecommendationCalcService
+
+logger = logging.getLogger("recommendations.crons")
+
+def compute_founder_calc_recommendation(founder: Founder) -> list[int] | None:
+    """
+    창업자 한 명의 계산식 추천 순위를 계산해 저장합니다.
+    우리동네/관심 업종이 없어 추천할 수 없으면 저장된 순위를 지우고 None을 반환합니다.
+    """
+    request = HttpRequest()
+    request.user = founder.user
+    try:
+        service = RecommendationCalcService(request)
+        return service.refresh_calc_recommendation()
+    except PermissionDenied:
+        FounderCalcRecommendation.objects.filter(founder=founder).delete()
+        return None
+
+def compute_calc_recommendations() -> int:
+    """
+    모든 창업자의 우리동네 기준 계산식 추천 순위를 계산해 FounderCalcRecommendation에 저장합니다.
+
+    Returns:
+        순위를 저장한 창업자 수
+    """
+    saved = 0
+    for founder in Founder.objects.select_related("user").iterator(chunk_size=500):
+        if compute_founder_calc_recommendation(founder) is not None:
+            saved += 1
+    logger.info("[compute_calc_recommendations] founders=%s", saved)
+    return saved
@@ -0,0 +1,44 @@
+from __future__ import annotations
+import logging
+import numpy as np
+from proposals.models import Proposal
+from recommendations.loaders import ai_models
+from recommendations.services import AI, ProposalEmbeddingStore, ProposalVectorLookup, FundingSuccessCentroidStore
+from recommendations.similarity import stack_normalized, normalize_vector
+from utils.choices import FundingStatusChoices
+
+logger = logging.getLogger("recommendations.crons")
+
+def compute_funding_success_centroids() -> int:
+    """
+    펀딩에 성공(SUCCEEDED)한 제안들의 업종별 중심 벡터(정규화 벡터 평균)를 계산해 저장합니다.
+    저장소에 없는 제안 벡터는 계산해 함께 저장합니다.
+
+    Returns:
+        중심을 저장한 업종 수
+    """
+    fasttext_model = ai_models.fasttext
+    if fasttext_model is None or ai_models.kiwi is None:
+        raise RuntimeError("AI 모델을 불러오지 못했어요.")
+
+    lookup = ProposalVectorLookup(AI(fasttext_model), ProposalEmbeddingStore())
+    industries = dict(Proposal.objects.filter(
+        funding__status=FundingStatusChoices.SUCCEEDED,
+    ).values_list("id", "industry"))
+    vectors, _ = lookup.get_many(industries)
+
+    by_industry: dict[str, list[np.ndarray]] = {}
+    for proposal_id, vector in vectors.items():
+        by_industry.setdefault(industries[proposal_id], []).append(vector)
+
+    centroids = {
+        industry: (normalize_vector(stack_normalized(industry_vectors).mean(axis=0)), len(industry_vectors))
+        for industry, industry_vectors in by_industry.items()
+    }
+    saved = FundingSuccessCentroidStore(lookup.store.model_name).replace_all(centroids)
+
+    logger.info(
+        "[compute_funding_success_centroids] proposals=%s, industries=%s",
+        len(vectors), {industry: count for industry, (_, count) in centroids.items()},
+    )
+    return saved
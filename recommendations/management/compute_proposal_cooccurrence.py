@@ -0,0 +1,64 @@
+from __future__ import annotations
+import logging
+import numpy as np
+from scipy import sparse
+from django.db import transaction
+from proposals.models import ProposerLikeProposal, ProposerScrapProposal, FounderScrapProposal
+from recommendations.models import ProposalCooccurrence
+from recommendations.services import ProposalCooccurrenceStore
+
+logger = logging.getLogger("recommendations.crons")
+
+def compute_proposal_cooccurrence(batch_size: int = 5000) -> int:
+    """
+    좋아요/스크랩으로 사용자(계정)×제안 희소 행렬 X를 만들고 C = XᵀX를 한 번의 희소 행렬 곱으로 계산해
+    대각 외 0이 아닌 값을 ProposalCooccurrence에 통째로 다시 저장합니다.
+    백그라운드 `recompute`와 같은 잠금을 먼저 잡고 상호작용을 읽으므로, 그동안 생긴 상호작용은 잠금이 풀린 뒤 `recompute`가 반영합니다.
+
+    Args:
+        batch_size: 한 번에 저장할 행 수
+
+    Returns:
+        저장한 (제안, 제안) 쌍 수
+    """
+    with transaction.atomic():
+        ProposalCooccurrenceStore.lock()
+        interactions = [
+            row
+            for model in (ProposerLikeProposal, ProposerScrapProposal, FounderScrapProposal)
+            for row in model.objects.values_list("user__user_id", "proposal_id").iterator(chunk_size=batch_size)
+        ]
+        if interactions:
+            user_ids, proposal_ids = zip(*interactions)
+        else:
+            user_ids, proposal_ids = (), ()
+        user_rows = np.unique(np.asarray(user_ids, dtype=object), return_inverse=True)[1] if user_ids else np.empty(0, dtype=np.intp)
+        columns, proposal_cols = np.unique(np.asarray(proposal_ids, dtype=np.int64), return_inverse=True)
+
+        # 같은 (사용자, 제안) 중복은 더해져 상호작용 수가 됨
+        x = sparse.csr_matrix(
+            (np.ones(len(interactions), dtype=np.int32), (user_rows, proposal_cols)),
+            shape=(int(user_rows.max()) + 1 if len(user_rows) else 0, len(columns)),
+        )
+        cooccurrence = (x.T @ x).tocoo()
+        off_diagonal = cooccurrence.row != cooccurrence.col
+        rows = columns[cooccurrence.row[off_diagonal]]
+        others = columns[cooccurrence.col[off_diagonal]]
+        counts = cooccurrence.data[off_diagonal]
+
+        ProposalCooccurrence.objects.all().delete()
+        for start in range(0, len(counts), batch_size):
+            ProposalCooccurrence.objects.bulk_create([
+                ProposalCooccurrence(proposal_id=int(proposal_id), other_id=int(other_id), count=int(count))
+                for proposal_id, other_id, count in zip(
+                    rows[start:start + batch_size],
+                    others[start:start + batch_size],
+                    counts[start:start + batch_size],
+                )
+            ])
+
+    logger.info(
+        "[compute_proposal_cooccurrence] users=%s, proposals=%s, interactions=%s, pairs=%s",
+        x.shape[0], x.shape[1], len(interactions), len(counts),
+    )
+    return len(counts)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+import logging
+from django.utils import timezone
+from proposals.models import Proposal
+from recommendations.models import ProposalNeighbor
+from recommendations.services import ProposalEmbeddingStore
+from recommendations.similarity import batched_top_k_neighbors, normalize_rows
+from utils.choices import IndustryChoices
+
+logger = logging.getLogger("recommendations.crons")
+
+def compute_proposal_neighbors(top_n: int = 10, batch_size: int = 1024) -> int:
+    """
+    제안글마다 같은 업종에서 임베딩 코사인 유사도가 높은 상위 `top_n`개 제안을 계산해 ProposalNeighbor에 저장합니다.
+    업종별 임베딩 행렬을 한 번에 불러와 `batch_size`행씩 행렬 곱으로 계산하고, 배치마다 한 번의 upsert로 저장합니다.
+    이번 실행에서 갱신되지 않은 행(임베딩이 없어졌거나 모델이 바뀐 제안)은 지웁니다.
+
+    Returns:
+        이웃을 저장한 제안글 수
+    """
+    store = ProposalEmbeddingStore()
+    started_at = timezone.now()
+    saved = 0
+    for industry in IndustryChoices.values:
+        embeddings = store.load_matrix(Proposal.objects.filter(industry=industry))
+        if not len(embeddings):
+            continue
+        matrix = normalize_rows(embeddings.matrix.copy())
+        for start, neighbors, scores in batched_top_k_neighbors(matrix, top_n, batch_size):
+            rows = [
+                ProposalNeighbor(
+                    proposal_id=int(embeddings.ids[start + i]),
+                    model_name=store.model_name,
+                    neighbor_ids=embeddings.ids[neighbors[i]].tolist(),
+                    scores=scores[i].round(6).tolist(),
+                )
+                for i in range(neighbors.shape[0])
+            ]
+            ProposalNeighbor.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["proposal"],
+                update_fields=["model_name", "neighbor_ids", "scores", "updated_at"],
+            )
+            saved += len(rows)
+        logger.info("[compute_proposal_neighbors] industry=%s, proposals=%s", industry, len(embeddings))
+
+    deleted, _ = ProposalNeighbor.objects.filter(updated_at__lt=started_at).delete()
+    logger.info("[compute_proposal_neighbors] model=%s, saved=%s, deleted=%s", store.model_name, saved, deleted)
+    return saved
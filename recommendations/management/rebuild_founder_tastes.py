@@ -0,0 +1,29 @@
+from __future__ import annotations
+import logging
+from django.db.models import Q
+from accounts.models import Founder
+from recommendations.services import FounderTasteStore, ProposalEmbeddingStore, ProposalVectorLookup
+
+logger = logging.getLogger("recommendations.crons")
+
+def rebuild_founder_tastes() -> int:
+    """
+    취향 벡터가 있거나 스크랩한 제안이 있는 모든 창업자의 취향 벡터를 스크랩한 제안 전체로 다시 만듭니다.
+      - 스크랩마다 더하고 빼며 쌓인 부동소수점 오차와 유실된 백그라운드 갱신을 바로잡습니다.
+      - 그동안 임베딩이 없어 빠졌던 스크랩 제안도 반영합니다. (저장된 벡터만 사용, 벡터화 없음)
+      - 버전이 올라가므로 캐싱된 스크랩 기반 추천은 다음 요청에서 다시 계산됩니다.
+
+    Returns:
+        다시 만든 창업자 수
+    """
+    taste_store = FounderTasteStore()
+    lookup = ProposalVectorLookup(None, ProposalEmbeddingStore())
+    founders = Founder.objects.filter(
+        Q(taste_vector__isnull=False) | Q(founder_scrap_proposal__isnull=False)
+    ).distinct()
+    rebuilt = 0
+    for founder in founders.iterator(chunk_size=500):
+        taste_store.rebuild(founder, lookup)
+        rebuilt += 1
+    logger.info("[rebuild_founder_tastes] founders=%s", rebuilt)
+    return rebuilt
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('proposals', '0002_alter_proposal_position'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProposalEmbedding',
+            fields=[
+                ('proposal', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='embedding', serialize=False, to='proposals.proposal')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('model_name', models.CharField(help_text='벡터를 계산한 임베딩 모델 이름 (예: cc.ko.300)', max_length=50)),
+                ('dimension', models.PositiveSmallIntegerField(help_text='벡터 차원 (유효한 벡터가 없으면 0)')),
+                ('vector', models.BinaryField(help_text='float32 벡터의 바이트열 (유효한 벡터가 없으면 빈 값)')),
+            ],
+        ),
+    ]
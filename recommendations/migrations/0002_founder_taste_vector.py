@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('recommendations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FounderTasteVector',
+            fields=[
+                ('founder', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='taste_vector', serialize=False, to='accounts.founder')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('model_name', models.CharField(help_text='벡터를 계산한 임베딩 모델 이름 (예: cc.ko.300)', max_length=50)),
+                ('dimension', models.PositiveSmallIntegerField(help_text='벡터 차원 (스크랩한 제안의 유효한 벡터가 없으면 0)')),
+                ('vector_sum', models.BinaryField(help_text='스크랩한 제안 벡터 합의 float32 바이트열')),
+                ('count', models.PositiveIntegerField(default=0, help_text='합에 포함된 스크랩 제안 수')),
+                ('version', models.PositiveIntegerField(default=0, help_text='벡터가 바뀔 때마다 1씩 증가 (추천 결과 캐시 무효화에 사용)')),
+            ],
+        ),
+    ]
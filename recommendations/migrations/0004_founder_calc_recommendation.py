@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:45
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('recommendations', '0003_funding_success_centroid'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FounderCalcRecommendation',
+            fields=[
+                ('founder', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='calc_recommendation', serialize=False, to='accounts.founder')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('proposal_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), default=list, help_text='창업자 우리동네 기준 계산식 점수 순 추천 제안 id', size=None)),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:55
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0002_alter_proposal_position'),
+        ('recommendations', '0004_founder_calc_recommendation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProposalNeighbor',
+            fields=[
+                ('proposal', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='neighbor', serialize=False, to='proposals.proposal')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('model_name', models.CharField(help_text='벡터를 계산한 임베딩 모델 이름 (예: cc.ko.300)', max_length=50)),
+                ('neighbor_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), default=list, help_text='같은 업종에서 코사인 유사도 순 비슷한 제안 id', size=None)),
+                ('scores', django.contrib.postgres.fields.ArrayField(base_field=models.FloatField(), default=list, help_text='`neighbor_ids`와 같은 순서의 코사인 유사도', size=None)),
+            ],
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0002_alter_proposal_position'),
+        ('recommendations', '0005_proposal_neighbor'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProposalCooccurrence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.IntegerField(default=0, help_text='두 제안에 모두 좋아요/스크랩한 사용자 상호작용 수 (사용자×제안 행렬 X에 대해 XᵀX의 값)')),
+                ('other', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='proposals.proposal')),
+                ('proposal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cooccurrence', to='proposals.proposal')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('proposal', 'other'), name='unique_proposal_cooccurrence')],
+            },
+        ),
+    ]
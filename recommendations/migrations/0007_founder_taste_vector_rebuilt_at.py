@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 01:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0006_proposal_cooccurrence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foundertastevector',
+            name='rebuilt_at',
+            field=models.DateTimeField(blank=True, help_text='스크랩한 제안 전체로 다시 만든 시각 (이전에 커밋된 스크랩/스크랩 취소는 이미 반영됨)', null=True),
+        ),
+    ]
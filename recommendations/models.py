@@ -1,3 +1,164 @@
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from utils.choices import IndustryChoices
 
-# Create your models here.
+class ProposalEmbedding(models.Model):
+    proposal = models.OneToOneField(
+        'proposals.Proposal',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='embedding',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+    model_name = models.CharField(
+        max_length=50,
+        help_text='벡터를 계산한 임베딩 모델 이름 (예: cc.ko.300)',
+    )
+    dimension = models.PositiveSmallIntegerField(
+        help_text='벡터 차원 (유효한 벡터가 없으면 0)',
+    )
+    vector = models.BinaryField(
+        help_text='float32 벡터의 바이트열 (유효한 벡터가 없으면 빈 값)',
+    )
+
+    def __str__(self):
+        return f'{self.proposal_id} 제안글의 {self.model_name} 임베딩'
+
+class FounderTasteVector(models.Model):
+    founder = models.OneToOneField(
+        'accounts.Founder',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='taste_vector',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+    model_name = models.CharField(
+        max_length=50,
+        help_text='벡터를 계산한 임베딩 모델 이름 (예: cc.ko.300)',
+    )
+    dimension = models.PositiveSmallIntegerField(
+        help_text='벡터 차원 (스크랩한 제안의 유효한 벡터가 없으면 0)',
+    )
+    vector_sum = models.BinaryField(
+        help_text='스크랩한 제안 벡터 합의 float32 바이트열',
+    )
+    count = models.PositiveIntegerField(
+        default=0,
+        help_text='합에 포함된 스크랩 제안 수',
+    )
+    version = models.PositiveIntegerField(
+        default=0,
+        help_text='벡터가 바뀔 때마다 1씩 증가 (추천 결과 캐시 무효화에 사용)',
+    )
+    rebuilt_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='스크랩한 제안 전체로 다시 만든 시각 (이전에 커밋된 스크랩/스크랩 취소는 이미 반영됨)',
+    )
+
+    def __str__(self):
+        return f'{self.founder_id} 창업자의 취향 벡터 (v{self.version})'
+
+class FundingSuccessCentroid(models.Model):
+    industry = models.CharField(
+        max_length=24,
+        choices=IndustryChoices.choices,
+        primary_key=True,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+    model_name = models.CharField(
+        max_length=50,
+        help_text='벡터를 계산한 임베딩 모델 이름 (예: cc.ko.300)',
+    )
+    dimension = models.PositiveSmallIntegerField(
+        help_text='벡터 차원',
+    )
+    vector = models.BinaryField(
+        help_text='펀딩에 성공한 제안 벡터(정규화)의 평균을 정규화한 float32 바이트열',
+    )
+    count = models.PositiveIntegerField(
+        help_text='중심 계산에 사용한 펀딩 성공 제안 수',
+    )
+
+    def __str__(self):
+        return f'{self.get_industry_display()} 업종 펀딩 성공 중심 ({self.count}개)'
+
+class FounderCalcRecommendation(models.Model):
+    founder = models.OneToOneField(
+        'accounts.Founder',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='calc_recommendation',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+    proposal_ids = ArrayField(
+        base_field=models.BigIntegerField(),
+        default=list,
+        help_text='창업자 우리동네 기준 계산식 점수 순 추천 제안 id',
+    )
+
+    def __str__(self):
+        return f'{self.founder_id} 창업자의 계산식 추천 ({len(self.proposal_ids)}개)'
+
+class ProposalNeighbor(models.Model):
+    proposal = models.OneToOneField(
+        'proposals.Proposal',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='neighbor',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+    model_name = models.CharField(
+        max_length=50,
+        help_text='벡터를 계산한 임베딩 모델 이름 (예: cc.ko.300)',
+    )
+    neighbor_ids = ArrayField(
+        base_field=models.BigIntegerField(),
+        default=list,
+        help_text='같은 업종에서 코사인 유사도 순 비슷한 제안 id',
+    )
+    scores = ArrayField(
+        base_field=models.FloatField(),
+        default=list,
+        help_text='`neighbor_ids`와 같은 순서의 코사인 유사도',
+    )
+
+    def __str__(self):
+        return f'{self.proposal_id} 제안의 비슷한 제안 ({len(self.neighbor_ids)}개)'
+
+class ProposalCooccurrence(models.Model):
+    proposal = models.ForeignKey(
+        'proposals.Proposal',
+        on_delete=models.CASCADE,
+        related_name='cooccurrence',
+    )
+    other = models.ForeignKey(
+        'proposals.Proposal',
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    count = models.IntegerField(
+        default=0,
+        help_text='두 제안에 모두 좋아요/스크랩한 사용자 상호작용 수 (사용자×제안 행렬 X에 대해 XᵀX의 값)',
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['proposal', 'other'],
+                name='unique_proposal_cooccurrence',
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.proposal_id} - {self.other_id} 제안 동시 상호작용 ({self.count})'
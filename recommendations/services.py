@@ -1,28 +1,37 @@
 import os
+import logging
+import time
+from collections import Counter
 from typing import Literal, Optional, Dict, Any, Set, List
-import heapq
 import re
 import numpy as np
+from scipy import sparse
 from dataclasses import dataclass
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import Case, Count, OuterRef, Q, Subquery, Value, When, BooleanField, IntegerField
-from django.db.models.functions import Coalesce
+from django.db import connection, transaction
+from django.db.models import Case, Count, F, Func, OuterRef, Q, Subquery, Sum, Value, When, BooleanField, CharField, FloatField, IntegerField
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast, Coalesce, Greatest, Least, NullIf, Round
+from django.db.models.lookups import GreaterThan, GreaterThanOrEqual
 from django.http import HttpRequest
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError, NotFound, APIException, PermissionDenied
-from kiwipiepy import Kiwi
-import fasttext
-import fasttext.util
-from sklearn.metrics.pairwise import cosine_similarity
 from utils.choices import ProfileChoices, FounderTargetChoices
 from utils.constants import CacheKey
 from utils.decorators.service import require_profile
-from utils.times import _parse_hhmm, _minutes_between, _overlap_minutes
+from utils.times import _parse_hhmm, _minutes_between
 from accounts.models import ProposerLevel
-from proposals.models import Proposal
+from proposals.models import Proposal, ProposerLikeProposal, ProposerScrapProposal, FounderScrapProposal
 from proposals.serializers import ProposalListSerializer
+from .indexes import proposal_ann_index, proposal_candidate_index, proposal_tfidf_index
+from .tasks import background_tasks
+from .loaders import ai_models, get_fasttext_model_name, get_recommendation_engine
+from .models import ProposalEmbedding, FounderTasteVector, FundingSuccessCentroid, FounderCalcRecommendation, ProposalNeighbor, ProposalCooccurrence
+from .similarity import EmbeddingMatrix
+
+logger = logging.getLogger(__name__)
 
-kiwi = Kiwi()
 korean_stopwords = [
     # 의미 없는 의존명사 및 단위
     '것', '수', '때', '곳', '점', '바', '위', '아래', '중', '등', '등등', '전', '후', 
@@ -39,57 +48,27 @@ korean_stopwords = [
     '하나', '둘', '셋', '넷', '다섯'
 ]
 
-def download_fasttext_model(lang='ko'):
-    """
-    FastText 사전훈련 모델을 다운로드합니다.
-    """
-    try:
-        # 모델 저장 경로 설정
-        model_dir = os.path.join(settings.BASE_DIR, 'recommendations')
-        os.makedirs(model_dir, exist_ok=True)
-
-        # 현재 작업 디렉토리를 모델 디렉토리로 변경
-        original_dir = os.getcwd()
-        os.chdir(model_dir)
-
-        # 모델 다운로드 (약 7GB for Korean)
-        print(f"{lang} 모델 다운로드 중...")
-        fasttext.util.download_model(lang, if_exists='ignore')
-
-        # 원래 디렉토리로 복원
-        os.chdir(original_dir)
-
-        # 모델 파일 경로 반환
-        model_path = os.path.join(model_dir, f'cc.{lang}.300.bin')
-        return model_path
-
-    except Exception as e:
-        print(f"모델 다운로드 실패: {e}")
-        os.chdir(original_dir)  # 오류 시에도 디렉토리 복원
-        return None
-
-try:
-    model_path = os.path.join(settings.BASE_DIR, 'recommendations', 'cc.ko.300.bin')
-    if not os.path.exists(model_path):
-        model_path = download_fasttext_model('ko')
-    fasttext_model = fasttext.load_model(model_path)
-except Exception as e:
-    print(f"모델 로드 실패: {e}")
-    fasttext_model = None
+FASTTEXT_MODEL_NAME = get_fasttext_model_name()
 
 class AI:
-    def __init__(self, model):
+    def __init__(self, model, kiwi=None):
         self.model = model
+        self._kiwi = kiwi
 
-    def _preprocess_and_tokenize(self, text:str):
+    @property
+    def kiwi(self):
+        return self._kiwi or ai_models.kiwi
+
+    def _clean(self, text:str) -> str:
         """
-        한국어 텍스트를 전처리하고 명사만 추출하여 토큰화합니다.
+        한글과 띄어쓰기 외 모든 문자를 제거합니다.
+        """
+        return re.sub(r'[^가-힣\s]', '', text)
+
+    def _filter_tokens(self, tokens) -> list[str]:
+        """
+        명사만 남기고 한 글자 단어와 불용어를 제거합니다.
         """
-        # 한글과 띄어쓰기 외 모든 문자 제거
-        text = re.sub(r'[^가-힣\s]', '', text)
-        # 명사 추출
-        tokens = kiwi.tokenize(text)
-        # 불용어 제거
         filtered_tokens = list()
         for token in tokens:
             if ((token.tag.startswith('N'))
@@ -99,12 +78,13 @@ class AI:
 
         return filtered_tokens
 
-    def vectorize(self, text:str):
+    def _preprocess_and_tokenize(self, text:str):
         """
-        내용을 FastText 벡터로 변환합니다.
+        한국어 텍스트를 전처리하고 명사만 추출하여 토큰화합니다.
         """
-        tokens = self._preprocess_and_tokenize(text)
+        return self._filter_tokens(self.kiwi.tokenize(self._clean(text)))
 
+    def _vectorize_tokens(self, tokens:list[str]):
         # 토큰화된 단어들 중 모델에 존재하는 단어만 추출
         vectors = [self.model.get_word_vector(word) for word in tokens]
         if not vectors:
@@ -113,100 +93,321 @@ class AI:
         # 단어 벡터들의 평균을 게시물 벡터로 사용
         return np.mean(vectors, axis=0)
 
-    def find_top_similar(self, source_vector, items_and_vectors:list[tuple], top_k:int=3):
-        min_heap = list()
-
-        for item, vector in items_and_vectors:
-            similarity = cosine_similarity(
-                source_vector.reshape(1, -1),
-                vector.reshape(1, -1),
-            )[0][0]
+    def vectorize(self, text:str):
+        """
+        내용을 FastText 벡터로 변환합니다.
+        """
+        return self._vectorize_tokens(self._preprocess_and_tokenize(text))
 
-            if len(min_heap) < top_k:
-                heapq.heappush(min_heap, (similarity, item))
-            elif similarity > min_heap[0][0]:
-                heapq.heapreplace(min_heap, (similarity, item))
+    def tokenize_many(self, texts:list[str]) -> list[list[str]]:
+        """
+        여러 내용을 Kiwi 작업 스레드로 한꺼번에 토큰화해 명사 토큰 목록들을 반환합니다.
+        """
+        if not texts:
+            return list()
+        return [self._filter_tokens(tokens) for tokens in self.kiwi.tokenize([self._clean(text) for text in texts])]
 
-        return [item.id for score, item in sorted(min_heap, reverse=True)]
+    def vectorize_many(self, texts:list[str]) -> list[Optional[np.ndarray]]:
+        """
+        여러 내용을 한 번에 FastText 벡터로 변환합니다.
+        Kiwi에 텍스트 목록을 넘겨 Kiwi 작업 스레드(`KIWI_NUM_WORKERS`)로 한꺼번에 토큰화합니다.
+        Returns:
+            vectors (list): `texts`와 같은 순서의 벡터 (유효한 벡터가 없으면 None)
+        """
+        if not texts:
+            return list()
+        started = time.perf_counter()
+        vectors = [self._vectorize_tokens(tokens) for tokens in self.tokenize_many(texts)]
+        elapsed = time.perf_counter() - started
+        logger.info(
+            'vectorize_many: texts=%s, %.2fs (%.1f texts/sec)',
+            len(texts), elapsed, len(texts) / elapsed if elapsed else float('inf'),
+        )
+        return vectors
 
-class RecommendationScrapService:
-    def __init__(self, request:HttpRequest):
-        self.request = request
+class TfidfAI(AI):
+    """
+    FastText 대신 `TfidfIndex`로 벡터화하는 경량 엔진 (`RECOMMENDATION_ENGINE='tfidf'`)
+    `vectorize`/`vectorize_many`는 정규화된 1행 TF-IDF 희소 행렬을 반환합니다.
+    """
+    def _vectorize_tokens(self, tokens:list[str]):
+        row = self.model.transform([tokens])
+        if not row.nnz:
+            return None
+        return row
 
-        if not fasttext_model:
-            raise APIException('AI 모델을 불러오지 못했어요. 관리자에게 문의하세요.')
-        self.ai = AI(fasttext_model)
-    
-    def _cache_key_proposal(self, proposal_id):
-        return CacheKey.PROPOSAL_VECTOR.format(proposal_id=proposal_id)
-
-    def _calc_vectors(self, cache_key_method, posts, option:Literal['vector']|None=None):
-        valid_vectors = list()
-        for post in posts:
-            vector = cache.get(cache_key_method(post.id))
-            if vector is None: # 캐시가 없거나 유효한 벡터가 아닐 때
-                vector = self.ai.vectorize(' '.join([post.title, post.content])) # 게시물 벡터 계산
-                cache.set(cache_key_method(post.id), vector, timeout=365*24*60*60*1) # 수정 불가능하여 데이터가 변경되는 경우가 없으므로 1년 캐싱
-            if vector is not None: # 캐시 또는 새로 계산한 값이 유효한 벡터일 때
-                valid_vectors.append(vector if option == 'vector' else (post, vector))
-        return valid_vectors
+class ProposalEmbeddingStore:
+    """
+    제안글 임베딩 저장소 (`ProposalEmbedding` 테이블)
+      - 벡터는 float32 바이트열로 저장하고, 후보 전체를 한 번의 조회로 (n, dim) 행렬로 불러옵니다.
+      - 유효한 벡터가 없는 제안글(명사가 없는 글 등)은 빈 값으로 저장해 다시 계산하지 않습니다.
+      - 모델이 바뀌면 이름이 다른 행은 없는 것으로 취급합니다.
+    """
+    def __init__(self, model_name:str=FASTTEXT_MODEL_NAME):
+        self.model_name = model_name
 
-    @require_profile(ProfileChoices.founder)
-    def recommend_founder_scrap_proposal(self):
-        cached_result = cache.get(CacheKey.RECOMMENDED_PROPOSALS.format(
-            profile=ProfileChoices.founder.value,
-            user_id=self.request.user.id,
-        ))
-        if cached_result:
-            return cached_result
+    def _rows(self):
+        return ProposalEmbedding.objects.filter(model_name=self.model_name)
 
-        # 사용자가 스크랩한 최신 제안 10개 가져오기
-        scrapped_proposals = Proposal.objects.filter(
-            founder_scrap_proposal__user=self.request.user.founder,
-        ).order_by(
-            '-created_at',
-        )[:10]
-        if not scrapped_proposals:
-            raise NotFound('스크랩한 제안이 없어요.')
+    def get_many(self, proposal_ids) -> Dict[int, Optional[np.ndarray]]:
+        """
+        Returns:
+            vectors (dict): 저장된 제안글만 포함한 {proposal_id: vector}. 유효한 벡터가 없으면 값이 None
+        """
+        rows = self._rows().filter(proposal_id__in=list(proposal_ids)).values_list('proposal_id', 'vector')
+        return {
+            proposal_id: (np.frombuffer(vector, dtype=np.float32) if len(vector) else None)
+            for proposal_id, vector in rows
+        }
 
-        # 스크랩한 제안 벡터 계산하기
-        valid_scrapped_proposals_vectors = self._calc_vectors(
-            cache_key_method=self._cache_key_proposal,
-            posts=scrapped_proposals,
-            option='vector',
+    def load_matrix(self, proposals=None) -> EmbeddingMatrix:
+        """
+        유효한 벡터 전체(또는 `proposals` 쿼리셋에 속한 것)를 한 번의 조회로 행렬로 불러옵니다.
+        """
+        qs = self._rows().filter(dimension__gt=0)
+        if proposals is not None:
+            qs = qs.filter(proposal__in=proposals.values('id'))
+        rows = list(qs.values_list('proposal_id', 'dimension', 'vector'))
+        dim = rows[0][1] if rows else 0
+        return EmbeddingMatrix.from_buffers(
+            ids=[proposal_id for proposal_id, _, _ in rows],
+            buffers=[vector for _, _, vector in rows],
+            dim=dim,
         )
-        if not valid_scrapped_proposals_vectors:
-            raise ValidationError('스크랩한 제안의 내용이 유효하지 않아요.')
 
-        # 모든 유효한 벡터를 평균하여 대표 벡터 생성
-        source_vector = np.mean(valid_scrapped_proposals_vectors, axis=0)
+    def missing(self, proposals):
+        """
+        현재 모델의 임베딩이 저장되지 않은 제안글 쿼리셋
+        """
+        return proposals.exclude(embedding__model_name=self.model_name)
 
-        # 스크랩한 제안 또는 펀딩 있는 제안 제외 + 업종 필터링
-        proposals = Proposal.objects.exclude(
-            Q(founder_scrap_proposal__user=self.request.user.founder)
-            | Q(funding__isnull=False)
-        ).filter_user_industry(
-            self.request.user,
-            ProfileChoices.founder.value,
+    def put_many(self, vectors:Dict[int, Optional[np.ndarray]]) -> int:
+        """
+        {proposal_id: vector}를 한 번의 upsert로 저장합니다. vector가 None이면 빈 값으로 저장합니다.
+        같은 모델로 다시 계산한 경우 예전 벡터가 조회되지 않도록 캐싱된 벡터(`PROPOSAL_VECTOR`)도 지웁니다.
+        """
+        rows = list()
+        for proposal_id, vector in vectors.items():
+            vector = None if vector is None else np.asarray(vector, dtype=np.float32)
+            rows.append(ProposalEmbedding(
+                proposal_id=proposal_id,
+                model_name=self.model_name,
+                dimension=0 if vector is None else vector.shape[0],
+                vector=b'' if vector is None else vector.tobytes(),
+            ))
+        ProposalEmbedding.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['proposal'],
+            update_fields=['model_name', 'dimension', 'vector', 'updated_at'],
         )
+        cache.delete_many([
+            CacheKey.PROPOSAL_VECTOR.format(model_name=self.model_name, proposal_id=proposal_id)
+            for proposal_id in vectors
+        ])
+        return len(rows)
+
+@dataclass
+class VectorLookupStats:
+    requested: int = 0
+    cache_hits: int = 0
+    store_hits: int = 0
+    computed: int = 0
+    pending: int = 0
+
+    @property
+    def cache_misses(self) -> int:
+        return self.requested - self.cache_hits
+
+class ProposalVectorLookup:
+    """
+    제안글 벡터 일괄 조회
+      1) 캐시: `cache.get_many` 1회
+      2) 저장소: 캐시에 없는 것만 `ProposalEmbeddingStore.get_many` 1회
+      3) 계산: 어디에도 없는 것만 제목/내용을 1회 조회해 벡터화한 뒤 저장소에 1회 저장
+         (`compute=False`면 계산하지 않고 `background_tasks.enqueue`에 넘긴 뒤 결과에서 제외)
+      4) 캐시에 없던 것은 `cache.set_many` 1회로 채움 (Redis pipeline)
+    유효한 벡터가 없는 제안글은 빈 배열로 캐싱해 다시 계산하지 않습니다.
+    """
+    timeout = 365*24*60*60*1 # 수정 불가능하여 데이터가 변경되는 경우가 없으므로 1년 캐싱
 
-        # 추천 후보군 제안 벡터 계산하기
-        valid_proposals_and_vectors = self._calc_vectors(
-            cache_key_method=self._cache_key_proposal,
-            posts=proposals,
-        )
+    def __init__(self, ai:Optional['AI'], store:ProposalEmbeddingStore):
+        self.ai = ai # `compute=False`로만 조회하면 None이어도 됨
+        self.store = store
 
-        # 코사인 유사도 계산 및 유사도 상위 3개 제안 구하기
-        top_recommended_proposal_id_list = self.ai.find_top_similar(
-            source_vector=source_vector,
-            items_and_vectors=valid_proposals_and_vectors,
+    def _cache_key(self, proposal_id) -> str:
+        return CacheKey.PROPOSAL_VECTOR.format(model_name=self.store.model_name, proposal_id=proposal_id)
+
+    def get_many(self, proposal_ids, compute:bool=True) -> tuple[Dict[int, np.ndarray], VectorLookupStats]:
+        """
+        Args:
+            proposal_ids: 제안글 id들
+            compute (bool): 어디에도 없는 벡터를 지금 계산할지 여부
+        Returns:
+            vectors (dict): 유효한 벡터만 포함한 {proposal_id: vector}
+            stats (VectorLookupStats): 캐시/저장소 적중, 계산 및 대기 개수
+        """
+        proposal_ids = list(dict.fromkeys(proposal_ids))
+        stats = VectorLookupStats(requested=len(proposal_ids))
+        if not proposal_ids:
+            return dict(), stats
+
+        keys = {self._cache_key(proposal_id): proposal_id for proposal_id in proposal_ids}
+        cached = cache.get_many(list(keys))
+        vectors = {keys[key]: vector for key, vector in cached.items() if vector is not None}
+        stats.cache_hits = len(vectors)
+
+        misses = [proposal_id for proposal_id in proposal_ids if proposal_id not in vectors]
+        to_cache = dict()
+        if misses:
+            stored = self.store.get_many(misses)
+            stats.store_hits = len(stored)
+            not_stored = [proposal_id for proposal_id in misses if proposal_id not in stored]
+            computed = dict()
+            if compute and not_stored:
+                texts = {
+                    proposal_id: ' '.join([title, content])
+                    for proposal_id, title, content in Proposal.objects.filter(
+                        id__in=not_stored,
+                    ).values_list('id', 'title', 'content')
+                }
+                computed = dict(zip(texts, self.ai.vectorize_many(list(texts.values()))))
+            elif not_stored:
+                background_tasks.enqueue(not_stored)
+                stats.pending = len(not_stored)
+            stats.computed = len(computed)
+            if computed:
+                self.store.put_many(computed)
+            for proposal_id, vector in {**stored, **computed}.items():
+                vector = np.empty(0, dtype=np.float32) if vector is None else vector
+                vectors[proposal_id] = vector
+                to_cache[self._cache_key(proposal_id)] = vector
+        if to_cache:
+            cache.set_many(to_cache, timeout=self.timeout)
+
+        logger.info(
+            'proposal vector lookup: requested=%s, cache_hits=%s, cache_misses=%s, store_hits=%s, computed=%s, pending=%s',
+            stats.requested, stats.cache_hits, stats.cache_misses, stats.store_hits, stats.computed, stats.pending,
         )
+        return {proposal_id: vector for proposal_id, vector in vectors.items() if vector.size}, stats
 
-        top_recommended_proposals = Proposal.objects.filter(
-            id__in=top_recommended_proposal_id_list
+class FounderTasteStore:
+    """
+    창업자 취향 벡터(스크랩한 제안 벡터의 합과 개수) 저장소
+    스크랩/스크랩 취소 때마다 합에 더하거나 빼서 갱신하고, 실제로 바뀔 때만 `version`을 올립니다.
+    `rebuild`는 시작 시각을 `rebuilt_at`에 남기고, `apply`는 그 전에 커밋된 변경을 건너뛰어
+    요청 경로의 `rebuild`와 백그라운드 `apply`가 같은 스크랩을 두 번 반영하지 않도록 합니다.
+    (남는 오차는 매일 밤 `rebuild_founder_tastes`가 바로잡음)
+    """
+    def __init__(self, model_name:str=FASTTEXT_MODEL_NAME):
+        self.model_name = model_name
+
+    def get(self, founder_id) -> Optional[FounderTasteVector]:
+        return FounderTasteVector.objects.filter(founder_id=founder_id, model_name=self.model_name).first()
+
+    def rebuild(self, founder, lookup:'ProposalVectorLookup') -> FounderTasteVector:
+        """
+        창업자가 스크랩한 모든 제안의 벡터로 취향 벡터를 다시 만듭니다.
+        요청 경로에서도 호출되므로 벡터화하지 않고 저장된 벡터만 사용합니다.
+        """
+        # 스크랩을 조회하기 전 시각 (이때까지 커밋된 스크랩은 모두 조회됨)
+        rebuilt_at = timezone.now()
+        scrapped_proposal_ids = Proposal.objects.filter(
+            founder_scrap_proposal__user=founder,
+        ).values_list('id', flat=True)
+        vectors, _ = lookup.get_many(scrapped_proposal_ids, compute=False)
+        # 같은 스크랩이면 매번 같은 바이트가 되도록 id 순으로 더함 (바뀌지 않으면 `version`을 올리지 않음)
+        vector_sum = np.sum([vectors[proposal_id] for proposal_id in sorted(vectors)], axis=0, dtype=np.float32) if vectors else np.empty(0, dtype=np.float32)
+        with transaction.atomic():
+            taste, _ = FounderTasteVector.objects.select_for_update().get_or_create(
+                founder=founder,
+                defaults={'model_name': self.model_name, 'dimension': 0, 'vector_sum': b''},
+            )
+            if taste.rebuilt_at and taste.rebuilt_at > rebuilt_at and taste.model_name == self.model_name:
+                # 더 최근에 다시 만든 결과를 덮어쓰지 않음
+                return taste
+            taste.rebuilt_at = rebuilt_at
+            self._save(taste, vector_sum, len(vectors), update_fields=['rebuilt_at'])
+        return taste
+
+    def apply(self, founder_id, vector:np.ndarray, delta:int, event_at=None) -> Optional[FounderTasteVector]:
+        """
+        취향 벡터에 스크랩한 제안 벡터를 더하거나(`delta=1`) 뺍니다(`delta=-1`).
+        Args:
+            event_at (datetime|None): 스크랩/스크랩 취소가 커밋된 시각 (`rebuilt_at` 이전이면 이미 반영되어 건너뜀)
+        Returns:
+            taste (FounderTasteVector|None): 현재 모델의 취향 벡터가 아직 없으면 None (`rebuild` 필요)
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        with transaction.atomic():
+            taste = FounderTasteVector.objects.select_for_update().filter(
+                founder_id=founder_id,
+                model_name=self.model_name,
+            ).first()
+            if taste is None:
+                return None
+            if event_at is not None and taste.rebuilt_at is not None and event_at <= taste.rebuilt_at:
+                return taste
+            vector_sum = self.vector_sum(taste)
+            vector_sum = vector_sum + delta * vector if vector_sum.size else delta * vector
+            self._save(taste, vector_sum, max(taste.count + delta, 0))
+        return taste
+
+    def _save(self, taste:FounderTasteVector, vector_sum:np.ndarray, count:int, update_fields:list[str]|None=None) -> bool:
+        """
+        취향 벡터가 바뀌었을 때만 `version`을 올려 저장합니다.
+        그대로면 캐싱된 추천이 무효화되지 않도록 `update_fields`(예: `rebuilt_at`)만 저장합니다.
+        Returns:
+            changed (bool): 모델, 개수, 벡터 합 바이트 중 하나라도 바뀌었는지
+        """
+        if not count:
+            vector_sum = np.empty(0, dtype=np.float32)
+        vector_bytes = vector_sum.astype(np.float32, copy=False).tobytes()
+        if taste.model_name == self.model_name and taste.count == count and bytes(taste.vector_sum) == vector_bytes:
+            if update_fields:
+                taste.save(update_fields=update_fields)
+            return False
+        taste.model_name = self.model_name
+        taste.dimension = vector_sum.shape[0]
+        taste.vector_sum = vector_bytes
+        taste.count = count
+        taste.version += 1
+        taste.save()
+        return True
+
+    @staticmethod
+    def vector_sum(taste:FounderTasteVector) -> np.ndarray:
+        return np.frombuffer(bytes(taste.vector_sum), dtype=np.float32)
+
+    @classmethod
+    def source_vector(cls, taste:FounderTasteVector) -> Optional[np.ndarray]:
+        """
+        스크랩한 제안 벡터의 평균 (유효한 벡터가 없으면 None)
+        """
+        if not taste.count or not taste.dimension:
+            return None
+        return cls.vector_sum(taste) / taste.count
+
+class ProposalVectorRecommendationService:
+    """
+    제안글 벡터 기반 추천 서비스 공통 기능 (벡터 일괄 조회기 + 추천 목록 응답)
+    후보 비교는 프로세스에 둔 업종별 후보 행렬(`proposal_candidate_index`)에서 합니다.
+    """
+    def __init__(self, request:HttpRequest, ai:Optional['AI']=None):
+        self.request = request
+        self.ai = ai
+        self.store = ProposalEmbeddingStore()
+        self.lookup = ProposalVectorLookup(self.ai, self.store)
+
+    def _serialize_proposals(self, proposal_ids:list[int], profile:str=ProfileChoices.founder.value):
+        """
+        추천 제안 id 순서대로 목록 응답을 만듭니다.
+        """
+        proposals = Proposal.objects.filter(
+            id__in=proposal_ids
         ).annotate(
             similarity_order=Case(
-                *[When(id=pk, then=Value(pos)) for pos, pk in enumerate(top_recommended_proposal_id_list)],
+                *[When(id=pk, then=Value(pos)) for pos, pk in enumerate(proposal_ids)],
                 output_field=IntegerField()
             )
         ).order_by(
@@ -215,26 +416,368 @@ class RecommendationScrapService:
         ).with_user(
         ).with_flags(
             user=self.request.user,
-            profile=ProfileChoices.founder.value
+            profile=profile
         )
 
         serializer = ProposalListSerializer(
-            top_recommended_proposals,
-            context={"request": self.request, "profile": ProfileChoices.founder.value},
+            proposals,
+            context={"request": self.request, "profile": profile},
             many=True
         )
-        result = serializer.data
+        return serializer.data
 
+class RecommendationScrapService(ProposalVectorRecommendationService):
+    def __init__(self, request:HttpRequest):
+        self.engine = get_recommendation_engine()
+        if self.engine == 'tfidf':
+            # FastText 없이 TF-IDF 인덱스만으로 추천 (작은 서버용)
+            if ai_models.kiwi is None:
+                raise APIException('AI 모델을 불러오지 못했어요. 관리자에게 문의하세요.')
+            try:
+                self.tfidf_ai = TfidfAI(proposal_tfidf_index.get())
+            except FileNotFoundError:
+                logger.exception('TF-IDF 인덱스 로드 실패')
+                raise APIException('AI 모델을 불러오지 못했어요. 관리자에게 문의하세요.')
+            super().__init__(request)
+        else:
+            # 저장된 제안 벡터와 취향 벡터만 사용하므로 FastText를 불러오지 않음
+            super().__init__(request)
+        self.taste_store = FounderTasteStore()
+
+    def _rank_proposal_ids_tfidf(self, scrapped_proposal_ids:list[int]) -> list[int]:
+        """
+        스크랩한 제안들의 TF-IDF 행을 합친 질의와 코사인 유사도가 높은 상위 3개 제안 id를 구합니다.
+        (스크랩한 제안, 펀딩 있는 제안 제외)
+        """
+        index = self.tfidf_ai.model
+        ids = index.ids  # 다른 스레드가 행을 추가해도 한 번 읽은 배열로 계산
+        indexed_ids = set(ids[np.isin(ids, scrapped_proposal_ids)].tolist())
+        queries = [index.rows(indexed_ids)]
+
+        # 인덱스를 만든 뒤에 생긴 제안글은 지금 벡터화
+        missing_ids = [proposal_id for proposal_id in scrapped_proposal_ids if proposal_id not in indexed_ids]
+        if missing_ids:
+            texts = [
+                ' '.join([title, content])
+                for title, content in Proposal.objects.filter(id__in=missing_ids).values_list('title', 'content')
+            ]
+            queries += [row for row in self.tfidf_ai.vectorize_many(texts) if row is not None]
+
+        query = sparse.vstack(queries, format='csr')
+        if not query.nnz:
+            raise ValidationError('스크랩한 제안의 내용이 유효하지 않아요.')
+
+        excluded_ids = set(scrapped_proposal_ids) | set(
+            Proposal.objects.filter(funding__isnull=False).values_list('id', flat=True)
+        )
+        return [
+            proposal_id
+            for proposal_id, score in index.top_k(
+                query,
+                industries=self.request.user.founder.industry,
+                exclude=excluded_ids,
+            )
+        ]
+
+    def _rank_proposal_ids(self, source_vector) -> list[int]:
+        """
+        대표 벡터와 코사인 유사도가 높은 상위 3개 제안 id를 구합니다. (스크랩한 제안, 펀딩 있는 제안 제외)
+        """
+        excluded_ids = set(Proposal.objects.filter(
+            Q(founder_scrap_proposal__user=self.request.user.founder)
+            | Q(funding__isnull=False)
+        ).filter_user_industry(
+            self.request.user,
+            ProfileChoices.founder.value,
+        ).values_list('id', flat=True))
+
+        # 업종별 후보 행렬(또는 ANN 인덱스)에서 제외할 제안을 빼고 상위 3개 제안 구하기
+        index = proposal_ann_index if settings.RECOMMENDATION_ANN_ENABLED else proposal_candidate_index
+        return index.search(
+            industries=self.request.user.founder.industry,
+            source_vector=source_vector,
+            exclude=excluded_ids,
+        )
+
+    def refresh_founder_scrap_recommendation(self, taste:FounderTasteVector) -> list[int]:
+        """
+        취향 벡터로 추천 제안 id를 다시 계산해 취향 벡터 버전과 함께 캐싱합니다.
+        Returns:
+            proposal_ids (list[int]): 유사도 순 추천 제안 id
+        """
+        source_vector = self.taste_store.source_vector(taste)
+        proposal_ids = list() if source_vector is None else self._rank_proposal_ids(source_vector)
         cache.set(
             CacheKey.RECOMMENDED_PROPOSALS.format(
                 profile=ProfileChoices.founder.value,
                 user_id=self.request.user.id,
             ),
-            result,
-            timeout=60*60*1, # 1시간 캐싱
+            {'version': taste.version, 'proposal_ids': proposal_ids},
+            timeout=24*60*60*1, # 1일 캐싱 (취향 벡터가 바뀌면 버전이 달라져 다시 계산)
+        )
+        return proposal_ids
+
+    @require_profile(ProfileChoices.founder)
+    def recommend_founder_scrap_proposal(self):
+        founder = self.request.user.founder
+
+        if self.engine == 'tfidf':
+            scrapped_proposal_ids = list(Proposal.objects.filter(
+                founder_scrap_proposal__user=founder,
+            ).values_list('id', flat=True))
+            if not scrapped_proposal_ids:
+                raise NotFound('스크랩한 제안이 없어요.')
+            return self._serialize_proposals(self._rank_proposal_ids_tfidf(scrapped_proposal_ids))
+
+        # 스크랩할 때마다 갱신되는 취향 벡터 (없으면 스크랩한 제안으로 한 번 생성)
+        taste = self.taste_store.get(founder.id) or self.taste_store.rebuild(founder, self.lookup)
+        if not taste.count:
+            if Proposal.objects.filter(founder_scrap_proposal__user=founder).exists():
+                raise ValidationError('스크랩한 제안의 내용이 유효하지 않아요.')
+            raise NotFound('스크랩한 제안이 없어요.')
+
+        # 취향 벡터 버전이 같으면 캐싱된 추천 id 사용, 다르면 다시 계산
+        cached_result = cache.get(CacheKey.RECOMMENDED_PROPOSALS.format(
+            profile=ProfileChoices.founder.value,
+            user_id=self.request.user.id,
+        ))
+        if isinstance(cached_result, dict) and cached_result.get('version') == taste.version:
+            top_recommended_proposal_id_list = cached_result['proposal_ids']
+        else:
+            top_recommended_proposal_id_list = self.refresh_founder_scrap_recommendation(taste)
+
+        return self._serialize_proposals(top_recommended_proposal_id_list)
+
+
+class RecommendationSimilarProposalService(ProposalVectorRecommendationService):
+    """
+    제안글 상세의 비슷한 제안 목록
+    매일 밤 `compute_proposal_neighbors`가 계산해 둔 ProposalNeighbor를 pk로 한 번 조회하므로 요청마다 유사도를 계산하지 않습니다.
+    """
+    def recommend_similar_proposal(self, proposal_id:int, profile:str, top_k:int=5):
+        if getattr(self.request.user, profile, None) is None:
+            raise PermissionDenied(detail=f"{ProfileChoices(profile).label} 프로필을 생성해 주세요.")
+        neighbor_ids = ProposalNeighbor.objects.filter(
+            proposal_id=proposal_id,
+            model_name=self.store.model_name,
+        ).values_list('neighbor_ids', flat=True).first()
+        if neighbor_ids is None:
+            # 아직 계산되지 않은 새 제안글은 빈 목록
+            if not Proposal.objects.filter(id=proposal_id).exists():
+                raise NotFound('제안을 찾을 수 없어요.')
+            return list()
+        return self._serialize_proposals(neighbor_ids[:top_k], profile)
+
+class ProposalCooccurrenceStore:
+    """
+    제안 동시 상호작용(item-item co-occurrence) 저장소
+    사용자×제안 상호작용 행렬 X(좋아요, 스크랩 1회당 1)에 대해 C = XᵀX의 대각 외 0이 아닌 값을 행으로 저장합니다.
+      - 매일 밤 `compute_proposal_cooccurrence`가 희소 행렬 곱으로 전체를 다시 계산합니다.
+      - 그 사이의 상호작용은 백그라운드에서 `recompute`로 바뀐 제안의 행만 다시 계산합니다.
+    """
+    # 동시 상호작용 테이블 쓰기용 PostgreSQL 트랜잭션 advisory lock 키
+    LOCK_ID = 0x636f6f63  # 'cooc'
+
+    @classmethod
+    def lock(cls):
+        """
+        트랜잭션이 끝날 때까지 동시 상호작용 테이블 쓰기를 독점합니다. (읽기는 막지 않음, 트랜잭션 안에서 호출)
+        밤 전체 재계산과 백그라운드 `recompute`가 같은 쌍을 동시에 지우고 넣다가 유일 제약에 걸리지 않도록 둘 다 쓰기 전에 잡습니다.
+        """
+        if connection.vendor != 'postgresql':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_xact_lock(%s)', [cls.LOCK_ID])
+
+    @staticmethod
+    def interaction_counts(user_id) -> Counter:
+        """
+        사용자(계정)의 제안별 상호작용 수 {proposal_id: X[u,p]} (좋아요/스크랩 세 테이블을 한 번에 조회)
+        """
+        proposal_ids = ProposerLikeProposal.objects.filter(
+            user__user_id=user_id,
+        ).values_list('proposal_id', flat=True).union(
+            ProposerScrapProposal.objects.filter(user__user_id=user_id).values_list('proposal_id', flat=True),
+            FounderScrapProposal.objects.filter(user__user_id=user_id).values_list('proposal_id', flat=True),
+            all=True,
+        )
+        return Counter(proposal_ids)
+
+    def recompute(self, proposal_id:int) -> int:
+        """
+        제안 하나가 들어간 동시 상호작용 행(C[p,·], C[·,p])을 현재 좋아요/스크랩으로 다시 계산해 바꿉니다.
+        X[u,p]가 바뀌면 p가 들어간 쌍만 바뀌므로, 변경이 처리되는 순서나 중복 처리와 무관하게 XᵀX와 같아집니다.
+        (C[p,q] = p에 상호작용한 사용자들의 X[u,p]·X[u,q] 합)
+        Returns:
+            saved (int): 저장한 쌍 수 (제안글이 지워졌으면 0)
+        """
+        interaction_models = (ProposerLikeProposal, ProposerScrapProposal, FounderScrapProposal)
+        with transaction.atomic():
+            # 다른 제안의 재계산이나 밤 전체 재계산과 겹치지 않도록 잠근 뒤 읽고 씀
+            # (쌍 (p,q)와 (q,p)를 함께 바꾸므로 제안글 하나만 잠가서는 부족함)
+            self.lock()
+            # 제안글이 지워지는 중이면 끝날 때까지 기다림 (지워졌으면 행도 함께 지워졌으므로 건너뜀)
+            if not Proposal.objects.select_for_update().filter(id=proposal_id).exists():
+                return 0
+            weights = Counter(
+                ProposerLikeProposal.objects.filter(proposal_id=proposal_id).values_list('user__user_id', flat=True).union(
+                    *[model.objects.filter(proposal_id=proposal_id).values_list('user__user_id', flat=True) for model in interaction_models[1:]],
+                    all=True,
+                )
+            )
+            counts: Counter = Counter()
+            if weights:
+                condition = Q(user__user_id__in=list(weights)) & ~Q(proposal_id=proposal_id)
+                for user_id, other_id in ProposerLikeProposal.objects.filter(condition).values_list('user__user_id', 'proposal_id').union(
+                    *[model.objects.filter(condition).values_list('user__user_id', 'proposal_id') for model in interaction_models[1:]],
+                    all=True,
+                ):
+                    counts[other_id] += weights[user_id]
+            ProposalCooccurrence.objects.filter(Q(proposal_id=proposal_id) | Q(other_id=proposal_id)).delete()
+            ProposalCooccurrence.objects.bulk_create(
+                [ProposalCooccurrence(proposal_id=proposal_id, other_id=other_id, count=count) for other_id, count in counts.items()]
+                + [ProposalCooccurrence(proposal_id=other_id, other_id=proposal_id, count=count) for other_id, count in counts.items()],
+                batch_size=1000,
+            )
+        return len(counts)
+
+    def top_k(self, interactions:Counter, exclude=None, top_k:int=5) -> list[int]:
+        """
+        상호작용한 제안들과 동시 상호작용 수의 합이 큰 상위 k개 제안 id (상호작용한 제안, `exclude` 쿼리셋 제외)
+        """
+        qs = ProposalCooccurrence.objects.filter(
+            proposal_id__in=list(interactions),
+        ).exclude(
+            other_id__in=list(interactions),
+        )
+        if exclude is not None:
+            qs = qs.exclude(other__in=exclude)
+        return list(qs.values('other_id').annotate(
+            score=Sum('count'),
+        ).order_by(
+            '-score', '-other_id',
+        ).values_list('other_id', flat=True)[:top_k])
+
+class RecommendationCooccurrenceService(ProposalVectorRecommendationService):
+    """
+    지역주민 맞춤 추천: 나와 같은 제안에 좋아요/스크랩한 사람들이 함께 좋아요/스크랩한 제안 (item-item 협업 필터링)
+    """
+    def __init__(self, request:HttpRequest):
+        super().__init__(request)
+        self.cooccurrence_store = ProposalCooccurrenceStore()
+
+    @require_profile(ProfileChoices.proposer)
+    def recommend_proposer_cooccurrence_proposal(self, top_k:int=5):
+        interactions = self.cooccurrence_store.interaction_counts(self.request.user.id)
+        if not interactions:
+            raise NotFound('좋아요하거나 스크랩한 제안이 없어요.')
+        proposal_ids = self.cooccurrence_store.top_k(
+            interactions,
+            exclude=Proposal.objects.filter(user=self.request.user.proposer),
+            top_k=top_k,
+        )
+        return self._serialize_proposals(proposal_ids, ProfileChoices.proposer.value)
+
+class FundingSuccessCentroidStore:
+    """
+    업종별 펀딩 성공 중심 벡터 저장소 (DB + 캐시)
+    """
+    timeout = 7*24*60*60*1 # 매일 밤 다시 계산해 덮어쓰므로 넉넉히 캐싱
+
+    def __init__(self, model_name:str=FASTTEXT_MODEL_NAME):
+        self.model_name = model_name
+
+    def _cache_key(self) -> str:
+        return CacheKey.FUNDING_SUCCESS_CENTROIDS.format(model_name=self.model_name)
+
+    def get_all(self) -> Dict[str, np.ndarray]:
+        """
+        Returns:
+            centroids (dict): {industry: 정규화된 float32 중심 벡터}
+        """
+        centroids = cache.get(self._cache_key())
+        if centroids is None:
+            centroids = {
+                industry: np.frombuffer(bytes(vector), dtype=np.float32)
+                for industry, vector in FundingSuccessCentroid.objects.filter(
+                    model_name=self.model_name,
+                    dimension__gt=0,
+                ).values_list('industry', 'vector')
+            }
+            cache.set(self._cache_key(), centroids, timeout=self.timeout)
+        return centroids
+
+    def replace_all(self, centroids:Dict[str, tuple[np.ndarray, int]]) -> int:
+        """
+        {industry: (중심 벡터, 제안 수)}로 전체 중심을 교체하고 캐시를 갱신합니다.
+        """
+        with transaction.atomic():
+            FundingSuccessCentroid.objects.exclude(industry__in=list(centroids)).delete()
+            FundingSuccessCentroid.objects.bulk_create(
+                [
+                    FundingSuccessCentroid(
+                        industry=industry,
+                        model_name=self.model_name,
+                        dimension=vector.shape[0],
+                        vector=vector.astype(np.float32, copy=False).tobytes(),
+                        count=count,
+                    )
+                    for industry, (vector, count) in centroids.items()
+                ],
+                update_conflicts=True,
+                unique_fields=['industry'],
+                update_fields=['model_name', 'dimension', 'vector', 'count', 'updated_at'],
+            )
+        cache.set(
+            self._cache_key(),
+            {industry: vector.astype(np.float32, copy=False) for industry, (vector, _) in centroids.items()},
+            timeout=self.timeout,
         )
-        return result
+        return len(centroids)
+
+class RecommendationFundingSuccessService(ProposalVectorRecommendationService):
+    """
+    펀딩에 성공한 제안들과 비슷한 (아직 펀딩이 없는) 제안 추천
+      - 업종별 펀딩 성공 중심 벡터는 매일 밤 정산 후 `compute_funding_success_centroids`가 미리 계산합니다.
+      - 요청 경로에서는 업종별 후보 행렬과 중심 벡터의 행렬-벡터 곱만 수행합니다. (벡터화 없음)
+    """
+    def __init__(self, request:HttpRequest):
+        super().__init__(request)
+        self.centroid_store = FundingSuccessCentroidStore()
 
+    @require_profile(ProfileChoices.founder)
+    def recommend_founder_funding_success_proposal(self):
+        cache_key = CacheKey.FUNDING_SUCCESS_RECOMMENDED_PROPOSALS.format(
+            profile=ProfileChoices.founder.value,
+            user_id=self.request.user.id,
+        )
+        proposal_ids = cache.get(cache_key)
+        if proposal_ids is None:
+            centroids = self.centroid_store.get_all()
+            industries = [industry for industry in self.request.user.founder.industry if industry in centroids]
+            funded_ids = set(Proposal.objects.filter(
+                industry__in=industries,
+                funding__isnull=False,
+            ).values_list('id', flat=True))
+            top: list[tuple[int, float]] = list()
+            for industry in industries:
+                # 해당 업종의 펀딩 없는 제안 중 성공 중심과 유사도 상위 3개
+                top.extend(proposal_candidate_index.top_k([industry], centroids[industry], exclude=funded_ids))
+            top.sort(key=lambda result: -result[1])
+            proposal_ids = [proposal_id for proposal_id, score in top[:3]]
+            cache.set(cache_key, proposal_ids, timeout=60*60*1) # 1시간 캐싱
+
+        return self._serialize_proposals(proposal_ids)
+
+class SplitPart(Func):
+    function = "SPLIT_PART"
+    output_field = CharField()
+
+@dataclass
+class CalcWeights:
+    level: int = 40
+    likes_ratio: int = 40
+    business_hours: int = 20
 
 class RecommendationCalcService:
     """
@@ -249,6 +792,9 @@ class RecommendationCalcService:
     정렬:
       - score desc, likes_count desc, id desc
     """
+    weights = CalcWeights()
+    max_limit = 50
+
     def __init__(self, request: HttpRequest):
         self.request = request
         user = getattr(request, "user", None)
@@ -300,62 +846,76 @@ class RecommendationCalcService:
         raise PermissionDenied("추천을 위해 우리동네(동) 설정이 필요해요.")
 
     # -------------------------------
-    # Component scorers - 점수 컴포넌트 계산
+    # Component scorers - 점수 컴포넌트 SQL 식
     # -------------------------------
     @staticmethod
-    def _norm_level_to_pct(level_val: Optional[int]) -> int:
-        return {1: 33, 2: 67, 3: 100}.get(int(level_val or 0), 0)
-
-    def _score_business_hours(self, proposal: Proposal) -> int:
-        ps = proposal.business_hours or {}
-        fs = self.founder_hours or {}
-
-        p_start = _parse_hhmm(ps.get("start")); p_end = _parse_hhmm(ps.get("end"))
-        f_start = _parse_hhmm(fs.get("start")); f_end = _parse_hhmm(fs.get("end"))
-        if not (p_start and p_end and f_start and f_end):
-            return 0
-
-        p_len = _minutes_between(p_start, p_end)
-        f_len = _minutes_between(f_start, f_end)
-        if p_len <= 0 or f_len <= 0:
-            return 0
-
-        overlap = _overlap_minutes(p_start, p_end, f_start, f_end)
-        base = max(p_len, f_len)  # ← 긴 쪽 기준
-        return 100 if overlap >= 0.5 * base else 0
-
-    def _likes_component_from_annot(self, p: Proposal) -> int:
-        total = getattr(p, "total_likes", 0) or 0
-        if total <= 0:
-            return 0
-        local = getattr(p, "local_likes", 0) or 0
-        local_ratio = max(min(local / total, 1), 0)
+    def _level_pct_expr():
+        # 제안자의 '해당 동' 레벨 1/2/3 → 33/67/100
+        return Case(
+            When(proposer_level_at_addr=1, then=Value(33)),
+            When(proposer_level_at_addr=2, then=Value(67)),
+            When(proposer_level_at_addr=3, then=Value(100)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
 
+    def _likes_pct_expr(self):
+        # 좋아요 중 '해당 동' 주민(제안자 레벨 주소가 제안글 동과 같은 제안자)의 비율을 founder.target에 맞춰 가중
+        local_ratio = Cast(F("local_likes"), FloatField()) / Cast(NullIf(F("total_likes"), 0), FloatField())
         t = self.founder_targets
         if t == {FounderTargetChoices.LOCAL}:
             base = local_ratio
         elif t == {FounderTargetChoices.STRANGER}:
-            base = 1 - local_ratio
+            base = Value(1.0) - local_ratio
         else:
-            base = max(local_ratio, 1 - local_ratio)
-        return int(round(base * 100))
+            base = Greatest(local_ratio, Value(1.0) - local_ratio)
+        return Coalesce(Cast(Round(base * Value(100.0)), IntegerField()), 0)
 
-    def recommend_calc(self, *, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
-        limit = max(1, min(int(limit or 10), 50))
+    @staticmethod
+    def _hhmm_minutes_expr(key: str):
+        # business_hours JSON의 'HH:MM' → 자정 기준 분 (형식이 맞지 않으면 NULL)
+        text = KeyTextTransform(key, "business_hours")
+        return Case(
+            When(
+                **{f"business_hours__{key}__regex": r"^([01]?[0-9]|2[0-3]):[0-5]?[0-9]$"},
+                then=Cast(SplitPart(text, Value(":"), Value(1)), IntegerField()) * 60
+                + Cast(SplitPart(text, Value(":"), Value(2)), IntegerField()),
+            ),
+            default=None,
+            output_field=IntegerField(),
+        )
 
-        # 1) 주소 필터: 쿼리가 3개 다 오면 단일 동, 아니면 founder의 주소들(최대 2개) OR
-        q_sido = getattr(self.request, "GET", {}).get("sido")
-        q_sigungu = getattr(self.request, "GET", {}).get("sigungu")
-        q_eup = getattr(self.request, "GET", {}).get("eupmyundong")
+    def _hours_pct_expr(self):
+        # 겹치는 시간이 두 영업시간 중 긴 쪽의 절반 이상이면 100, 아니면 0 (자정을 넘는 영업시간은 0)
+        fs = self.founder_hours or {}
+        f_start = _parse_hhmm(fs.get("start")); f_end = _parse_hhmm(fs.get("end"))
+        if not (f_start and f_end) or _minutes_between(f_start, f_end) <= 0:
+            return Value(0, output_field=IntegerField())
+        f_start_min = f_start[0] * 60 + f_start[1]
+        f_end_min = f_end[0] * 60 + f_end[1]
+
+        p_start = self._hhmm_minutes_expr("start")
+        p_end = self._hhmm_minutes_expr("end")
+        overlap = Greatest(Least(p_end, Value(f_end_min)) - Greatest(p_start, Value(f_start_min)), Value(0))
+        base = Greatest(p_end - p_start, Value(f_end_min - f_start_min))
+        return Case(
+            When(
+                GreaterThan(p_end - p_start, 0) & GreaterThanOrEqual(overlap * 2, base),
+                then=Value(100),
+            ),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
 
+    def _address_condition(self, sido: Optional[str], sigungu: Optional[str], eupmyundong: Optional[str]) -> Q:
         # Founder 주소들(or 조건)로 후보군 필터
         addr_q = Q()
-        if q_sido and q_sigungu and q_eup:
+        if sido and sigungu and eupmyundong:
             # 단일 동 선택(옵션)
             addr_q = Q(
-                address__sido=q_sido,
-                address__sigungu=q_sigungu,
-                address__eupmyundong=q_eup,
+                address__sido=sido,
+                address__sigungu=sigungu,
+                address__eupmyundong=eupmyundong,
             )
         else:
             # 창업자가 가진 주소들 전체(OR) – 최대 2개
@@ -366,7 +926,71 @@ class RecommendationCalcService:
 
         if not addr_q:
             raise PermissionDenied("추천을 위해 founder의 우리동네(동) 정보가 필요해요.")
+        return addr_q
+
+    def recommend_calc(self, *, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        limit = max(1, min(int(limit or 10), self.max_limit))
+
+        # 1) 주소 필터: 쿼리가 3개 다 오면 단일 동, 아니면 founder의 주소들(최대 2개) OR
+        q_sido = getattr(self.request, "GET", {}).get("sido")
+        q_sigungu = getattr(self.request, "GET", {}).get("sigungu")
+        q_eup = getattr(self.request, "GET", {}).get("eupmyundong")
+
+        if q_sido and q_sigungu and q_eup:
+            # 단일 동 선택은 미리 계산하지 않으므로 바로 계산
+            proposals = self.scored_queryset(self._address_condition(q_sido, q_sigungu, q_eup))[:limit]
+        else:
+            # 미리 계산된 순위(없으면 지금 계산해 저장)
+            recommendation = FounderCalcRecommendation.objects.filter(
+                founder=self.founder,
+            ).values_list("proposal_ids", "updated_at").first()
+            if recommendation is None:
+                proposal_ids = self.refresh_calc_recommendation()
+                proposals = self._ranked_queryset(proposal_ids[:limit])
+            else:
+                # 순위를 계산한 뒤에 올라온 제안글까지 함께 점수를 매겨 다시 정렬 (미리 계산한 후보 + 새 제안글만 계산)
+                proposal_ids, updated_at = recommendation
+                proposals = self.scored_queryset(
+                    self._address_condition(None, None, None)
+                    & (Q(id__in=proposal_ids) | Q(created_at__gt=updated_at))
+                )[:limit]
+
+        return ProposalListSerializer(
+            proposals,
+            many=True,
+            context={"request": self.request, "profile": ProfileChoices.founder.value},
+        ).data  # ← 점수 미노출
+
+    def _ranked_queryset(self, proposal_ids: List[int]):
+        """
+        주어진 id 순서대로 정렬한 목록 응답용 쿼리셋
+        """
+        return self._annotated_queryset(Q(id__in=proposal_ids)).annotate(
+            rank=Case(
+                *[When(id=pk, then=Value(pos)) for pos, pk in enumerate(proposal_ids)],
+                output_field=IntegerField(),
+            ),
+        ).order_by("rank")
 
+    def refresh_calc_recommendation(self) -> List[int]:
+        """
+        founder의 우리동네(최대 2개) 기준 추천 순위를 계산해 저장합니다.
+        Returns:
+            proposal_ids (list[int]): 점수 순 제안 id (최대 `max_limit`개)
+        """
+        proposal_ids = list(
+            self.scored_queryset(self._address_condition(None, None, None)).values_list("id", flat=True)[:self.max_limit]
+        )
+        FounderCalcRecommendation.objects.update_or_create(
+            founder=self.founder,
+            defaults={"proposal_ids": proposal_ids},
+        )
+        return proposal_ids
+
+    def _annotated_queryset(self, condition: Q):
+        """
+        조건에 맞는 펀딩 없는 관심 업종 제안글에 목록 응답용 집계/플래그를 붙인 쿼리셋
+        """
         # 레벨 Subquery: "해당 제안글의 동"에서의 작성자(Proposer) 레벨
         level_subq = ProposerLevel.objects.filter(
         user=OuterRef("user"),
@@ -374,12 +998,11 @@ class RecommendationCalcService:
         address__sigungu=OuterRef("address__sigungu"),
         address__eupmyundong=OuterRef("address__eupmyundong"),
         ).order_by("-id").values("level")[:1]
-        
 
         qs = (
             Proposal.objects
             .filter(funding__isnull=True)
-            .filter(addr_q)
+            .filter(condition)
             .filter(industry__in=list(self.founder_industries))
             .select_related("user", "user__user")     # ← obj.user.user 접근 대비 (N+1 방지)
         )
@@ -389,9 +1012,17 @@ class RecommendationCalcService:
             # 제안자의 '해당 동' 레벨
             proposer_level_at_addr=Coalesce(Subquery(level_subq, output_field=IntegerField()), 0),
 
-            # 좋아요/스크랩 집계
-            likes_count=Coalesce(Count("proposer_like_proposal__user", distinct=True), 0),
-            scraps_count=Coalesce(Count("founder_scrap_proposal__user", distinct=True), 0),
+            # 좋아요 전체 / '해당 동' 주민 좋아요 (비율 점수용)
+            total_likes=Count("proposer_like_proposal", distinct=True),
+            local_likes=Count(
+                "proposer_like_proposal",
+                filter=Q(
+                    proposer_like_proposal__user__proposer_level__address__sido=F("address__sido"),
+                    proposer_like_proposal__user__proposer_level__address__sigungu=F("address__sigungu"),
+                    proposer_like_proposal__user__proposer_level__address__eupmyundong=F("address__eupmyundong"),
+                ),
+                distinct=True,
+            ),
 
             # founder가 이 제안을 스크랩했는지
             _my_scrap=Count(
@@ -414,63 +1045,28 @@ class RecommendationCalcService:
 
             # Detail/ZoomFounder가 요구
             has_funding=Value(False, output_field=BooleanField()),
-        )
-
-        # (필요하면) with_analytics/with_user가 있으면 덮어쓰기
-        try:
-            qs = qs.with_analytics()
-            
-        except Exception:
-            pass
-        try:
-            try:
-                qs = qs.with_user(self.user)
-            except TypeError:
-                qs = qs.with_user()
-        except Exception:
-            pass
-
-        # 정렬/슬라이스는 기존 로직 유지
-        candidates = list(qs.order_by("-likes_count", "-created_at", "-id")[:200])
-
+        ).with_analytics()
+        return qs
 
+    def scored_queryset(self, addr_q: Q):
+        """
+        주소 조건에 맞는 후보 전체의 점수를 DB에서 계산하고
+        `score >= 60` 컷과 정렬(score desc, likes_count desc, id desc)까지 적용한 쿼리셋
+        """
+        qs = self._annotated_queryset(addr_q)
 
+        # 2) 점수 = (레벨×40 + 좋아요 비율×40 + 영업시간×20) / 100
+        w = self.weights
+        qs = qs.annotate(
+            level_pct=self._level_pct_expr(),
+            likes_pct=self._likes_pct_expr(),
+            hours_pct=self._hours_pct_expr(),
+        ).annotate(
+            score=Cast(Round(
+                (F("level_pct") * w.level + F("likes_pct") * w.likes_ratio + F("hours_pct") * w.business_hours)
+                / Value(float(w.level + w.likes_ratio + w.business_hours))
+            ), IntegerField()),
+        )
 
-
-        @dataclass
-        class CalcWeights:
-            level: int = 40
-            likes_ratio: int = 40
-            business_hours: int = 20
-
-        CALC_WEIGHTS = CalcWeights()
-
-        w = CALC_WEIGHTS
-        denom = (w.level + w.likes_ratio + w.business_hours)
-        rows: List[Dict[str, Any]] = []
-        for p in candidates:
-            level_pct = self._norm_level_to_pct(getattr(p, "proposer_level_at_addr", 0))
-            likes_pct = self._likes_component_from_annot(p)
-            hours_pct = self._score_business_hours(p)
-
-            total = (
-                (level_pct * w.level) +
-                (likes_pct * w.likes_ratio) +
-                (hours_pct * w.business_hours)
-            ) / denom
-            score = int(round(total))
-
-            if score >= 60:  # 명세 컷 유지
-                rows.append({"proposal": p, "score": score})
-
-        # 정렬: score desc, likes_count desc, id desc
-        rows.sort(key=lambda x: (x["score"], getattr(x["proposal"], "likes_count", 0), x["proposal"].id), reverse=True)
-        top = rows[:limit]
-
-        # 2) 직렬화 (score/components 주입하지 않음)
-        ser = ProposalListSerializer(
-            [r["proposal"] for r in top],
-            many=True,
-            context={"request": self.request, "profile": ProfileChoices.founder.value},
-        ).data
-        return ser  # ← 점수 미노출
+        # 3) 컷/정렬: score >= 60, score desc, likes_count desc, id desc
+        return qs.filter(score__gte=60).order_by("-score", "-likes_count", "-id")
@@ -0,0 +1,62 @@
+from copy import deepcopy
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+from accounts.models import Founder
+from proposals.models import Proposal, ProposerLikeProposal, ProposerScrapProposal, FounderScrapProposal
+from .tasks import background_tasks
+
+@receiver(post_save, sender=Proposal)
+def ingest_created_proposal_embedding(sender, instance:Proposal, created:bool, **kwargs):
+    '''
+    제안글이 생성되면 커밋 후 백그라운드에서 임베딩을 계산하고, 관심사가 맞는 창업자에게 알림을 보냅니다.
+    '''
+    if created:
+        transaction.on_commit(lambda: background_tasks.enqueue([instance.id]))
+        transaction.on_commit(lambda: background_tasks.enqueue_founder_match(instance.id))
+
+# 계산식 추천 순위에 영향을 주는 창업자 프로필 필드
+CALC_RECOMMENDATION_FIELDS = ('address', 'industry', 'target', 'business_hours')
+
+def _calc_recommendation_fields(instance:Founder) -> dict:
+    # 지연 로딩 필드는 조회하지 않도록 __dict__에서 읽고, 리스트/JSON을 제자리에서 바꿔도 비교되도록 복사
+    return deepcopy({field: instance.__dict__[field] for field in CALC_RECOMMENDATION_FIELDS if field in instance.__dict__})
+
+@receiver(post_init, sender=Founder)
+def snapshot_founder_calc_fields(sender, instance:Founder, **kwargs):
+    instance._calc_recommendation_fields = _calc_recommendation_fields(instance)
+
+@receiver(post_save, sender=Founder)
+def refresh_founder_calc_recommendation(sender, instance:Founder, created:bool, update_fields=None, **kwargs):
+    '''
+    창업자 프로필이 생성되거나 우리동네, 업종, 타깃, 영업시간이 바뀌면 커밋 후 백그라운드에서 계산식 추천 순위를 다시 계산합니다.
+    '''
+    if update_fields is not None and not set(update_fields) & set(CALC_RECOMMENDATION_FIELDS):
+        return
+    fields = _calc_recommendation_fields(instance)
+    if not created and fields == instance._calc_recommendation_fields:
+        return
+    instance._calc_recommendation_fields = fields
+    transaction.on_commit(lambda: background_tasks.enqueue_calc_recommendation(instance.id))
+
+@receiver(post_save, sender=ProposerLikeProposal)
+@receiver(post_save, sender=ProposerScrapProposal)
+@receiver(post_save, sender=FounderScrapProposal)
+def add_proposal_cooccurrence(sender, instance, created:bool, **kwargs):
+    '''
+    좋아요/스크랩이 생기면 커밋 후 백그라운드에서 그 제안의 동시 상호작용 수를 다시 계산합니다. (요청 안에서는 조회하지 않음)
+    '''
+    if created:
+        transaction.on_commit(lambda: background_tasks.enqueue_cooccurrence_update(instance.proposal_id))
+
+@receiver(post_delete, sender=ProposerLikeProposal)
+@receiver(post_delete, sender=ProposerScrapProposal)
+@receiver(post_delete, sender=FounderScrapProposal)
+def remove_proposal_cooccurrence(sender, instance, origin=None, **kwargs):
+    '''
+    좋아요/스크랩이 취소되면 커밋 후 백그라운드에서 그 제안의 동시 상호작용 수를 다시 계산합니다.
+    제안글 삭제로 함께 지워진 경우는 그 제안글의 동시 상호작용 행도 함께 지워지므로 건너뜁니다.
+    '''
+    if isinstance(origin, Proposal) or getattr(origin, 'model', None) is Proposal:
+        return
+    transaction.on_commit(lambda: background_tasks.enqueue_cooccurrence_update(instance.proposal_id))
@@ -0,0 +1,306 @@
+from typing import Any, Iterable, Sequence, Set
+import numpy as np
+
+def normalize_rows(matrix:np.ndarray) -> np.ndarray:
+    '''
+    행마다 L2 노름으로 나누어 단위 벡터로 만듭니다. (제자리 연산)
+    노름이 0인 행은 0 벡터로 남겨 코사인 유사도가 0이 되도록 합니다.
+    Args:
+        matrix (np.ndarray): (n, dim) float32 행렬
+    Returns:
+        matrix (np.ndarray): 정규화된 같은 행렬
+    '''
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+def stack_normalized(vectors:Iterable[np.ndarray], dim:int|None=None) -> np.ndarray:
+    '''
+    벡터들을 하나의 연속된 float32 행렬로 쌓고 행을 정규화합니다.
+    Args:
+        vectors (Iterable[np.ndarray]): 같은 차원의 1차원 벡터들
+        dim (int|None): 벡터가 하나도 없을 때 사용할 차원
+    Returns:
+        matrix (np.ndarray): (n, dim) C-contiguous float32 행렬
+    '''
+    vectors = list(vectors)
+    if not vectors:
+        return np.empty((0, dim or 0), dtype=np.float32)
+    # vstack은 항상 새 배열을 만들므로 원본 벡터를 건드리지 않고 제자리 정규화할 수 있습니다.
+    matrix = np.ascontiguousarray(np.vstack(vectors), dtype=np.float32)
+    return normalize_rows(matrix)
+
+def normalize_vector(vector:np.ndarray) -> np.ndarray:
+    '''
+    1차원 벡터를 float32 단위 벡터로 변환합니다. 노름이 0이면 0 벡터를 반환합니다.
+    '''
+    vector = np.asarray(vector, dtype=np.float32).ravel()
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        return vector / norm
+    return np.zeros_like(vector)
+
+def top_k_indices(scores:np.ndarray, top_k:int) -> np.ndarray:
+    '''
+    점수 배열에서 상위 k개의 인덱스를 점수 내림차순으로 반환합니다.
+    전체 정렬 대신 `argpartition`(O(n))으로 후보를 고른 뒤 k개만 정렬합니다.
+    '''
+    n = scores.shape[0]
+    if n == 0 or top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if top_k < n:
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(n)
+    # 동점이면 앞선 인덱스 우선 (stable)
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+def batched_top_k_neighbors(matrix:np.ndarray, top_k:int, batch_size:int=1024):
+    '''
+    정규화된 행렬의 모든 행에 대해 자기 자신을 뺀 코사인 유사도 상위 k개 이웃을 구합니다.
+    `batch_size`행씩 (batch, n) 행렬 곱으로 계산하므로 메모리는 n×n이 아니라 batch×n만 사용합니다.
+    Args:
+        matrix (np.ndarray): (n, dim) 행 정규화된 float32 행렬
+    Yields:
+        start (int): 배치의 첫 행 번호
+        neighbors (np.ndarray): (batch, k') 유사도 내림차순 이웃 행 번호 (k' = min(k, n-1))
+        scores (np.ndarray): (batch, k') 유사도
+    '''
+    n = matrix.shape[0]
+    k = min(top_k, n - 1)
+    for start in range(0, n, batch_size):
+        stop = min(start + batch_size, n)
+        if k <= 0:
+            yield start, np.empty((stop - start, 0), dtype=np.intp), np.empty((stop - start, 0), dtype=np.float32)
+            continue
+        scores = matrix[start:stop] @ matrix.T
+        rows = np.arange(stop - start)
+        scores[rows, rows + start] = -np.inf
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind='stable')
+        yield start, np.take_along_axis(candidates, order, axis=1), np.take_along_axis(candidate_scores, order, axis=1)
+
+class SimilarityMatrix:
+    '''
+    후보 벡터를 행 정규화된 float32 행렬로 쌓아 두고,
+    한 번의 행렬-벡터 곱으로 코사인 유사도를 계산하는 배치 유사도 엔진입니다.
+    Attributes:
+        keys (list): 행 순서와 같은 순서의 후보 키(아이템 또는 id)
+        matrix (np.ndarray): (n, dim) 정규화된 float32 행렬
+    '''
+    def __init__(self, keys:Sequence[Any], matrix:np.ndarray):
+        if len(keys) != matrix.shape[0]:
+            raise ValueError('keys와 matrix의 행 개수가 달라요.')
+        self.keys = list(keys)
+        self.matrix = matrix
+
+    @classmethod
+    def from_items_and_vectors(cls, items_and_vectors:Iterable[tuple]) -> 'SimilarityMatrix':
+        '''
+        `(item, vector)` 쌍들로 엔진을 만듭니다.
+        '''
+        items_and_vectors = list(items_and_vectors)
+        items = [item for item, _ in items_and_vectors]
+        matrix = stack_normalized(vector for _, vector in items_and_vectors)
+        return cls(items, matrix)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def scores(self, source_vector:np.ndarray) -> np.ndarray:
+        '''
+        모든 후보와 대표 벡터의 코사인 유사도 (n,) 배열
+        '''
+        if not len(self.keys):
+            return np.empty(0, dtype=np.float32)
+        return self.matrix @ normalize_vector(source_vector)
+
+    def top_k(self, source_vector:np.ndarray, top_k:int=3) -> list[tuple[Any, float]]:
+        '''
+        유사도 상위 k개의 `(key, score)`를 유사도 내림차순으로 반환합니다.
+        '''
+        scores = self.scores(source_vector)
+        return [(self.keys[i], float(scores[i])) for i in top_k_indices(scores, top_k)]
+
+class EmbeddingMatrix:
+    '''
+    id 순서대로 쌓인 (정규화되지 않은) float32 임베딩 행렬
+    Attributes:
+        ids (np.ndarray): (n,) int64 id 배열
+        matrix (np.ndarray): (n, dim) float32 행렬
+    '''
+    def __init__(self, ids:Sequence[int], matrix:np.ndarray):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.matrix = matrix
+
+    @classmethod
+    def from_buffers(cls, ids:Sequence[int], buffers:Sequence[bytes], dim:int) -> 'EmbeddingMatrix':
+        '''
+        float32 바이트열들을 한 번에 이어 붙여 (n, dim) 행렬로 만듭니다.
+        '''
+        if not buffers:
+            return cls(ids, np.empty((0, dim), dtype=np.float32))
+        matrix = np.frombuffer(b''.join(buffers), dtype=np.float32).reshape(len(buffers), dim)
+        return cls(ids, matrix)
+
+    @classmethod
+    def from_vectors(cls, vectors:dict[int, np.ndarray], dim:int=0) -> 'EmbeddingMatrix':
+        '''
+        {id: vector}로 행렬을 만듭니다.
+        '''
+        if not vectors:
+            return cls([], np.empty((0, dim), dtype=np.float32))
+        return cls(list(vectors.keys()), np.vstack(list(vectors.values())).astype(np.float32, copy=False))
+
+    def __len__(self):
+        return self.ids.shape[0]
+
+    def to_similarity_matrix(self) -> SimilarityMatrix:
+        '''
+        행을 정규화한 복사본으로 유사도 엔진을 만듭니다. (키는 id)
+        '''
+        return SimilarityMatrix(self.ids.tolist(), normalize_rows(self.matrix.copy()))
+
+class CandidateMatrix:
+    '''
+    후보 전체를 행 정규화된 float32 행렬 하나로 두고 한 번의 행렬-벡터 곱으로 정확히 비교하는 인덱스
+    (`IVFIndex`와 같은 `add`/`search` 인터페이스, 추가는 ids와 행렬을 한 번에 바꿔 검색 중인 스레드와 섞이지 않음)
+    '''
+    def __init__(self, ids:np.ndarray, matrix:np.ndarray):
+        self._data = (ids, matrix)
+
+    @classmethod
+    def build(cls, ids:Sequence[int], matrix:np.ndarray) -> 'CandidateMatrix':
+        '''
+        Args:
+            ids (Sequence[int]): 행 순서와 같은 id
+            matrix (np.ndarray): (n, dim) 정규화되지 않은 벡터 행렬
+        '''
+        return cls(np.asarray(ids, dtype=np.int64), normalize_rows(np.array(matrix, dtype=np.float32)))
+
+    def __len__(self):
+        return self._data[0].shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        ids, matrix = self._data
+        return ids.nbytes + matrix.nbytes
+
+    def add(self, id:int, vector:np.ndarray):
+        '''
+        새 벡터를 추가합니다. (이미 있는 id면 행을 바꿈)
+        '''
+        ids, matrix = self._data
+        vector = normalize_vector(vector)
+        if not ids.shape[0]:
+            self._data = (np.array([id], dtype=np.int64), vector[np.newaxis, :])
+            return
+        keep = ids != id
+        self._data = (np.append(ids[keep], np.int64(id)), np.vstack([matrix[keep], vector]))
+
+    def search(self, source_vector:np.ndarray, top_k:int=3, exclude:Set[int]|None=None) -> list[tuple[int, float]]:
+        '''
+        제외 id를 뺀 유사도 상위 k개의 `(id, score)`를 유사도 내림차순으로 반환합니다.
+        '''
+        ids, matrix = self._data
+        if not ids.shape[0]:
+            return []
+        scores = matrix @ normalize_vector(source_vector)
+        if exclude:
+            scores[np.isin(ids, np.fromiter(exclude, dtype=np.int64))] = -np.inf
+        return [
+            (int(ids[i]), float(scores[i]))
+            for i in top_k_indices(scores, top_k)
+            if scores[i] != -np.inf
+        ]
+
+class IVFIndex:
+    '''
+    MiniBatchKMeans 중심으로 벡터를 나눈 역색인(IVF) 근사 최근접 이웃 인덱스
+    질의 벡터와 가까운 중심 `n_probe`개의 리스트만 전수 비교합니다.
+    Attributes:
+        centroids (np.ndarray): (n_lists, dim) 정규화된 중심 행렬
+        lists (list[tuple[np.ndarray, np.ndarray]]): 리스트별 (ids, 정규화된 행렬)
+    '''
+    def __init__(self, centroids:np.ndarray, lists:list[tuple[np.ndarray, np.ndarray]], n_probe:int=8):
+        self.centroids = centroids
+        self.lists = lists
+        self.n_probe = n_probe
+
+    @classmethod
+    def build(cls, ids:Sequence[int], matrix:np.ndarray, n_lists:int|None=None, n_probe:int=8, seed:int=0) -> 'IVFIndex':
+        '''
+        Args:
+            ids (Sequence[int]): 행 순서와 같은 id
+            matrix (np.ndarray): (n, dim) 정규화되지 않은 벡터 행렬
+            n_lists (int|None): 리스트(중심) 개수 (기본값: √n)
+        '''
+        from sklearn.cluster import MiniBatchKMeans
+
+        ids = np.asarray(ids, dtype=np.int64)
+        matrix = normalize_rows(np.array(matrix, dtype=np.float32))
+        n = ids.shape[0]
+        n_lists = min(n_lists or max(1, int(np.sqrt(n))), n)
+        if n_lists <= 1:
+            centroids = normalize_rows(matrix.mean(axis=0, keepdims=True)) if n else np.empty((0, matrix.shape[1]), dtype=np.float32)
+            return cls(centroids, [(ids, matrix)] if n else [], n_probe)
+
+        kmeans = MiniBatchKMeans(n_clusters=n_lists, random_state=seed, n_init=3, batch_size=1024)
+        kmeans.fit(matrix)
+        centroids = normalize_rows(kmeans.cluster_centers_.astype(np.float32))
+        assignments = np.argmax(matrix @ centroids.T, axis=1)
+        lists = [(ids[assignments == i], matrix[assignments == i]) for i in range(n_lists)]
+        return cls(centroids, lists, n_probe)
+
+    def __len__(self):
+        return sum(list_ids.shape[0] for list_ids, _ in self.lists)
+
+    def add(self, id:int, vector:np.ndarray):
+        '''
+        새 벡터를 가장 가까운 중심의 리스트에 추가합니다. (중심은 다시 학습하지 않음)
+        이미 있는 id는 벡터가 바뀌면 가까운 리스트도 달라질 수 있으므로 모든 리스트에서 먼저 뺍니다.
+        '''
+        vector = normalize_vector(vector)
+        if not len(self.centroids):
+            self.centroids = vector[np.newaxis, :].copy()
+            self.lists = [(np.array([id], dtype=np.int64), vector[np.newaxis, :])]
+            return
+        for j, (list_ids, list_matrix) in enumerate(self.lists):
+            keep = list_ids != id
+            if not keep.all():
+                self.lists[j] = (list_ids[keep], list_matrix[keep])
+        i = int(np.argmax(self.centroids @ vector))
+        list_ids, list_matrix = self.lists[i]
+        self.lists[i] = (
+            np.append(list_ids, np.int64(id)),
+            np.vstack([list_matrix, vector]),
+        )
+
+    def search(self, source_vector:np.ndarray, top_k:int=3, exclude:Set[int]|None=None) -> list[tuple[int, float]]:
+        '''
+        가까운 리스트부터 탐색해 제외 id를 뺀 유사도 상위 k개의 `(id, score)`를 반환합니다.
+        제외 후 결과가 k개보다 적으면 다음 리스트까지 넓혀 탐색합니다.
+        '''
+        if not len(self.centroids):
+            return []
+        source_vector = normalize_vector(source_vector)
+        order = np.argsort(-(self.centroids @ source_vector), kind='stable')
+        exclude_ids = np.fromiter(exclude or (), dtype=np.int64)
+        results: list[tuple[int, float]] = list()
+        probed = 0
+        while probed < len(order) and (probed < self.n_probe or len(results) < top_k):
+            list_ids, list_matrix = self.lists[order[probed]]
+            probed += 1
+            if not list_ids.shape[0]:
+                continue
+            scores = list_matrix @ source_vector
+            if exclude_ids.size:
+                scores = np.where(np.isin(list_ids, exclude_ids), -np.inf, scores)
+            results.extend(
+                (int(list_ids[i]), float(scores[i]))
+                for i in top_k_indices(scores, top_k)
+                if scores[i] != -np.inf
+            )
+        results.sort(key=lambda result: -result[1])
+        return results[:top_k]
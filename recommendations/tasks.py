@@ -0,0 +1,250 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from .indexes import proposal_ann_index, proposal_candidate_index, proposal_tfidf_index, founder_interest_index
+from .loaders import ai_models, get_recommendation_engine
+
+logger = logging.getLogger(__name__)
+
+class BackgroundTaskQueue:
+    '''
+    추천 관련 작업을 요청 경로 밖에서 처리하는 프로세스 내 백그라운드 실행기 (스레드 1개, 들어온 순서대로 처리)
+    요청은 커밋 후 작업을 넣기만 하고, 작업은 모두 저장된 벡터만 사용합니다. (FastText를 불러오지 않음)
+      - 스크랩/스크랩 취소: 창업자 취향 벡터 갱신과 스크랩 기반 추천 재계산
+      - 창업자 프로필 변경: 계산식 추천 순위 재계산
+      - 좋아요/스크랩 변경: 제안 동시 상호작용 수 갱신
+      - 제안글 생성: 임베딩 계산과 창업자 매칭 알림 (`EMBEDDING_INGESTION_ENABLED`일 때만, 웹 워커에서는 끔)
+    프로세스가 종료되어 유실된 작업은 크론(`backfill_embeddings_job`, 매일 밤 재계산)이 채웁니다.
+    '''
+    def __init__(self, max_workers:int=1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='recommendation-tasks')
+        self._pending: set[int] = set()
+        self._pending_cooccurrence: set[int] = set()
+        self._lock = threading.Lock()
+
+    def enqueue(self, proposal_ids:Iterable[int]) -> int:
+        '''
+        제안글 임베딩을 계산해 저장소와 캐시에 채웁니다. (같은 제안글이 처리 중이면 다시 넣지 않음)
+        FastText를 불러오므로 `EMBEDDING_INGESTION_ENABLED`가 켜진 프로세스에서만 실행하고,
+        꺼져 있으면 `backfill_embeddings_job` 크론이 별도 프로세스에서 계산합니다.
+        Returns:
+            enqueued (int): 새로 큐에 넣은 제안글 수
+        '''
+        if not settings.EMBEDDING_INGESTION_ENABLED:
+            return 0
+        with self._lock:
+            proposal_ids = [proposal_id for proposal_id in proposal_ids if proposal_id not in self._pending]
+            self._pending.update(proposal_ids)
+        if proposal_ids:
+            self._executor.submit(self._run, proposal_ids)
+        return len(proposal_ids)
+
+    def enqueue_taste_update(self, founder_id, proposal_id:int, delta:int):
+        '''
+        스크랩(`delta=1`)/스크랩 취소(`delta=-1`)를 창업자 취향 벡터에 반영하고 추천을 다시 계산합니다.
+        커밋 후 호출되므로 지금 시각을 변경 시각으로 넘겨, 그 뒤에 다시 만든 취향 벡터에는 중복 반영하지 않습니다.
+        '''
+        self._executor.submit(self._run_taste_update, founder_id, proposal_id, delta, timezone.now())
+
+    def enqueue_founder_match(self, proposal_id:int):
+        '''
+        새 제안글과 관심사가 맞는 창업자를 찾아 알림을 보냅니다. (같은 큐에서 임베딩 계산 뒤 처리)
+        임베딩을 크론에서 계산하는 경우(`EMBEDDING_INGESTION_ENABLED=False`)에는 크론이 계산 직후 보냅니다.
+        '''
+        if not (settings.RECOMMENDATION_MATCH_ENABLED and settings.EMBEDDING_INGESTION_ENABLED):
+            return
+        self._executor.submit(self._run_founder_match, proposal_id)
+
+    def _run_founder_match(self, proposal_id:int):
+        try:
+            notify_matching_founders(proposal_id)
+        except Exception:
+            logger.exception('창업자 매칭 알림 실패: proposal=%s', proposal_id)
+        finally:
+            close_old_connections()
+
+    def enqueue_cooccurrence_update(self, proposal_id:int):
+        '''
+        좋아요/스크랩이 바뀐 제안의 동시 상호작용 행을 현재 상호작용으로 다시 계산합니다.
+        (같은 제안이 처리 대기 중이면 다시 넣지 않음, 처리할 때 그때까지의 변경이 모두 반영됨)
+        '''
+        with self._lock:
+            if proposal_id in self._pending_cooccurrence:
+                return
+            self._pending_cooccurrence.add(proposal_id)
+        self._executor.submit(self._run_cooccurrence_update, proposal_id)
+
+    def _run_cooccurrence_update(self, proposal_id:int):
+        from .services import ProposalCooccurrenceStore
+
+        with self._lock:
+            self._pending_cooccurrence.discard(proposal_id)
+        try:
+            ProposalCooccurrenceStore().recompute(proposal_id)
+        except Exception:
+            logger.exception('제안 동시 상호작용 갱신 실패: proposal=%s', proposal_id)
+        finally:
+            close_old_connections()
+
+    def enqueue_calc_recommendation(self, founder_id):
+        '''
+        창업자의 계산식 추천 순위를 다시 계산합니다.
+        '''
+        self._executor.submit(self._run_calc_recommendation, founder_id)
+
+    def _run_calc_recommendation(self, founder_id):
+        from accounts.models import Founder
+        from .management.compute_calc_recommendations import compute_founder_calc_recommendation
+
+        try:
+            compute_founder_calc_recommendation(Founder.objects.select_related('user').get(id=founder_id))
+        except Exception:
+            logger.exception('계산식 추천 계산 실패: founder=%s', founder_id)
+        finally:
+            close_old_connections()
+
+    def _run_taste_update(self, founder_id, proposal_id:int, delta:int, event_at):
+        try:
+            update_founder_taste(founder_id, proposal_id, delta, event_at)
+        except Exception:
+            logger.exception('창업자 취향 벡터 갱신 실패: founder=%s, proposal=%s', founder_id, proposal_id)
+        finally:
+            close_old_connections()
+
+    def _run(self, proposal_ids:list[int]):
+        try:
+            ingest_proposal_embeddings(proposal_ids)
+        except Exception:
+            logger.exception('제안글 임베딩 계산 실패: %s', proposal_ids)
+        finally:
+            with self._lock:
+                self._pending.difference_update(proposal_ids)
+            close_old_connections()
+
+def ingest_proposal_embeddings(proposal_ids:Iterable[int]) -> int:
+    '''
+    제안글 벡터를 계산해 저장소와 캐시에 저장합니다. (이미 저장된 것은 다시 계산하지 않음)
+    Returns:
+        computed (int): 새로 계산한 제안글 수
+    '''
+    from proposals.models import Proposal
+    from .services import AI, ProposalEmbeddingStore, ProposalVectorLookup
+
+    if get_recommendation_engine() == 'tfidf':
+        return ingest_proposal_tfidf(proposal_ids)
+
+    fasttext_model = ai_models.fasttext
+    if fasttext_model is None or ai_models.kiwi is None:
+        raise RuntimeError('AI 모델을 불러오지 못했어요.')
+    lookup = ProposalVectorLookup(AI(fasttext_model), ProposalEmbeddingStore())
+    industries = dict(Proposal.objects.filter(id__in=list(proposal_ids)).values_list('id', 'industry'))
+    vectors, stats = lookup.get_many(industries)
+    # 이 프로세스에 이미 만들어진 후보 행렬과 ANN 인덱스에는 바로 추가
+    for proposal_id, vector in vectors.items():
+        proposal_candidate_index.add(industries[proposal_id], proposal_id, vector)
+        proposal_ann_index.add(industries[proposal_id], proposal_id, vector)
+    return stats.computed
+
+def ingest_proposal_tfidf(proposal_ids:Iterable[int]) -> int:
+    '''
+    TF-IDF 엔진에서는 이 프로세스에 이미 불러온 TF-IDF 인덱스에 새 제안글 행을 추가합니다.
+    Returns:
+        computed (int): 추가한 제안글 수
+    '''
+    from proposals.models import Proposal
+    from .services import TfidfAI
+
+    if ai_models.kiwi is None:
+        raise RuntimeError('AI 모델을 불러오지 못했어요.')
+    rows = list(Proposal.objects.filter(id__in=list(proposal_ids)).values_list('id', 'industry', 'title', 'content'))
+    if not rows:
+        return 0
+    ai = TfidfAI(proposal_tfidf_index.get())
+    proposal_tfidf_index.add(
+        [proposal_id for proposal_id, _, _, _ in rows],
+        [industry for _, industry, _, _ in rows],
+        ai.model.transform(ai.tokenize_many([' '.join([title, content]) for _, _, title, content in rows])),
+    )
+    return len(rows)
+
+def notify_matching_founders(proposal_id:int) -> int:
+    '''
+    새 제안글 벡터를 창업자 관심 벡터 행렬과 한 번의 행렬-벡터 곱으로 비교해
+    관심 업종이 같고 유사도가 높은 창업자들에게 FounderNotification을 한 번에 저장합니다.
+    Returns:
+        notified (int): 알림을 보낸 창업자 수
+    '''
+    from accounts.models import Founder
+    from notifications.models import FounderNotification
+    from proposals.models import Proposal
+    from utils.choices import NotificationCategoryChoices
+    from .services import ProposalEmbeddingStore, ProposalVectorLookup
+
+    if get_recommendation_engine() != 'fasttext':
+        return 0
+    proposal = Proposal.objects.select_related('user').get(id=proposal_id)
+    # 임베딩 계산 뒤에 호출되므로 저장된 벡터만 조회
+    vectors, _ = ProposalVectorLookup(None, ProposalEmbeddingStore()).get_many([proposal_id], compute=False)
+    if proposal_id not in vectors:
+        return 0
+
+    # 제안자 본인의 창업자 프로필은 제외
+    exclude = set(Founder.objects.filter(user_id=proposal.user.user_id).values_list('id', flat=True))
+    matches = founder_interest_index.match(
+        industry=proposal.industry,
+        vector=vectors[proposal_id],
+        top_n=settings.RECOMMENDATION_MATCH_TOP_N,
+        min_score=settings.RECOMMENDATION_MATCH_MIN_SCORE,
+        exclude=exclude,
+    )
+    title = proposal.title if len(proposal.title) <= 30 else f'{proposal.title[:29]}…'
+    FounderNotification.objects.bulk_create(
+        [
+            FounderNotification(
+                user_id=founder_id,
+                category=NotificationCategoryChoices.PROPOSAL,
+                body=f"관심사와 비슷한 새 제안 '{title}'이 올라왔어요.",
+                path_variable=str(proposal_id),
+            )
+            for founder_id, score in matches
+        ],
+        batch_size=1000,
+    )
+    logger.info('창업자 매칭 알림: proposal=%s, founders=%s', proposal_id, len(matches))
+    return len(matches)
+
+def update_founder_taste(founder_id, proposal_id:int, delta:int, event_at=None):
+    '''
+    창업자 취향 벡터에 제안 벡터를 더하거나 빼고(없으면 스크랩한 제안으로 새로 만듦),
+    벡터가 바뀌었으면 추천 결과를 다시 계산해 캐싱합니다.
+    (TF-IDF 엔진은 취향 벡터 없이 요청마다 계산하므로 아무것도 하지 않습니다.)
+    저장된 벡터만 사용하므로, 아직 임베딩이 없는 제안은 반영되지 않고 매일 밤 `rebuild`에서 반영됩니다.
+    '''
+    if get_recommendation_engine() == 'tfidf':
+        return
+    from django.http import HttpRequest
+    from accounts.models import Founder
+    from .services import RecommendationScrapService
+
+    founder = Founder.objects.select_related('user').get(id=founder_id)
+    request = HttpRequest()
+    request.user = founder.user
+    service = RecommendationScrapService(request)
+
+    vectors, _ = service.lookup.get_many([proposal_id], compute=False)
+    taste = None
+    if proposal_id in vectors:
+        taste = service.taste_store.apply(founder_id, vectors[proposal_id], delta, event_at)
+        if taste is None:
+            taste = service.taste_store.rebuild(founder, service.lookup)
+    elif service.taste_store.get(founder_id) is None:
+        taste = service.taste_store.rebuild(founder, service.lookup)
+    if taste is not None:
+        founder_interest_index.update(founder_id, service.taste_store.vector_sum(taste))
+        service.refresh_founder_scrap_recommendation(taste)
+
+background_tasks = BackgroundTaskQueue()
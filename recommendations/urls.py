@@ -7,4 +7,7 @@ urlpatterns = [
     path('proposal/calc/', ProposalCalc.as_view()),
     path('proposal/scrap-similarity', ProposalScrapSimilarity.as_view()),
     path('proposal/funding-success-similarity', ProposalFundingSuccessSimilarity.as_view()),
+    path('proposal/<int:proposal_id>/similar/<str:profile>', ProposalSimilar.as_view()),
+    path('proposal/cooccurrence', ProposalCooccurrenceSimilarity.as_view()),
+    path('models', AIModelStatus.as_view()),
 ]
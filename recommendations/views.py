@@ -1,10 +1,13 @@
 from django.http import HttpRequest
 from rest_framework import status
 from rest_framework.views import APIView
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from .services import RecommendationScrapService, RecommendationCalcService
-from rest_framework.permissions import IsAuthenticated
+from .services import RecommendationScrapService, RecommendationCalcService, RecommendationFundingSuccessService, RecommendationSimilarProposalService, RecommendationCooccurrenceService
+from .loaders import ai_models
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from django.core.exceptions import PermissionDenied
+from utils.choices import ProfileChoices
 
 class ProposalCalc(APIView):
     permission_classes = [IsAuthenticated]
@@ -29,7 +32,60 @@ class ProposalScrapSimilarity(APIView):
 
 class ProposalFundingSuccessSimilarity(APIView):
     def get(self, request:HttpRequest, format=None):
+        service = RecommendationFundingSuccessService(request)
+        data = service.recommend_founder_funding_success_proposal()
+
+        return Response(
+            data,
+            status=status.HTTP_200_OK,
+        )
+
+class ProposalCooccurrenceSimilarity(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request:HttpRequest, format=None):
+        service = RecommendationCooccurrenceService(request)
+        data = service.recommend_proposer_cooccurrence_proposal()
+
+        return Response(
+            data,
+            status=status.HTTP_200_OK,
+        )
+
+class ProposalSimilar(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request:HttpRequest, proposal_id:int, profile:str, format=None):
+        if profile not in ProfileChoices.values:
+            raise ValidationError({'profile': f'{ProfileChoices.values} 중 하나여야 해요.'})
+        service = RecommendationSimilarProposalService(request)
+        data = service.recommend_similar_proposal(proposal_id, profile)
+
         return Response(
-            '',
+            data,
             status=status.HTTP_200_OK,
         )
+
+class AIModelStatus(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request:HttpRequest, format=None):
+        return Response(
+            ai_models.status(),
+            status=status.HTTP_200_OK,
+        )
+
+    def post(self, request:HttpRequest, format=None):
+        # 불러올 모델 (기본값: 웹 요청에서 쓰는 모델, FastText는 EMBEDDING_INGESTION_ENABLED일 때만 직접 지정)
+        names = request.data.get('models') or []
+        if not isinstance(names, list):
+            raise ValidationError({'models': '모델 이름 목록이어야 해요.'})
+        # 모델 로드는 수십 초가 걸려 요청 안에서 기다리지 않고 백그라운드에서 시작만 함
+        try:
+            data = ai_models.warm_up_async(*names)
+        except ValueError as e:
+            raise ValidationError({'models': str(e)})
+        return Response(
+            data,
+            status=status.HTTP_202_ACCEPTED,
+        )
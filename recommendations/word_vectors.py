@@ -0,0 +1,150 @@
+import json
+import os
+import zlib
+import numpy as np
+
+FNV_OFFSET_BASIS = 2166136261
+FNV_PRIME = 16777619
+EXPORT_CHUNK_SIZE = 10_000
+
+def fasttext_hash(data:bytes) -> int:
+    '''
+    fastText `Dictionary::hash`와 같은 32비트 FNV-1a 해시
+    (바이트를 int8로 부호 확장한 뒤 XOR 합니다.)
+    '''
+    h = FNV_OFFSET_BASIS
+    for byte in data:
+        h ^= (byte - 256 if byte > 127 else byte) & 0xFFFFFFFF
+        h = (h * FNV_PRIME) & 0xFFFFFFFF
+    return h
+
+def fasttext_subword_hashes(word:str, minn:int, maxn:int, bucket:int) -> list[int]:
+    '''
+    fastText `Dictionary::computeSubwords`와 같은 순서로 `<word>`의 문자 n-gram 버킷 번호를 계산합니다.
+    '''
+    data = f'<{word}>'.encode('utf-8')
+    size = len(data)
+    hashes = list()
+    for i in range(size):
+        if (data[i] & 0xC0) == 0x80: # UTF-8 연속 바이트에서는 시작하지 않음
+            continue
+        j, n = i, 1
+        while j < size and n <= maxn:
+            j += 1
+            while j < size and (data[j] & 0xC0) == 0x80:
+                j += 1
+            if n >= minn and not (n == 1 and (i == 0 or j == size)):
+                hashes.append(fasttext_hash(data[i:j]) % bucket)
+            n += 1
+    return hashes
+
+def export_word_vectors(model, directory:str) -> dict:
+    '''
+    FastText 모델의 단어 벡터를 여러 프로세스가 mmap으로 공유할 수 있는 `.npy` 파일로 내보냅니다.
+      - `word_vectors.npy`: (nwords, dim) 어휘 단어별 `get_word_vector` 결과 (단어 바이트 정렬 순)
+      - `vocab_blob.npy` / `vocab_offsets.npy`: 정렬된 UTF-8 단어를 이어 붙인 바이트열과 시작 위치
+      - `ngram_vectors.npy`: (bucket, dim) 문자 n-gram 입력 벡터 (어휘에 없는 단어용)
+      - `meta.json`: dim, nwords, minn, maxn, bucket
+    Returns:
+        meta (dict)
+    '''
+    os.makedirs(directory, exist_ok=True)
+    args = model.f.getArgs()
+    dim = model.get_dimension()
+    words = sorted(model.get_words(), key=lambda word: word.encode('utf-8'))
+    encoded = [word.encode('utf-8') for word in words]
+
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(word) for word in encoded], out=offsets[1:])
+    np.save(os.path.join(directory, 'vocab_offsets.npy'), offsets)
+    np.save(os.path.join(directory, 'vocab_blob.npy'), np.frombuffer(b''.join(encoded), dtype=np.uint8))
+
+    word_vectors = np.lib.format.open_memmap(
+        os.path.join(directory, 'word_vectors.npy'), mode='w+', dtype=np.float32, shape=(len(words), dim),
+    )
+    for row, word in enumerate(words):
+        word_vectors[row] = model.get_word_vector(word)
+    word_vectors.flush()
+
+    nwords = len(model.get_words(include_freq=False))
+    bucket = args.bucket if args.maxn > 0 else 0
+    ngram_vectors = np.lib.format.open_memmap(
+        os.path.join(directory, 'ngram_vectors.npy'), mode='w+', dtype=np.float32, shape=(bucket, dim),
+    )
+    for start in range(0, bucket, EXPORT_CHUNK_SIZE):
+        stop = min(start + EXPORT_CHUNK_SIZE, bucket)
+        ngram_vectors[start:stop] = np.vstack([model.get_input_vector(nwords + i) for i in range(start, stop)])
+    ngram_vectors.flush()
+
+    meta = {'dim': dim, 'nwords': len(words), 'minn': args.minn, 'maxn': args.maxn, 'bucket': bucket}
+    with open(os.path.join(directory, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+    return meta
+
+class MmapWordVectors:
+    '''
+    `export_word_vectors`로 내보낸 파일을 `np.load(mmap_mode='r')`로 열어 단어 벡터를 제공합니다.
+    모든 워커가 OS 페이지 캐시를 공유하므로 워커 수만큼 모델 메모리가 늘지 않습니다.
+      - 어휘에 있는 단어: fastText `get_word_vector`와 같은 값
+      - 어휘에 없는 단어: 문자 n-gram 벡터의 평균 (fastText와 같은 계산, n-gram이 없으면 0 벡터)
+    '''
+    def __init__(self, directory:str):
+        with open(os.path.join(directory, 'meta.json')) as f:
+            self.meta = json.load(f)
+        self.word_vectors = np.load(os.path.join(directory, 'word_vectors.npy'), mmap_mode='r')
+        self.ngram_vectors = np.load(os.path.join(directory, 'ngram_vectors.npy'), mmap_mode='r')
+        self.vocab_blob = np.load(os.path.join(directory, 'vocab_blob.npy'), mmap_mode='r')
+        self.vocab_offsets = np.load(os.path.join(directory, 'vocab_offsets.npy'), mmap_mode='r')
+
+    def get_dimension(self) -> int:
+        return self.meta['dim']
+
+    def _word_at(self, row:int) -> bytes:
+        return self.vocab_blob[self.vocab_offsets[row]:self.vocab_offsets[row + 1]].tobytes()
+
+    def get_word_id(self, word:str) -> int:
+        '''
+        정렬된 어휘에서 이진 탐색으로 단어의 행 번호를 찾습니다. 없으면 -1
+        '''
+        target = word.encode('utf-8')
+        lo, hi = 0, self.meta['nwords']
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_at(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.meta['nwords'] and self._word_at(lo) == target:
+            return lo
+        return -1
+
+    def get_word_vector(self, word:str) -> np.ndarray:
+        row = self.get_word_id(word)
+        if row >= 0:
+            return np.array(self.word_vectors[row])
+
+        hashes = fasttext_subword_hashes(word, self.meta['minn'], self.meta['maxn'], self.meta['bucket']) if self.meta['bucket'] else []
+        if not hashes:
+            return np.zeros(self.meta['dim'], dtype=np.float32)
+        # fastText와 같은 순서로 float32 누적 후 1/n을 곱합니다.
+        vector = self.ngram_vectors[hashes].sum(axis=0, dtype=np.float32)
+        return vector * np.float32(1.0 / len(hashes))
+
+class HashingWordVectors:
+    '''
+    단어 해시로 결정되는 임의 벡터를 돌려주는 작은 대체 모델 (벤치마크/개발용)
+    FastText 파일 없이도 `get_word_vector` 인터페이스로 같은 단어에 항상 같은 벡터를 제공합니다.
+    '''
+    def __init__(self, dim:int=64):
+        self.dim = dim
+        self._vectors: dict[str, np.ndarray] = dict()
+
+    def get_dimension(self) -> int:
+        return self.dim
+
+    def get_word_vector(self, word:str) -> np.ndarray:
+        vector = self._vectors.get(word)
+        if vector is None:
+            rng = np.random.default_rng(zlib.crc32(word.encode('utf-8')))
+            vector = self._vectors[word] = rng.standard_normal(self.dim, dtype=np.float32)
+        return vector
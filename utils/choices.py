@@ -125,5 +125,6 @@ class CashReceiptIssueStatusChoices(TextChoices):
     FAILED      = 'FAILED',      '발급 실패'
 
 class NotificationCategoryChoices(TextChoices):
-    FUNDING = 'FUNDING', '펀딩'
-    REWARD  = 'REWARD',  '리워드'
+    FUNDING  = 'FUNDING',  '펀딩'
+    REWARD   = 'REWARD',   '리워드'
+    PROPOSAL = 'PROPOSAL', '제안'
@@ -4,8 +4,15 @@ class CacheKey(Enum):
     """
     애플리케이션에서 사용하는 캐시키를 정의하는 ENUM 클래스
     """
-    PROPOSAL_VECTOR = 'proposal_vector:{proposal_id}'
-    RECOMMENDED_PROPOSALS = 'recommended_proposals:{profile}:{user_id}'
+    PROPOSAL_VECTOR = 'proposal_vector:{model_name}:{proposal_id}'
+    RECOMMENDED_PROPOSALS = 'recommended_proposals:v2:{profile}:{user_id}'
+    FUNDING_SUCCESS_CENTROIDS = 'funding_success_centroids:{model_name}'
+    FUNDING_SUCCESS_RECOMMENDED_PROPOSALS = 'funding_success_recommended_proposals:{profile}:{user_id}'
+    EMBEDDING_BACKFILL_CHECKPOINT = 'embedding_backfill_checkpoint:{model_name}:{mode}'
+    EMBEDDING_BACKFILL_LOCK = 'embedding_backfill_lock:{model_name}'
+    GEOCODING = 'geocoding:{kind}:{digest}'
+    GEOCODING_STATS = 'geocoding_stats:{kind}:{stat}'
+    NAVER_MAPS_STATS = 'naver_maps_stats:{endpoint}:{stat}'
 
     def format(self, **kwargs):
         return self.value.format(**kwargs)